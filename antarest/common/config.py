@@ -1,7 +1,7 @@
 import os
-from copy import deepcopy
 from pathlib import Path
-from typing import Any, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 
@@ -9,24 +9,46 @@ from antarest.common.custom_types import JSON
 
 
 class Config:
+    """
+    Configuration compiled once into a flat map of dotted keys, so a lookup
+    is a dict hit. Sections and lists are given as read-only views shared
+    by all callers. Any key can be overridden by an environment variable,
+    ex: STORAGE_STUDIES for storage.studies.
+    """
+
     def __init__(self, data: Optional[JSON] = None):
         self.data = data or dict()
+        self._values: Dict[str, Tuple[str, Any]] = dict()
+        self._compile(Config._freeze(self.data), "")
 
     def __getitem__(self, item: str) -> Any:
         return self._get(item)
 
     def _get(self, key: str) -> Any:
-        parts = key.split(".")
-
-        env = "_".join(parts).upper()
+        env, value = self._values.get(key) or (Config._env(key), None)
         if env in os.environ:
             return os.environ[env]
-
-        data = deepcopy(self.data)
-        for p in parts:
-            if p not in data:
-                return None
-            data = data[p]
+        return value
+
+    def _compile(self, data: Any, prefix: str) -> None:
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            self._values[path] = (Config._env(path), value)
+            if isinstance(value, MappingProxyType):
+                self._compile(value, f"{path}.")
+
+    @staticmethod
+    def _env(key: str) -> str:
+        return key.replace(".", "_").upper()
+
+    @staticmethod
+    def _freeze(data: Any) -> Any:
+        if isinstance(data, dict):
+            return MappingProxyType(
+                {key: Config._freeze(value) for key, value in data.items()}
+            )
+        if isinstance(data, list):
+            return tuple(Config._freeze(value) for value in data)
         return data
 
 
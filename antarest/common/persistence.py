@@ -1,11 +1,53 @@
+import logging
 from contextlib import contextmanager
 from typing import Any, Generator
 
+from sqlalchemy import inspect  # type: ignore
+from sqlalchemy.engine import Engine  # type: ignore
+from sqlalchemy.exc import DBAPIError  # type: ignore
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
 
+logger = logging.getLogger(__name__)
+
 Base = declarative_base()
 
 
+def upgrade_db(engine: Engine) -> None:
+    """
+    Add nullable columns missing in tables created by a previous version,
+    create_all only creates missing tables. Other schema changes need the
+    database to be reset.
+    """
+    preparer = engine.dialect.identifier_preparer
+    inspector = inspect(engine)
+    tables = set(inspector.get_table_names())
+    for name, table in Base.metadata.tables.items():
+        if name not in tables:
+            continue
+        existing = {column["name"] for column in inspector.get_columns(name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            if not column.nullable:
+                raise ValueError(
+                    f"Column {name}.{column.name} can't be added, "
+                    "database should be reset"
+                )
+            logger.info(f"Add column {column.name} to table {name}")
+            try:
+                with engine.begin() as connection:
+                    connection.execute(
+                        f"ALTER TABLE {preparer.quote(name)} ADD COLUMN "
+                        f"{preparer.quote(column.name)} "
+                        f"{column.type.compile(dialect=engine.dialect)}"
+                    )
+            except DBAPIError:
+                # added meanwhile by another server process
+                columns = inspect(engine).get_columns(name)
+                if column.name not in {c["name"] for c in columns}:
+                    raise
+
+
 class DTO:
     """
     Implement basic method for DTO objects
@@ -1,6 +1,6 @@
-from typing import Optional
+from typing import Dict, Optional
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from antarest.login.model import User
 
@@ -8,3 +8,7 @@ from antarest.login.model import User
 @dataclass
 class RequestParameters:
     user: Optional[User] = None
+    # study permissions already checked during request, by study id
+    permissions: Dict[str, bool] = field(
+        default_factory=dict, compare=False, repr=False
+    )
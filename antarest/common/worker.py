@@ -0,0 +1,56 @@
+import os
+import socket
+from pathlib import Path
+from typing import Dict, Optional
+from uuid import uuid4
+
+_boot_tokens: Dict[int, str] = {}
+
+
+def boot_token() -> str:
+    """
+    Random token of current process, new in each started or forked process.
+    """
+    return _boot_tokens.setdefault(os.getpid(), str(uuid4()))
+
+
+def process_start(pid: int) -> str:
+    """
+    Boot id and start time of process, empty if they can't be read (process
+    gone or system without /proc).
+    """
+    try:
+        boot_id = Path("/proc/sys/kernel/random/boot_id").read_text()
+        stat = Path(f"/proc/{pid}/stat").read_text()
+    except OSError:
+        return ""
+    # fields after command name, which may hold spaces: starttime is 22nd
+    start = stat[stat.rindex(")") + 2 :].split()[19]
+    return f"{boot_id.strip()}/{start}"
+
+
+def worker() -> str:
+    """
+    Current process as host:pid:start:token, saved with work it queues in memory.
+    """
+    pid = os.getpid()
+    return f"{socket.gethostname()}:{pid}:{process_start(pid)}:{boot_token()}"
+
+
+def is_running(worker: Optional[str]) -> bool:
+    """
+    Tell if process described by worker() still runs. Pids are reused (a
+    container restarted runs pid 1 again), so another process is only known
+    to run if it has same start on same host.
+    """
+    parts = (worker or "").split(":")
+    if len(parts) != 4:
+        return False
+    host, pid, start, token = parts
+    if token == boot_token():
+        return True
+    return (
+        bool(start)
+        and host == socket.gethostname()
+        and start == process_start(int(pid))
+    )
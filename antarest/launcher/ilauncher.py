@@ -12,9 +12,19 @@ class ILauncher(ABC):
         self.config = config
 
     @abstractmethod
-    def run_study(self, study_path: Path, version: str) -> UUID:
-        pass
+    def run_study(
+        self, study_path: Path, version: str, job_id: UUID, priority: int = 0
+    ) -> UUID:
+        """
+        Queue study run as job job_id, already saved as pending.
+        """
 
     @abstractmethod
     def add_callback(self, callback: Callable[[JobResult], None]) -> None:
         pass
+
+    @abstractmethod
+    def get_log(self, job_id: UUID, offset: int = 0) -> bytes:
+        """
+        Solver output of job from offset, as much as available.
+        """
@@ -1,12 +1,14 @@
+import os
 import subprocess
-import threading
+import tempfile
 from pathlib import Path
 from typing import Callable, List, Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from antarest.common.config import Config
 from antarest.launcher.ilauncher import ILauncher
 from antarest.launcher.model import JobResult, JobStatus
+from antarest.launcher.scheduler import JobScheduler
 
 
 class StudyVersionNotSupported(Exception):
@@ -14,22 +16,74 @@ class StudyVersionNotSupported(Exception):
 
 
 class LocalLauncher(ILauncher):
+    """
+    Run solver on this host. Solver output is written to a log file per
+    job, only its end is kept as job message.
+    """
+
+    LOG_CHUNK_SIZE = 1024 * 1024
+    MSG_SIZE = 4096
+
     def __init__(self, config: Config) -> None:
         super().__init__(config)
         self.callbacks: List[Callable[[JobResult], None]] = []
+        self.log_dir = Path(
+            config["launcher.local.logs"]
+            or Path(tempfile.gettempdir()) / "antarest" / "logs"
+        )
+        slots = config["launcher.local.slots"]
+        # solver processes beyond cpu count only slow each other down
+        self.scheduler = JobScheduler(
+            int(slots) if slots else os.cpu_count() or 1
+        )
 
-    def run_study(self, study_path: Path, version: str) -> UUID:
+    def run_study(
+        self, study_path: Path, version: str, job_id: UUID, priority: int = 0
+    ) -> UUID:
         antares_solver_path = self.config[f"launcher.local.binaries.{version}"]
         if antares_solver_path is None:
             raise StudyVersionNotSupported()
         else:
-            uuid = uuid4()
-            job = threading.Thread(
-                target=LocalLauncher._compute,
-                args=(self, antares_solver_path, study_path, uuid),
+            self.scheduler.submit(
+                job_id,
+                lambda: self._start(antares_solver_path, study_path, job_id),
+                priority,
+            )
+            return job_id
+
+    def _start(
+        self, antares_solver_path: Path, study_path: Path, uuid: UUID
+    ) -> None:
+        running = JobResult(id=str(uuid), job_status=JobStatus.RUNNING)
+        for callback in self.callbacks:
+            callback(running)
+        try:
+            self._compute(antares_solver_path, study_path, uuid)
+        except Exception as e:
+            failed = JobResult(
+                id=str(uuid), job_status=JobStatus.FAILED, msg=str(e)
             )
-            job.start()
-            return uuid
+            for callback in self.callbacks:
+                callback(failed)
+            raise
+
+    def get_log(self, job_id: UUID, offset: int = 0) -> bytes:
+        path = self._log_path(job_id)
+        if not path.exists():
+            return b""
+        with path.open("rb") as log:
+            log.seek(offset)
+            return log.read(self.LOG_CHUNK_SIZE)
+
+    def _log_path(self, uuid: UUID) -> Path:
+        return self.log_dir / f"{uuid}.log"
+
+    def _summary(self, uuid: UUID) -> str:
+        with self._log_path(uuid).open("rb") as log:
+            size = log.seek(0, os.SEEK_END)
+            log.seek(max(0, size - self.MSG_SIZE))
+            tail = log.read().decode("latin-1").rstrip()
+        return tail if size <= self.MSG_SIZE else f"...{tail}"
 
     def _callback(self, process: Any, uuid: UUID) -> None:
         if process.returncode == 0:
@@ -40,7 +94,7 @@ class LocalLauncher(ILauncher):
         result = JobResult(
             id=str(uuid),
             job_status=execution_status,
-            msg=process.stdout.decode("latin-1").rstrip(),
+            msg=self._summary(uuid),
             exit_code=process.returncode,
         )
         for callback in self.callbacks:
@@ -49,11 +103,13 @@ class LocalLauncher(ILauncher):
     def _compute(
         self, antares_solver_path: Path, study_path: Path, uuid: UUID
     ) -> None:
-        process = subprocess.run(
-            [antares_solver_path, study_path],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-        )
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        with self._log_path(uuid).open("wb") as log:
+            process = subprocess.run(
+                [antares_solver_path, study_path],
+                stdout=log,
+                stderr=subprocess.STDOUT,
+            )
 
         self._callback(process, uuid)
 
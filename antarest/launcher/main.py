@@ -25,6 +25,7 @@ def build_launcher(
             storage_service=service_storage,
             repository=repository,
         )
+        service_launcher.fail_interrupted_jobs()
 
     if service_launcher:
         application.register_blueprint(
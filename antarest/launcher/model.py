@@ -24,6 +24,8 @@ class JobResult(DTO, Base):  # type: ignore
     completion_date = Column(DateTime)
     msg = Column(String())
     exit_code = Column(Integer)
+    # process whose queue holds job, see common.worker.worker()
+    worker = Column(String(255))
 
     def to_dict(self) -> JSON:
         return {
@@ -3,7 +3,7 @@ from typing import Optional, List
 from sqlalchemy import exists  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 
-from antarest.launcher.model import JobResult
+from antarest.launcher.model import JobResult, JobStatus
 
 
 class JobResultRepository:
@@ -38,6 +38,14 @@ class JobResultRepository:
         )
         return job
 
+    def find_by_status(self, *statuses: JobStatus) -> List[JobResult]:
+        jobs: List[JobResult] = (
+            self.session.query(JobResult)
+            .filter(JobResult.job_status.in_(statuses))
+            .all()
+        )
+        return jobs
+
     def delete(self, id: str) -> None:
         g = self.session.query(JobResult).get(id)
         self.session.delete(g)
@@ -0,0 +1,54 @@
+import heapq
+import itertools
+import logging
+import threading
+from typing import Callable, List, Tuple
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+Entry = Tuple[int, int, UUID, Callable[[], None]]
+
+
+class JobScheduler:
+    """
+    Run jobs on a fixed number of slots. Waiting jobs are started by
+    priority (highest first), then in submission order.
+    """
+
+    def __init__(self, slots: int):
+        self.slots = max(1, slots)
+        self._queue: List[Entry] = []
+        self._order = itertools.count()
+        self._running = 0
+        self._lock = threading.Lock()
+
+    def submit(
+        self, job_id: UUID, run: Callable[[], None], priority: int = 0
+    ) -> None:
+        with self._lock:
+            heapq.heappush(
+                self._queue, (-priority, next(self._order), job_id, run)
+            )
+        self._dispatch()
+
+    def pending(self) -> List[UUID]:
+        with self._lock:
+            return [job_id for _, _, job_id, _ in sorted(self._queue)]
+
+    def _dispatch(self) -> None:
+        with self._lock:
+            while self._running < self.slots and self._queue:
+                *_, job_id, run = heapq.heappop(self._queue)
+                self._running += 1
+                threading.Thread(target=self._run, args=(job_id, run)).start()
+
+    def _run(self, job_id: UUID, run: Callable[[], None]) -> None:
+        try:
+            run()
+        except Exception:
+            logger.exception(f"Job {job_id} failed")
+        finally:
+            with self._lock:
+                self._running -= 1
+            self._dispatch()
@@ -1,8 +1,11 @@
 from datetime import datetime
 from typing import List, Optional
-from uuid import UUID
+from uuid import UUID, uuid4
+
+from werkzeug.exceptions import NotFound
 
 from antarest.common.config import Config
+from antarest.common.worker import is_running, worker
 from antarest.launcher.factory_launcher import FactoryLauncher
 from antarest.launcher.model import JobResult, JobStatus
 from antarest.launcher.repository import JobResultRepository
@@ -12,7 +15,7 @@ from antarest.common.requests import (
 from antarest.storage.service import StorageService
 
 
-class JobNotFound(Exception):
+class JobNotFound(NotFound):
     pass
 
 
@@ -31,24 +34,60 @@ class LauncherService:
         self.launcher.add_callback(self.update)
 
     def update(self, job_result: JobResult) -> None:
+        if job_result.job_status not in (JobStatus.SUCCESS, JobStatus.FAILED):
+            self.repository.save(job_result)
+            return
+
         job_result.completion_date = datetime.utcnow()
         self.repository.save(job_result)
+        if job_result.exit_code is None:
+            return  # solver never ran, output is untouched
+        # solver has completed its output in place
+        job = self.repository.get(job_result.id)
+        if job and job.study_id:
+            self.storage_service.refresh_outputs(job.study_id)
+
+    def fail_interrupted_jobs(self) -> None:
+        """
+        Jobs are queued in memory of the process which received them. Fail
+        pending or running jobs of processes not known to be running.
+        """
+        for job in self.repository.find_by_status(
+            JobStatus.PENDING, JobStatus.RUNNING
+        ):
+            if is_running(job.worker):
+                continue
+            job.job_status = JobStatus.FAILED
+            job.msg = "Job interrupted by server restart"
+            self.update(job)
 
-    def run_study(self, study_uuid: str, params: RequestParameters) -> UUID:
+    def run_study(
+        self, study_uuid: str, params: RequestParameters, priority: int = 0
+    ) -> UUID:
         study_info = self.storage_service.get_study_information(
             uuid=study_uuid, params=params
         )
         study_version = study_info["antares"]["version"]
         study_path = self.storage_service.get_study_path(study_uuid, params)
-        job_uuid: UUID = self.launcher.run_study(study_path, study_version)
 
-        self.repository.save(
-            JobResult(
-                id=str(job_uuid),
-                study_id=study_uuid,
-                job_status=JobStatus.RUNNING,
-            )
+        # saved before queuing, so job is known when it starts
+        job_uuid = uuid4()
+        job = JobResult(
+            id=str(job_uuid),
+            study_id=study_uuid,
+            job_status=JobStatus.PENDING,
+            worker=worker(),
         )
+        self.repository.save(job)
+        try:
+            self.launcher.run_study(
+                study_path, study_version, job_uuid, priority
+            )
+        except Exception as e:
+            job.job_status = JobStatus.FAILED
+            job.msg = str(e)
+            self.update(job)
+            raise
 
         return job_uuid
 
@@ -59,6 +98,10 @@ class LauncherService:
 
         raise JobNotFound()
 
+    def get_log(self, job_uuid: UUID, offset: int = 0) -> bytes:
+        self.get_result(job_uuid)
+        return self.launcher.get_log(job_uuid, offset)
+
     def get_jobs(self, study_uid: Optional[str] = None) -> List[JobResult]:
         if study_uid is not None:
             job_results = self.repository.find_by_study(study_uid)
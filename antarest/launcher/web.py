@@ -1,7 +1,8 @@
 from typing import Any, Optional
 from uuid import UUID
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
+from werkzeug.exceptions import BadRequest
 
 from antarest.login.auth import Auth
 from antarest.common.config import Config
@@ -43,6 +44,14 @@ def create_launcher_api(service: LauncherService, config: Config) -> Blueprint:
           description: study id
           schema:
             type: string
+        - in: query
+          name: priority
+          required: false
+          description: jobs waiting for a solver slot start by highest
+            priority, then in order of submission
+          schema:
+            type: integer
+            default: 0
         definitions:
             - schema:
                 id: RunInfo
@@ -52,8 +61,15 @@ def create_launcher_api(service: LauncherService, config: Config) -> Blueprint:
         tags:
           - Run Studies
         """
+        try:
+            priority = int(request.args.get("priority", 0))
+        except ValueError:
+            raise BadRequest("priority should be an integer")
+
         params = RequestParameters(user=Auth.get_current_user())
-        return jsonify({"job_id": service.run_study(study_id, params)})
+        return jsonify(
+            {"job_id": service.run_study(study_id, params, priority)}
+        )
 
     @bp.route("/launcher/jobs", methods=["GET"])
     @auth.protected()
@@ -159,4 +175,53 @@ def create_launcher_api(service: LauncherService, config: Config) -> Blueprint:
         """
         return jsonify(service.get_result(job_id).to_dict())
 
+    @bp.route("/launcher/jobs/<uuid:job_id>/logs", methods=["GET"])
+    @auth.protected()
+    def get_log(job_id: UUID) -> Any:
+        """
+        Read solver output of job, from offset. Output of a running job is
+        followed by asking again from offset given in X-Next-Offset header
+        ---
+        responses:
+          '200':
+            content:
+              text/plain: {}
+            description: Output available from offset (may be empty)
+          '400':
+            description: Invalid request
+          '401':
+            description: Unauthenticated User
+          '404':
+            description: Job not found
+        parameters:
+        - in: path
+          name: job_id
+          required: true
+          description: job id
+          schema:
+            type: string
+        - in: query
+          name: offset
+          required: false
+          description: bytes of output already read
+          schema:
+            type: integer
+            default: 0
+        tags:
+          - Run Studies
+        """
+        try:
+            offset = int(request.args.get("offset", 0))
+        except ValueError:
+            raise BadRequest("offset should be an integer")
+        if offset < 0:
+            raise BadRequest("offset should be positive")
+
+        log = service.get_log(job_id, offset)
+        return Response(
+            log,
+            mimetype="text/plain",
+            headers={"X-Next-Offset": str(offset + len(log))},
+        )
+
     return bp
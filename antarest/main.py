@@ -14,7 +14,7 @@ from werkzeug.exceptions import HTTPException
 from antarest import __version__
 from antarest.login.auth import Auth
 from antarest.common.config import ConfigYaml, Config
-from antarest.common.persistence import Base
+from antarest.common.persistence import Base, upgrade_db
 from antarest.common.reverse_proxy import ReverseProxyMiddleware
 from antarest.common.swagger import build_swagger
 from antarest.launcher.main import build_launcher
@@ -99,6 +99,7 @@ def flask_app(config_file: Path) -> Flask:
     # Database
     engine = create_engine(config["db.url"], echo=config["debug"])
     Base.metadata.create_all(engine)
+    upgrade_db(engine)
     db_session = scoped_session(
         sessionmaker(autocommit=False, autoflush=False, bind=engine)
     )
@@ -1,5 +1,5 @@
-from io import BytesIO
 from pathlib import Path
+from typing import Iterator
 
 from antarest.storage.business.study_service import StudyService
 from antarest.storage.repository.antares_io.exporter.export_file import (
@@ -22,8 +22,12 @@ class ExporterService:
         self.exporter = exporter
 
     def export_study(
-        self, name: str, compact: bool = False, outputs: bool = True
-    ) -> BytesIO:
+        self,
+        name: str,
+        compact: bool = False,
+        outputs: bool = True,
+        level: int = Exporter.DEFAULT_LEVEL,
+    ) -> Iterator[bytes]:
         path_study = self.path_to_studies / name
 
         self.study_service.check_study_exist(name)
@@ -37,8 +41,6 @@ class ExporterService:
                 config.outputs = dict()
                 study = self.study_factory.create_from_config(config)
 
-            data = study.get()
-            del study
-            return self.exporter.export_compact(path_study, data)
+            return self.exporter.export_compact(path_study, study, level)
         else:
-            return self.exporter.export_file(path_study, outputs)
+            return self.exporter.export_file(path_study, outputs, level)
@@ -4,13 +4,17 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
-from typing import IO
+from typing import IO, Optional
 from uuid import uuid4
 
 from antarest.common.custom_types import JSON
 from antarest.storage.business.storage_service_utils import StorageServiceUtils
 from antarest.storage.business.study_service import StudyService
 from antarest.storage.repository.antares_io.reader import IniReader
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
+from antarest.storage.repository.filesystem.config.files import (
+    OutputRegistry,
+)
 from antarest.storage.repository.filesystem.factory import StudyFactory
 from antarest.storage.web.exceptions import (
     BadOutputError,
@@ -41,10 +45,14 @@ class ImporterService:
 
         path_matrix = self.path_to_studies / relative_path_matrix
 
-        path_matrix.write_bytes(data)
+        # replace file, matrices may be hardlinked by study copies
+        with atomic_write(path_matrix, "wb") as file:
+            file.write(data)
 
-    def import_study(self, stream: IO[bytes]) -> str:
-        uuid = StorageServiceUtils.generate_uuid()
+    def import_study(
+        self, stream: IO[bytes], uuid: Optional[str] = None
+    ) -> str:
+        uuid = uuid or StorageServiceUtils.generate_uuid()
         path_study = Path(self.path_to_studies) / uuid
         path_study.mkdir()
 
@@ -73,8 +81,10 @@ class ImporterService:
                 raise StudyValidationError("Fail to import study")
         except Exception as e:
             shutil.rmtree(path_study)
+            self.study_service.registry.remove(uuid)
             raise e
 
+        self.study_service.registry.add(uuid)
         return uuid
 
     def import_output(self, uuid: str, stream: IO[bytes]) -> JSON:
@@ -102,6 +112,7 @@ class ImporterService:
 
         output_name = f"{date}{mode}{name}"
         path_output.rename(Path(path_output.parent, output_name))
+        OutputRegistry(Path(self.path_to_studies) / uuid).update(output_name)
 
         output_id = (
             sorted(os.listdir(path_output.parent)).index(output_name) + 1
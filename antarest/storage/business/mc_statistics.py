@@ -0,0 +1,111 @@
+import threading
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    Matrix,
+    MatrixQuery,
+    MatrixReader,
+)
+from antarest.storage.repository.filesystem.fanout import fanout
+
+
+class McStatistics:
+    """
+    Distribution over Monte-Carlo years of one column of mc-ind output
+    files. Years are read in parallel and stacked in a (years, timesteps)
+    array reduced per timestep. Outputs are not modified once written, so
+    results are kept in a small LRU as long as their files are unchanged.
+    """
+
+    CACHE_SIZE = 128
+
+    def __init__(
+        self,
+        matrix_reader: Optional[MatrixReader] = None,
+        cache_size: int = CACHE_SIZE,
+    ):
+        self.matrix_reader = matrix_reader or MatrixReader()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Any, JSON]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compute(
+        self, paths: List[Path], column: str, percentiles: List[float]
+    ) -> JSON:
+        if not paths:
+            raise ValueError("no year to aggregate")
+        if any(not 0 <= q <= 100 for q in percentiles):
+            raise ValueError("percentiles should be between 0 and 100")
+
+        key = (
+            tuple(paths),
+            column,
+            tuple(percentiles),
+            McStatistics._version(paths),
+        )
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                return self._cache[key]
+
+        years = fanout.map(lambda path: self._read(path, column), paths)
+        if len({matrix.data.shape for matrix in years}) > 1:
+            raise ValueError("years don't have the same number of rows")
+        values = np.stack([matrix.data[:, 0] for matrix in years])
+
+        with warnings.catch_warnings():
+            # timesteps with only N/A values give nan
+            warnings.simplefilter("ignore", RuntimeWarning)
+            stats = {
+                "mean": np.nanmean(values, axis=0),
+                "std": np.nanstd(values, axis=0),
+                "min": np.nanmin(values, axis=0),
+                "max": np.nanmax(values, axis=0),
+            }
+            quantiles = (
+                np.nanpercentile(values, percentiles, axis=0)
+                if percentiles
+                else []
+            )
+
+        first = years[0]
+        result: JSON = {
+            "column": column,
+            "unit": first.units[0] if first.units else None,
+            "years": len(years),
+            "index_names": first.index_names,
+            "index": first.index,
+            **{name: McStatistics._list(stat) for name, stat in stats.items()},
+            "percentiles": {
+                f"{q:g}": McStatistics._list(quantile)
+                for q, quantile in zip(percentiles, quantiles)
+            },
+        }
+
+        with self._lock:
+            self._cache[key] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _read(self, path: Path, column: str) -> Matrix:
+        matrix = self.matrix_reader.query(path, MatrixQuery(columns=[column]))
+        if matrix.data.shape[1] != 1:
+            raise ValueError(f"column {column} is not unique in {path.name}")
+        return matrix
+
+    @staticmethod
+    def _version(paths: List[Path]) -> Tuple[Tuple[int, int], ...]:
+        # an output replaced by another one of same name has new files
+        stats = [path.stat() for path in (paths[0], paths[-1])]
+        return tuple((st.st_mtime_ns, st.st_size) for st in stats)
+
+    @staticmethod
+    def _list(values: np.ndarray) -> List[Optional[float]]:
+        return [None if v != v else v for v in values.tolist()]
@@ -1,32 +1,64 @@
-import copy
 import shutil
 from pathlib import Path
-from typing import List, Tuple
+from typing import Any, Iterator, List, Optional, Tuple
 from zipfile import ZipFile
 
 from antarest.common.custom_types import JSON
+from antarest.storage.business.mc_statistics import McStatistics
 from antarest.storage.business.storage_service_utils import StorageServiceUtils
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    Matrix,
+    MatrixQuery,
+    MatrixQueryError,
+    MatrixReader,
+)
+from antarest.storage.repository.antares_io.writer.clone import TreeCloner
+from antarest.storage.repository.filesystem.config.files import (
+    OUTPUT_REGISTRY,
+    OutputRegistry,
+)
 from antarest.storage.repository.filesystem.config.model import StudyConfig
+from antarest.storage.repository.filesystem import json_stream
 from antarest.storage.repository.filesystem.factory import StudyFactory
+from antarest.storage.repository.filesystem.folder_node import (
+    ChildNotFoundError,
+)
+from antarest.storage.repository.filesystem.inode import INode
+from antarest.storage.repository.filesystem.raw_file_node import RawFileNode
+from antarest.storage.repository.filesystem.registry import StudyRegistry
+from antarest.storage.repository.filesystem.validator import check_tree
 from antarest.common.requests import (
     RequestParameters,
 )
 from antarest.storage.web.exceptions import (
+    BadMatrixQueryError,
     StudyNotFoundError,
     StudyAlreadyExistError,
+    MatrixFormatError,
+    IncorrectPathError,
 )
 
 
 class StudyService:
+    STREAM_CHUNK_SIZE = 64 * 1024
+
     def __init__(
         self,
         path_to_studies: Path,
         study_factory: StudyFactory,
         path_resources: Path,
+        matrix_reader: Optional[MatrixReader] = None,
+        registry: Optional[StudyRegistry] = None,
+        cloner: Optional[TreeCloner] = None,
+        mc_statistics: Optional[McStatistics] = None,
     ):
         self.path_to_studies: Path = path_to_studies
         self.study_factory: StudyFactory = study_factory
         self.path_resources: Path = path_resources
+        self.matrix_reader = matrix_reader or MatrixReader()
+        self.registry = registry or StudyRegistry(path_to_studies)
+        self.cloner = cloner or TreeCloner()
+        self.mc_statistics = mc_statistics or McStatistics(self.matrix_reader)
 
     def extract_info_from_url(self, route: str) -> Tuple[str, str, Path]:
         route_parts = route.split("/")
@@ -45,7 +77,7 @@ class StudyService:
     def check_errors(self, uuid: str) -> List[str]:
         path = self.get_study_path(uuid)
         _, study = self.study_factory.create_from_fs(path)
-        return study.check_errors(study.get())
+        return check_tree(study)
 
     def assert_study_not_exist(self, uuid: str) -> None:
         if self.is_study_existing(uuid):
@@ -54,16 +86,10 @@ class StudyService:
             )
 
     def is_study_existing(self, uuid: str) -> bool:
-        return uuid in self.get_study_uuids()
+        return self.registry.contains(uuid)
 
     def get_study_uuids(self) -> List[str]:
-        studies_list = [
-            path.name
-            for path in self.path_to_studies.iterdir()
-            if (path / "study.antares").is_file()
-        ]
-        # sorting needed for test
-        return sorted(studies_list)
+        return self.registry.uuids()
 
     def get(self, route: str, depth: int) -> JSON:
         uuid, url, study_path = self.extract_info_from_url(route)
@@ -76,11 +102,116 @@ class StudyService:
         del study
         return data
 
+    def get_stream(
+        self, route: str, depth: int, lines: bool = False
+    ) -> Iterator[bytes]:
+        """
+        Same content as get, as JSON (or NDJSON when lines is set) chunks
+        serialized while walking study tree.
+        """
+        uuid, url, study_path = self.extract_info_from_url(route)
+        self.check_study_exist(uuid)
+
+        _, study = self.study_factory.create_from_fs(study_path)
+        parts = [item for item in url.split("/") if item]
+        node, parts = json_stream.resolve(study, parts)
+
+        if lines:
+            fragments = json_stream.encode_lines(node, parts, depth)
+        else:
+            fragments = json_stream.encode(node, parts, depth)
+        return json_stream.join(fragments, StudyService.STREAM_CHUNK_SIZE)
+
+    def get_matrix(
+        self, route: str, query: Optional[MatrixQuery] = None
+    ) -> Matrix:
+        uuid, url, study_path = self.extract_info_from_url(route)
+        self.check_study_exist(uuid)
+
+        _, study = self.study_factory.create_from_fs(study_path)
+        parts = [item for item in url.split("/") if item]
+        path = self._matrix_path(study, parts, route)
+        try:
+            if query is None:
+                return self.matrix_reader.read(path)
+            return self.matrix_reader.query(path, query)
+        except FileNotFoundError:
+            raise IncorrectPathError(f"{route} not found")
+        except MatrixQueryError as e:
+            raise BadMatrixQueryError(f"{route}: {e}")
+        except ValueError as e:
+            raise MatrixFormatError(f"{route} is not a matrix: {e}")
+
+    def _matrix_path(
+        self, study: INode[Any, Any, Any], url: List[str], route: str
+    ) -> Path:
+        # folders are only looked at one level deep to be rejected
+        node, url = json_stream.resolve(study, url)
+        if not url and isinstance(node, RawFileNode):
+            return node.config.path
+        data = node.get(url, depth=1)
+        if not isinstance(data, str) or not data.startswith("file/"):
+            raise MatrixFormatError(f"{route} is not a matrix")
+        return self.path_to_studies / data[len("file/") :]
+
+    def get_mc_statistics(
+        self,
+        uuid: str,
+        output_id: str,
+        item: str,
+        column: str,
+        percentiles: List[float],
+    ) -> JSON:
+        """
+        Statistics over all Monte-Carlo years of output for column of
+        item, a values file of a year (ex: areas/de/values-hourly).
+        """
+        self.check_study_exist(uuid)
+        config, study = self.study_factory.create_from_fs(
+            self.get_study_path(uuid)
+        )
+        simulation = config.outputs.get(
+            int(output_id) if output_id.isdigit() else -1
+        )
+        if simulation is None or not simulation.by_year:
+            raise IncorrectPathError(
+                f"{uuid}/output/{output_id} has no mc-ind results"
+            )
+
+        url = ["output", output_id, simulation.mode, "mc-ind"]
+        parts = [part for part in item.split("/") if part]
+
+        def locate(year: int) -> Path:
+            try:
+                return self._matrix_path(
+                    study, url + [f"{year:05d}", *parts], item
+                )
+            except (ChildNotFoundError, KeyError):
+                raise IncorrectPathError(f"{item} not found")
+
+        paths = [locate(year) for year in range(1, simulation.nbyears + 1)]
+        try:
+            return self.mc_statistics.compute(paths, column, percentiles)
+        except FileNotFoundError:
+            raise IncorrectPathError(f"{item} not found")
+        except MatrixQueryError as e:
+            raise BadMatrixQueryError(f"{item}: {e}")
+        except ValueError as e:
+            raise MatrixFormatError(f"{item}: {e}")
+
     def get_study_information(self, uuid: str) -> JSON:
         config = StudyConfig(study_path=self.path_to_studies / uuid)
         study = self.study_factory.create_from_config(config)
         return study.get(url=["study"])
 
+    def get_study_info_mtime(self, uuid: str) -> Optional[float]:
+        try:
+            return (
+                (self.get_study_path(uuid) / "study.antares").stat().st_mtime
+            )
+        except OSError:
+            return None
+
     def get_studies_information(self) -> JSON:
         return {
             uuid: self.get_study_information(uuid)
@@ -90,16 +221,17 @@ class StudyService:
     def get_study_path(self, uuid: str) -> Path:
         return self.path_to_studies / uuid
 
-    def create_study(self, study_name: str) -> str:
+    def create_study(self, study_name: str, uuid: Optional[str] = None) -> str:
         empty_study_zip = self.path_resources / "empty-study.zip"
 
-        uuid = StorageServiceUtils.generate_uuid()
+        uuid = uuid or StorageServiceUtils.generate_uuid()
 
         path_study = self.get_study_path(uuid)
         path_study.mkdir()
 
         with ZipFile(empty_study_zip) as zip_output:
             zip_output.extractall(path=path_study)
+        self.registry.add(uuid)
 
         study_data = self.get(uuid, 10)
         StorageServiceUtils.update_antares_info(study_name, study_data)
@@ -109,38 +241,54 @@ class StudyService:
 
         return uuid
 
-    def copy_study(self, src_uuid: str, dest_study_name: str) -> str:
+    def copy_study(
+        self,
+        src_uuid: str,
+        dest_study_name: str,
+        dest_uuid: Optional[str] = None,
+    ) -> str:
         uuid, url, study_path = self.extract_info_from_url(src_uuid)
         self.check_study_exist(uuid)
 
-        config, study = self.study_factory.create_from_fs(study_path)
-        data_source = study.get()
-        del study
-
-        uuid = StorageServiceUtils.generate_uuid()
-        config.path = self.get_study_path(uuid)
-        data_destination = copy.deepcopy(data_source)
+        uuid = dest_uuid or StorageServiceUtils.generate_uuid()
+        path_study = self.get_study_path(uuid)
+        self.cloner.clone(
+            study_path,
+            path_study,
+            exclude={"output", OUTPUT_REGISTRY},
+            can_link=StudyService._is_matrix,
+        )
 
+        # only study.antares differs from source study
+        _, study = self.study_factory.create_from_fs(path_study)
+        info = study.get(["study"])
         StorageServiceUtils.update_antares_info(
-            dest_study_name, data_destination
+            dest_study_name, {"study": info}
         )
-        if "output" in data_destination:
-            del data_destination["output"]
-        config.outputs = {}
-
-        study = self.study_factory.create_from_config(config)
-        study.save(data_destination)
+        study.save(info, ["study"])
         del study
+        self.registry.add(uuid)
         return uuid
 
+    @staticmethod
+    def _is_matrix(path: Path) -> bool:
+        # matrices are replaced on write, never modified in place
+        return path.parts[0] == "input" and path.suffix == ".txt"
+
     def delete_study(self, name: str) -> None:
         self.check_study_exist(name)
         study_path = self.get_study_path(name)
         shutil.rmtree(study_path)
+        self.registry.remove(name)
+        self.study_factory.invalidate(study_path)
 
     def delete_output(self, uuid: str, output_name: str) -> None:
         output_path = self.path_to_studies / uuid / "output" / output_name
         shutil.rmtree(output_path, ignore_errors=True)
+        OutputRegistry(self.path_to_studies / uuid).remove(output_name)
+
+    def refresh_outputs(self, uuid: str) -> None:
+        OutputRegistry(self.get_study_path(uuid)).refresh()
 
     def edit_study(self, route: str, new: JSON) -> JSON:
         # Get data
@@ -0,0 +1,51 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TaskRunner:
+    """
+    Bounded thread pool running long operations (ex: study imports) out of
+    web requests. Teardown is called in worker thread after each task, ex:
+    to release its thread local db session. With no workers, tasks are run
+    on submit in caller thread, without teardown.
+    """
+
+    DEFAULT_WORKERS = 2
+
+    def __init__(
+        self,
+        workers: int = DEFAULT_WORKERS,
+        teardown: Optional[Callable[[], None]] = None,
+    ):
+        self.workers = workers
+        self.teardown = teardown
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def submit(self, function: Callable[..., None], *args: Any) -> None:
+        if self.workers <= 0:
+            self._run(function, *args)
+            return
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers)
+            pool = self._pool
+        pool.submit(self._work, function, *args)
+
+    def _work(self, function: Callable[..., None], *args: Any) -> None:
+        try:
+            self._run(function, *args)
+        finally:
+            if self.teardown:
+                self.teardown()
+
+    @staticmethod
+    def _run(function: Callable[..., None], *args: Any) -> None:
+        try:
+            function(*args)
+        except Exception:
+            logger.exception("Background task failed")
@@ -1,3 +1,4 @@
+import tempfile
 from pathlib import Path
 from typing import Optional
 
@@ -8,13 +9,21 @@ from antarest.common.config import Config
 from antarest.storage.business.exporter_service import ExporterService
 from antarest.storage.business.importer_service import ImporterService
 from antarest.storage.business.study_service import StudyService
+from antarest.storage.business.task_runner import TaskRunner
+from antarest.storage.repository.antares_io.cache import ini_cache
 from antarest.storage.repository.antares_io.exporter.export_file import (
     Exporter,
 )
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    MatrixReader,
+)
 from antarest.storage.repository.filesystem.factory import StudyFactory
+from antarest.storage.repository.filesystem.fanout import fanout
 from antarest.storage.repository.metadata import StudyMetadataRepository
+from antarest.storage.repository.task import TaskRepository
 from antarest.storage.service import StorageService
 from antarest.storage.web.studies_blueprint import create_study_routes
+from antarest.storage.web.tasks_blueprint import create_task_routes
 from antarest.storage.web.utils_blueprint import create_utils_routes
 
 
@@ -30,12 +39,24 @@ def build_storage(
     path_to_studies = Path(config["storage.studies"])
     path_resources = Path(config["_internal.resources_path"])
     study_factory = study_factory or StudyFactory()
-    exporter = exporter or Exporter()
+    workers = config["storage.export.workers"]
+    exporter = exporter or Exporter(workers=int(workers) if workers else None)
+
+    if config["storage.cache.ini"] is not None:
+        ini_cache.resize(int(config["storage.cache.ini"]))
+    if config["storage.fanout.workers"] is not None:
+        fanout.resize(int(config["storage.fanout.workers"]))
+    task_workers = config["storage.tasks.workers"]
+    matrix_cache = Path(
+        config["storage.cache.matrix"]
+        or Path(tempfile.gettempdir()) / "antarest" / "matrix"
+    )
 
     study_service = StudyService(
         path_to_studies=path_to_studies,
         study_factory=study_factory,
         path_resources=path_resources,
+        matrix_reader=MatrixReader(cache_dir=matrix_cache),
     )
     importer_service = ImporterService(
         path_to_studies=path_to_studies,
@@ -49,12 +70,22 @@ def build_storage(
         exporter=exporter,
     )
 
-    storage_service = storage_service or StorageService(
-        study_service=study_service,
-        importer_service=importer_service,
-        exporter_service=exporter_service,
-        repository=StudyMetadataRepository(session=session),
-    )
+    if not storage_service:
+        storage_service = StorageService(
+            study_service=study_service,
+            importer_service=importer_service,
+            exporter_service=exporter_service,
+            repository=StudyMetadataRepository(session=session),
+            task_repository=TaskRepository(session=session),
+            task_runner=TaskRunner(
+                workers=int(task_workers)
+                if task_workers is not None
+                else TaskRunner.DEFAULT_WORKERS,
+                # tasks get their own session from scoped session
+                teardown=getattr(session, "remove", None),
+            ),
+        )
+        storage_service.fail_interrupted_tasks()
 
     application.register_blueprint(
         create_study_routes(storage_service, config)
@@ -62,5 +93,6 @@ def build_storage(
     application.register_blueprint(
         create_utils_routes(storage_service, config)
     )
+    application.register_blueprint(create_task_routes(storage_service, config))
 
     return storage_service
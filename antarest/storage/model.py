@@ -1,17 +1,19 @@
 import enum
 import uuid
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Column, String, Integer, DateTime, Table, ForeignKey, Enum  # type: ignore
+from sqlalchemy import Column, String, Integer, DateTime, Table, ForeignKey, Enum, Float, Boolean  # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 
+from antarest.common.custom_types import JSON
 from antarest.common.persistence import DTO, Base
 
 users_metadata = Table(
     "users_metadata",
     Base.metadata,
-    Column("user_id", Integer, ForeignKey("users.id")),
-    Column("metadata_id", Integer, ForeignKey("metadata.id")),
+    Column("user_id", Integer, ForeignKey("users.id"), index=True),
+    Column("metadata_id", String(36), ForeignKey("metadata.id"), index=True),
 )
 
 
@@ -30,12 +32,16 @@ class Metadata(DTO, Base):  # type: ignore
         default=lambda: str(uuid.uuid4()),
         unique=True,
     )
-    name = Column(String(255))
-    version = Column(String(255))
-    author = Column(String(255))
-    created_at = Column(DateTime)
-    updated_at = Column(DateTime)
+    name = Column(String(255), index=True)
+    version = Column(String(255), index=True)
+    author = Column(String(255), index=True)
+    created_at = Column(DateTime, index=True)
+    updated_at = Column(DateTime, index=True)
     content_status = Column(Enum(StudyContentStatus))
+    # mtime of study.antares when fields above were read from it
+    info_mtime = Column(Float)
+    # open to all users, studies found on disk without owner are not
+    public = Column(Boolean, default=False)
     users = relationship("User", secondary=lambda: users_metadata, cascade="")
 
     def __eq__(self, other: Any) -> bool:
@@ -55,3 +61,58 @@ class Metadata(DTO, Base):  # type: ignore
 
     def __str__(self) -> str:
         return f"Metadata(name={self.name}, version={self.version}, users={[str(u)+',' for u in self.users]}"
+
+
+class TaskStatus(enum.Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCESS = "success"
+    FAILED = "failed"
+
+
+class Task(DTO, Base):  # type: ignore
+    """
+    Work run in background on behalf of a user (ex: a study import), with
+    its progress.
+    """
+
+    __tablename__ = "task"
+
+    id = Column(
+        String(36),
+        primary_key=True,
+        default=lambda: str(uuid.uuid4()),
+        unique=True,
+    )
+    action = Column(String(32))
+    owner_id = Column(Integer, index=True)
+    status = Column(Enum(TaskStatus), default=TaskStatus.PENDING)
+    step = Column(String(32))
+    progress = Column(Integer, default=0)
+    study_id = Column(String(36))
+    msg = Column(String())
+    creation_date = Column(DateTime, default=datetime.utcnow)
+    completion_date = Column(DateTime)
+    # process whose runner holds task, see common.worker.worker()
+    worker = Column(String(255))
+
+    def to_dict(self) -> JSON:
+        return {
+            "id": self.id,
+            "action": self.action,
+            "status": self.status.value if self.status else None,
+            "step": self.step,
+            "progress": self.progress,
+            "study_id": self.study_id,
+            "msg": self.msg,
+            "creation_date": str(self.creation_date),
+            "completion_date": str(self.completion_date),
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Task):
+            return False
+        return other.to_dict() == self.to_dict()
+
+    def __str__(self) -> str:
+        return str(self.to_dict())
@@ -0,0 +1,102 @@
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Tuple, Any
+
+from antarest.common.custom_types import JSON
+
+
+def copy_ini(data: JSON) -> JSON:
+    """
+    Copy parsed ini content. Content is only sections of scalar values
+    (or list of values for sets.ini) so it's much faster than a deepcopy.
+    """
+    return {
+        section: {
+            key: list(value) if isinstance(value, list) else value
+            for key, value in params.items()
+        }
+        if isinstance(params, dict)
+        else params
+        for section, params in data.items()
+    }
+
+
+class IniCache:
+    """
+    LRU cache of parsed ini files. Entries are checked against file mtime
+    and size on each read. Memory budget is approximated by file sizes.
+    """
+
+    DEFAULT_MAX_SIZE = 64 * 1024 * 1024
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Path, Tuple[str, int, int, JSON]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, kind: str, path: Path, load: Callable[[Path], JSON]) -> JSON:
+        try:
+            st = path.stat()
+        except OSError:
+            return load(path)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry and entry[:3] == (kind, st.st_mtime_ns, st.st_size):
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return copy_ini(entry[3])
+            self.misses += 1
+
+        data = load(path)
+        self._put(kind, path, st, copy_ini(data))
+        return data
+
+    def put(self, kind: str, path: Path, data: JSON) -> None:
+        try:
+            st = path.stat()
+        except OSError:
+            self.invalidate(path)
+            return
+        self._put(kind, path, st, copy_ini(data))
+
+    def invalidate(self, path: Path) -> None:
+        with self._lock:
+            entry = self._entries.pop(path, None)
+            if entry:
+                self.size -= entry[2]
+
+    def resize(self, max_size: int) -> None:
+        with self._lock:
+            self.max_size = max_size
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _put(self, kind: str, path: Path, st: Any, data: JSON) -> None:
+        with self._lock:
+            old = self._entries.pop(path, None)
+            if old:
+                self.size -= old[2]
+            if st.st_size > self.max_size:
+                return
+            self._entries[path] = (kind, st.st_mtime_ns, st.st_size, data)
+            self.size += st.st_size
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_size and self._entries:
+            _, entry = self._entries.popitem(last=False)
+            self.size -= entry[2]
+
+
+ini_cache = IniCache()
@@ -1,49 +1,296 @@
-import glob
-import json
+import atexit
+import multiprocessing
 import os
-import re
+import stat
+import sys
+import threading
+import time
 import uuid
-from io import BytesIO
+import zlib
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from zipfile import ZIP_DEFLATED, ZIP_STORED
 
-from antarest.common.custom_types import JSON
+from antarest.common.custom_types import SUB_JSON
+from antarest.storage.repository.antares_io.exporter.zip_writer import (
+    ZipWriter,
+)
+from antarest.storage.repository.antares_io.walker import walk
+from antarest.storage.repository.filesystem import json_stream
+from antarest.storage.repository.filesystem.inode import INode
 
+# already compressed formats, deflate would only burn cpu
+STORED_EXTENSIONS = {
+    ".7z",
+    ".bz2",
+    ".gif",
+    ".gz",
+    ".ico",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".xz",
+    ".zip",
+}
 
-class Exporter:
-    def export_file(self, path_study: Path, outputs: bool = True) -> BytesIO:
-        data = BytesIO()
-        zipf = ZipFile(data, "w", ZIP_DEFLATED)
+Job = Tuple["Future[Any]", Callable[..., bytes]]
+Source = Union[Path, bytes, Iterator[bytes]]
 
-        current_dir = os.getcwd()
-        os.chdir(path_study)
+# pools are shared by exporters and live as long as the process
+_pools: Dict[int, Executor] = {}
+_pools_lock = threading.Lock()
 
-        for path in glob.glob("**", recursive=True):
-            if outputs or path.split(os.sep)[0] != "output":
-                zipf.write(path, path)
 
-        zipf.close()
+def shutdown_pools() -> None:
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=False)
 
-        os.chdir(current_dir)
-        data.seek(0)
-        return data
 
-    def export_compact(self, path_study: Path, data: JSON) -> BytesIO:
-        zip = BytesIO()
-        zipf = ZipFile(zip, "w", ZIP_DEFLATED)
+atexit.register(shutdown_pools)
 
-        root = path_study.parent.absolute()
 
-        jsonify = json.dumps(data)
+def compress(data: bytes, level: int, final: bool = True) -> bytes:
+    """
+    Raw deflate. Non final chunks end with a sync flush, so chunks
+    compressed separately can be concatenated into one deflate stream.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    flush = zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH
+    return compressor.compress(data) + compressor.flush(flush)
+
+
+def compress_chunk(data: bytes, level: int, final: bool) -> Tuple[bytes]:
+    return (compress(data, level, final),)
+
+
+def compress_data(data: bytes, level: int) -> Tuple[int, int, int, bytes]:
+    crc = zlib.crc32(data)
+    if level > 0:
+        compressed = compress(data, level)
+        if len(compressed) < len(data):
+            return ZIP_DEFLATED, crc, len(data), compressed
+    return ZIP_STORED, crc, len(data), data
+
+
+def compress_file(path: str, level: int) -> Tuple[int, int, int, bytes]:
+    with open(path, "rb") as file:
+        return compress_data(file.read(), level)
+
+
+class Exporter:
+    """
+    Zip studies as a stream of chunks. Entries are compressed by a pool of
+    processes and written in order: small files are compressed whole by
+    one worker, large files are split in chunks compressed in parallel.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    DEFAULT_LEVEL = 6
+    MIN_COMPRESS_SIZE = 512
+
+    def __init__(self, workers: Optional[int] = None):
+        self.workers = workers or os.cpu_count() or 1
+
+    def export_file(
+        self,
+        path_study: Path,
+        outputs: bool = True,
+        level: int = DEFAULT_LEVEL,
+    ) -> Iterator[bytes]:
+        def entries() -> Iterator[Tuple[str, Source]]:
+            for entry in walk(path_study):
+                if outputs or entry.name.split("/")[0] != "output":
+                    yield entry.name, Path(entry.path)
+
+        return self._zip(entries(), level)
 
-        for url in re.findall(r"file\/[^\"]*", jsonify):
+    def export_compact(
+        self,
+        path_study: Path,
+        study: INode[Any, Any, Any],
+        level: int = DEFAULT_LEVEL,
+    ) -> Iterator[bytes]:
+        """
+        Zip study tree as data.json where raw files are replaced by ids of
+        res/ entries. Tree is walked once while data.json is streamed, raw
+        files found on the way are added after it.
+        """
+        root = path_study.parent.absolute()
+        files: List[Tuple[str, Source]] = []
+
+        def resource(url: str) -> str:
             uuid4 = str(uuid.uuid4())
-            jsonify = jsonify.replace(url, uuid4)
-            url = url.replace("file/", "")
-            zipf.write(root / url, f"res/{uuid4}")
+            files.append((f"res/{uuid4}", root / url[len("file/") :]))
+            return uuid4
+
+        def entries() -> Iterator[Tuple[str, Source]]:
+            fragments = json_stream.encode(
+                study,
+                transform=partial(Exporter._replace_files, resource=resource),
+            )
+            yield "data.json", json_stream.join(fragments, self.CHUNK_SIZE)
+            # filled once data.json has been consumed
+            yield from files
+
+        return self._zip(entries(), level)
+
+    def _zip(
+        self, entries: Iterator[Tuple[str, Source]], level: int
+    ) -> Iterator[bytes]:
+        writer = ZipWriter()
+        pending: Deque[Job] = deque()
+        for job in self._jobs(writer, entries, level):
+            pending.append(job)
+            while len(pending) > 2 * self.workers:
+                future, finish = pending.popleft()
+                yield finish(*future.result())
+        while pending:
+            future, finish = pending.popleft()
+            yield finish(*future.result())
+        yield writer.close()
+
+    def _jobs(
+        self,
+        writer: ZipWriter,
+        entries: Iterator[Tuple[str, Source]],
+        level: int,
+    ) -> Iterator[Job]:
+        for name, source in entries:
+            if isinstance(source, bytes):
+                yield self._submit(compress_data, source, level), partial(
+                    writer.file, name, time.time(), 0o100644
+                )
+                continue
+            if not isinstance(source, Path):
+                yield from self._chunk_jobs(
+                    writer, name, time.time(), 0o100644, None, source, level
+                )
+                continue
+
+            st = source.stat()
+            if stat.S_ISDIR(st.st_mode):
+                yield Exporter._done(), partial(
+                    writer.directory, name, st.st_mtime, st.st_mode
+                )
+                continue
+
+            file_level = level
+            if (
+                source.suffix.lower() in STORED_EXTENSIONS
+                or st.st_size < self.MIN_COMPRESS_SIZE
+            ):
+                file_level = 0
+
+            if st.st_size <= self.CHUNK_SIZE:
+                yield self._submit(
+                    compress_file, str(source), file_level
+                ), partial(writer.file, name, st.st_mtime, st.st_mode)
+            else:
+                yield from self._chunk_jobs(
+                    writer,
+                    name,
+                    st.st_mtime,
+                    st.st_mode,
+                    st.st_size,
+                    self._read(source),
+                    file_level,
+                )
+
+    def _chunk_jobs(
+        self,
+        writer: ZipWriter,
+        name: str,
+        mtime: float,
+        mode: int,
+        expected_size: Optional[int],
+        chunks: Iterator[bytes],
+        level: int,
+    ) -> Iterator[Job]:
+        method = ZIP_DEFLATED if level > 0 else ZIP_STORED
+        yield Exporter._done(), partial(
+            writer.begin, name, mtime, mode, method, expected_size
+        )
+
+        crc = size = 0
+        chunk = next(chunks, b"")
+        while True:
+            following = next(chunks, b"")
+            crc = zlib.crc32(chunk, crc)
+            size += len(chunk)
+            if method == ZIP_STORED:
+                yield Exporter._done(chunk), writer.data
+            else:
+                final = not following
+                yield self._submit(
+                    compress_chunk, chunk, level, final
+                ), writer.data
+            if not following:
+                break
+            chunk = following
+
+        yield Exporter._done(), partial(writer.end, crc, size)
+
+    def _read(self, path: Path) -> Iterator[bytes]:
+        with path.open("rb") as file:
+            chunk = file.read(self.CHUNK_SIZE)
+            while chunk:
+                yield chunk
+                chunk = file.read(self.CHUNK_SIZE)
+
+    @staticmethod
+    def _replace_files(
+        data: SUB_JSON, resource: Callable[[str], str]
+    ) -> SUB_JSON:
+        if isinstance(data, str) and data.startswith("file/"):
+            return resource(data)
+        if isinstance(data, dict):
+            return {
+                key: Exporter._replace_files(value, resource)
+                for key, value in data.items()
+            }
+        return data
+
+    def _submit(
+        self, function: Callable[..., Any], *args: Any
+    ) -> "Future[Any]":
+        if self.workers <= 1:
+            future: "Future[Any]" = Future()
+            future.set_result(function(*args))
+            return future
+        with _pools_lock:
+            if self.workers not in _pools:
+                _pools[self.workers] = Exporter._pool(self.workers)
+            pool = _pools[self.workers]
+        return pool.submit(function, *args)
 
-        zipf.writestr("data.json", jsonify)
+    @staticmethod
+    def _pool(workers: int) -> Executor:
+        # pools are started from request threads, a fork would copy locks
+        # held by other threads: workers start from a new interpreter
+        if sys.version_info >= (3, 7):
+            return ProcessPoolExecutor(
+                workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return ProcessPoolExecutor(workers)  # python 3.6 can only fork
 
-        zipf.close()
-        zip.seek(0)
-        return zip
+    @staticmethod
+    def _done(*result: Any) -> "Future[Any]":
+        future: "Future[Any]" = Future()
+        future.set_result(result)
+        return future
@@ -0,0 +1,228 @@
+import struct
+import time
+from dataclasses import dataclass
+from typing import List, Optional
+from zipfile import ZIP_STORED
+
+ZIP64_LIMIT = (1 << 31) - 1
+ZIP_MAX = 0xFFFFFFFF
+FLAG_DESCRIPTOR = 0x08
+FLAG_UTF8 = 0x800
+
+
+@dataclass
+class ZipEntry:
+    name: bytes
+    flags: int
+    method: int
+    dostime: int
+    dosdate: int
+    attr: int
+    offset: int
+    zip64: bool
+    crc: int = 0
+    compressed_size: int = 0
+    size: int = 0
+
+
+class ZipWriter:
+    """
+    Minimal zip writer producing archive bytes in order, for entries
+    compressed elsewhere. Entries streamed are written with a data
+    descriptor, large ones or of unknown size use zip64 records.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0
+        self.entries: List[ZipEntry] = []
+
+    def file(
+        self,
+        name: str,
+        mtime: float,
+        mode: int,
+        method: int,
+        crc: int,
+        size: int,
+        data: bytes,
+    ) -> bytes:
+        entry = self._entry(name, mtime, mode, method, size, descriptor=False)
+        entry.crc = crc
+        entry.size = size
+        entry.compressed_size = len(data)
+        entry.zip64 = max(size, len(data)) > ZIP64_LIMIT
+        return self._emit(self._local_header(entry) + data)
+
+    def directory(self, name: str, mtime: float, mode: int) -> bytes:
+        entry = self._entry(name.rstrip("/") + "/", mtime, mode, ZIP_STORED)
+        entry.attr |= 0x10  # MS-DOS directory flag
+        return self._emit(self._local_header(entry))
+
+    def begin(
+        self,
+        name: str,
+        mtime: float,
+        mode: int,
+        method: int,
+        size: Optional[int],
+    ) -> bytes:
+        entry = self._entry(name, mtime, mode, method, size, descriptor=True)
+        return self._emit(self._local_header(entry))
+
+    def data(self, data: bytes) -> bytes:
+        self.entries[-1].compressed_size += len(data)
+        return self._emit(data)
+
+    def end(self, crc: int, size: int) -> bytes:
+        entry = self.entries[-1]
+        entry.crc = crc
+        entry.size = size
+        fmt = "<4L" if not entry.zip64 else "<2L2Q"
+        return self._emit(
+            struct.pack(fmt, 0x08074B50, crc, entry.compressed_size, size)
+        )
+
+    def close(self) -> bytes:
+        start = self.offset
+        records = b"".join(self._central_header(e) for e in self.entries)
+        self.offset += len(records)
+        count = len(self.entries)
+
+        end = b""
+        if count > 0xFFFF or max(start, len(records)) > ZIP_MAX:
+            end += struct.pack(
+                "<LQ2H2L4Q",
+                0x06064B50,
+                44,
+                45,
+                45,
+                0,
+                0,
+                count,
+                count,
+                len(records),
+                start,
+            )
+            end += struct.pack("<2LQL", 0x07064B50, 0, self.offset, 1)
+        end += struct.pack(
+            "<L4H2LH",
+            0x06054B50,
+            0,
+            0,
+            min(count, 0xFFFF),
+            min(count, 0xFFFF),
+            min(len(records), ZIP_MAX),
+            min(start, ZIP_MAX),
+            0,
+        )
+        return records + self._emit(end)
+
+    def _entry(
+        self,
+        name: str,
+        mtime: float,
+        mode: int,
+        method: int,
+        size: Optional[int] = 0,
+        descriptor: bool = False,
+    ) -> ZipEntry:
+        year, month, day, hour, minute, second = time.localtime(mtime)[:6]
+        if year < 1980:
+            year, month, day, hour, minute, second = 1980, 1, 1, 0, 0, 0
+        try:
+            encoded = name.encode("ascii")
+            flags = 0
+        except UnicodeEncodeError:
+            encoded = name.encode("utf-8")
+            flags = FLAG_UTF8
+
+        entry = ZipEntry(
+            name=encoded,
+            flags=flags | (FLAG_DESCRIPTOR if descriptor else 0),
+            method=method,
+            dostime=hour << 11 | minute << 5 | second // 2,
+            dosdate=(year - 1980) << 9 | month << 5 | day,
+            attr=(mode & 0xFFFF) << 16,
+            offset=self.offset,
+            # same heuristic as zipfile, compressed size may exceed size
+            zip64=size is None or size * 1.05 > ZIP64_LIMIT,
+        )
+        self.entries.append(entry)
+        return entry
+
+    def _local_header(self, entry: ZipEntry) -> bytes:
+        extra = b""
+        sizes = (entry.compressed_size, entry.size)
+        if entry.zip64:
+            extra = struct.pack(
+                "<2H2Q", 1, 16, entry.size, entry.compressed_size
+            )
+            sizes = (ZIP_MAX, ZIP_MAX)
+        return (
+            struct.pack(
+                "<L5H3L2H",
+                0x04034B50,
+                45 if entry.zip64 else 20,
+                entry.flags,
+                entry.method,
+                entry.dostime,
+                entry.dosdate,
+                entry.crc,
+                *sizes,
+                len(entry.name),
+                len(extra),
+            )
+            + entry.name
+            + extra
+        )
+
+    def _central_header(self, entry: ZipEntry) -> bytes:
+        fields = []
+        compressed_size, size, offset = (
+            entry.compressed_size,
+            entry.size,
+            entry.offset,
+        )
+        if size > ZIP_MAX or entry.zip64:
+            fields.append(size)
+            size = ZIP_MAX
+        if compressed_size > ZIP_MAX or entry.zip64:
+            fields.append(compressed_size)
+            compressed_size = ZIP_MAX
+        if offset > ZIP_MAX:
+            fields.append(offset)
+            offset = ZIP_MAX
+        extra = b""
+        if fields:
+            extra = struct.pack(
+                f"<2H{len(fields)}Q", 1, 8 * len(fields), *fields
+            )
+        version = 45 if fields else 20
+        return (
+            struct.pack(
+                "<L6H3L5H2L",
+                0x02014B50,
+                3 << 8 | version,  # made by unix
+                version,
+                entry.flags,
+                entry.method,
+                entry.dostime,
+                entry.dosdate,
+                entry.crc,
+                compressed_size,
+                size,
+                len(entry.name),
+                len(extra),
+                0,
+                0,
+                0,
+                entry.attr,
+                offset,
+            )
+            + entry.name
+            + extra
+        )
+
+    def _emit(self, data: bytes) -> bytes:
+        self.offset += len(data)
+        return data
@@ -2,9 +2,10 @@ import configparser
 import re
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Dict
 
 from antarest.common.custom_types import ELEMENT, JSON
+from antarest.storage.repository.antares_io.cache import ini_cache
 
 
 class IReader(ABC):
@@ -13,7 +14,23 @@ class IReader(ABC):
         pass
 
 
+_INT = re.compile(r"[+-]?[0-9]+")
+_FLOAT = re.compile(r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?")
+# first characters of strings int() or float() could still accept
+# (underscores, unicode digits, inf, nan, surrounding spaces)
+_MAYBE_NUMBER = frozenset("0123456789+-._iInN \t\n\r\x0b\x0c")
+_BOOL = frozenset("tTfF")
+
+
 class IniReader(IReader):
+    """
+    Single pass ini parser. It produces the same result as a
+    RawConfigParser (same delimiters, comments, multiline values and
+    DEFAULT section handling) with value typing.
+    """
+
+    KIND = "ini"
+
     @staticmethod
     def _parse_bool(value: str) -> Optional[bool]:
         value = value.lower()
@@ -35,60 +52,146 @@ class IniReader(IReader):
 
     @staticmethod
     def parse_value(value: str) -> ELEMENT:
-        parsed: Union[str, int, float, bool, None] = IniReader._parse_bool(
-            value
-        )
-        parsed = parsed if parsed is not None else IniReader._parse_int(value)
-        parsed = (
-            parsed if parsed is not None else IniReader._parse_float(value)
-        )
-        return parsed if parsed is not None else value
+        if _INT.fullmatch(value):
+            return int(value)
+        if _FLOAT.fullmatch(value):
+            return float(value)
 
-    @staticmethod
-    def _parse_json(json: configparser.SectionProxy) -> JSON:
-        return {
-            key: IniReader.parse_value(value) for key, value in json.items()
-        }
+        first = value[:1]
+        if first in _BOOL:
+            parsed = IniReader._parse_bool(value)
+            return parsed if parsed is not None else value
+        if first in _MAYBE_NUMBER or first > "\x7f":
+            number: Union[int, float, None] = IniReader._parse_int(value)
+            number = (
+                number if number is not None else IniReader._parse_float(value)
+            )
+            return number if number is not None else value
+        return value
 
     def read(self, path: Path) -> JSON:
-        config = IniConfigParser()
-        config.read(path)
+        return ini_cache.get(IniReader.KIND, path, IniReader._read)
 
+    @staticmethod
+    def _read(path: Path) -> JSON:
+        try:
+            text = path.read_text()
+        except OSError:
+            return {}
+        return IniReader.parse_text(text, str(path))
+
+    @staticmethod
+    def parse_text(text: str, name: str = "<string>") -> JSON:
+        sections = IniReader._tokenize(text.split("\n"), name)
+        defaults = sections.pop("DEFAULT", {})
+        parse = IniReader.parse_value
         return {
-            key: IniReader._parse_json(config[key])
-            for key in config
-            if key != "DEFAULT"
+            name: {
+                key: parse(value)
+                for key, value in (
+                    {**params, **defaults, **params} if defaults else params
+                ).items()
+            }
+            for name, params in sections.items()
         }
 
-
-class IniConfigParser(configparser.RawConfigParser):
-    def optionxform(self, optionstr: str) -> str:
-        return optionstr
+    @staticmethod
+    def _tokenize(lines: List[str], name: str) -> Dict[str, Dict[str, str]]:
+        sections: Dict[str, Dict[str, str]] = dict()
+        section: Optional[Dict[str, str]] = None
+        section_name = ""
+        key: Optional[str] = None
+        indent_level = 0
+        blanks = 0
+        # like RawConfigParser, bad lines are reported together at the end
+        # while duplicates and missing header are raised on first one
+        error: Optional[configparser.ParsingError] = None
+
+        for lineno, line in enumerate(lines, start=1):
+            value = line.strip()
+            if not value or value[0] in "#;":
+                if not value and key:
+                    blanks += 1
+                continue
+
+            indent = len(line) - len(line.lstrip())
+            if key and section is not None and indent > indent_level:
+                # continuation of a multiline value
+                section[key] += "\n" * (blanks + 1) + value
+                blanks = 0
+                continue
+
+            indent_level = indent
+            blanks = 0
+            # lines are reported as read from file, with their newline
+            raw = line + "\n" if lineno < len(lines) else line
+            end = value.rfind("]")
+            if value[0] == "[" and end > 1:
+                section_name = value[1:end]
+                if section_name in sections and section_name != "DEFAULT":
+                    raise configparser.DuplicateSectionError(
+                        section_name, name, lineno
+                    )
+                section = sections.setdefault(section_name, dict())
+                key = None
+            elif section is None:
+                raise configparser.MissingSectionHeaderError(name, lineno, raw)
+            else:
+                delimiters = [value.find("="), value.find(":")]
+                delimiter = (
+                    min(delimiters)
+                    if -1 not in delimiters
+                    else max(delimiters)
+                )
+                if delimiter < 0:
+                    error = error or configparser.ParsingError(name)
+                    error.append(lineno, repr(raw))
+                    continue
+                key = value[:delimiter].rstrip()
+                if not key:
+                    error = error or configparser.ParsingError(name)
+                    error.append(lineno, repr(raw))
+                if key in section:
+                    raise configparser.DuplicateOptionError(
+                        section_name, key, name, lineno
+                    )
+                section[key] = value[delimiter + 1 :].lstrip()
+
+        if error:
+            raise error
+        return sections
 
 
 class SetsIniReader(IReader):
+    KIND = "sets"
+
     @staticmethod
     def fetch_cleaned_lines(path: Path) -> List[str]:
         return [l for l in path.read_text().split("\n") if l != ""]
 
     def read(self, path: Path) -> JSON:
+        return ini_cache.get(SetsIniReader.KIND, path, SetsIniReader._read)
+
+    @staticmethod
+    def _read(path: Path) -> JSON:
         data: JSON = dict()
         curr_part = ""
         lines = SetsIniReader.fetch_cleaned_lines(path)
+        parse = IniReader.parse_value
 
         for line in lines:
-            regex = re.search("^\[(.*)\]$", line)
-            if regex:
-                curr_part = regex.group(1)
+            if line[0] == "[" and line[-1] == "]" and len(line) > 1:
+                curr_part = line[1:-1]
                 data[curr_part] = dict()
             else:
                 key, string = line.split(" = ")
-                value = IniReader.parse_value(string)
-                if key not in data[curr_part]:
-                    data[curr_part][key] = value
+                value = parse(string)
+                part = data[curr_part]
+                if key not in part:
+                    part[key] = value
                 else:
-                    if not isinstance(data[curr_part][key], list):
-                        data[curr_part][key] = [data[curr_part][key]]
-                    data[curr_part][key].append(value)
+                    if not isinstance(part[key], list):
+                        part[key] = [part[key]]
+                    part[key].append(value)
 
         return data
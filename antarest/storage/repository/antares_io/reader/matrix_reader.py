@@ -0,0 +1,339 @@
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Matrix:
+    """
+    Numeric content of an Antares matrix file. Output files also carry
+    their header (columns, units, statistics) and time index labels.
+    """
+
+    data: np.ndarray
+    columns: List[str] = field(default_factory=list)
+    units: List[str] = field(default_factory=list)
+    stats: List[str] = field(default_factory=list)
+    index_names: List[str] = field(default_factory=list)
+    index: List[List[str]] = field(default_factory=list)
+
+    def header(self) -> JSON:
+        return {
+            "columns": self.columns,
+            "units": self.units,
+            "stats": self.stats,
+            "index_names": self.index_names,
+            "index": self.index,
+        }
+
+    def to_json(self) -> JSON:
+        data = self.data.tolist()
+        if np.isnan(self.data).any():
+            data = [[None if v != v else v for v in row] for row in data]
+        return {**self.header(), "data": data}
+
+
+@dataclass
+class MatrixQuery:
+    """
+    Slice of a matrix: column names (or positions for headerless input
+    matrices), row range [start, end[ and/or inclusive date range matched
+    on leading time index labels (ex: "02 JAN" or "02 JAN 13:00").
+    """
+
+    columns: Optional[List[str]] = None
+    start: Optional[int] = None
+    end: Optional[int] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+
+
+@dataclass
+class MatrixIndex:
+    """
+    Header and data row byte offsets of a matrix file, enough to read
+    any window of rows without scanning the file again.
+    """
+
+    version: Tuple[int, int]
+    header: Matrix
+    first: int  # position of first value in a row
+    offsets: np.ndarray  # row starts, followed by end of data
+    labels: np.ndarray  # time labels of rows, stripped and tab joined
+
+    @property
+    def nbytes(self) -> int:
+        header = sum(len(name) + 64 for name in self.header.columns)
+        return int(self.offsets.nbytes + self.labels.nbytes) + header
+
+
+class MatrixQueryError(ValueError):
+    """
+    Query selects a column or a date missing from matrix.
+    """
+
+
+class MatrixReader:
+    """
+    Parse input series and output values files into float64 arrays.
+    When a cache directory is given, parsed matrices are kept there as
+    .npy files (loaded memory mapped) keyed by source path, mtime and size.
+    """
+
+    OUTPUT_HEADER_SIZE = 7
+    INDEX_CACHE_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        self.cache_dir = cache_dir
+        self._indexes: "OrderedDict[Path, MatrixIndex]" = OrderedDict()
+        self._indexes_size = 0
+        self._lock = threading.Lock()
+
+    def query(self, path: Path, query: MatrixQuery) -> Matrix:
+        index = self.index(path)
+        header = index.header
+        positions = MatrixReader._positions(header.columns, query.columns)
+        lo, hi = MatrixReader._rows(index, query)
+
+        with path.open("rb") as file:
+            file.seek(int(index.offsets[lo]))
+            chunk = file.read(int(index.offsets[hi] - index.offsets[lo]))
+        rows = [line for line in chunk.decode().split("\n") if line.strip()]
+        width = index.first + len(header.columns)
+        if any(row.count("\t") + 1 != width for row in rows):
+            raise ValueError("matrix rows don't match header length")
+
+        shift = [index.first + p for p in positions]
+        split = max(shift, default=0) + 1
+        cells = [row.split("\t", split) for row in rows]
+
+        def pick(values: List[str]) -> List[str]:
+            return [values[p] for p in positions] if values else []
+
+        return Matrix(
+            data=MatrixReader._values(
+                [row[p] for row in cells for p in shift], len(positions)
+            ),
+            columns=pick(header.columns),
+            units=pick(header.units),
+            stats=pick(header.stats),
+            index_names=header.index_names,
+            index=[row[1 : index.first] for row in cells]
+            if index.first
+            else [],
+        )
+
+    def index(self, path: Path) -> MatrixIndex:
+        st = path.stat()
+        version = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            index = self._indexes.get(path)
+            if index and index.version == version:
+                self._indexes.move_to_end(path)
+                return index
+
+        index = MatrixReader._build_index(path, version)
+        with self._lock:
+            old = self._indexes.pop(path, None)
+            if old:
+                self._indexes_size -= old.nbytes
+            self._indexes[path] = index
+            self._indexes_size += index.nbytes
+            while self._indexes_size > MatrixReader.INDEX_CACHE_BYTES:
+                _, evicted = self._indexes.popitem(last=False)
+                self._indexes_size -= evicted.nbytes
+        return index
+
+    def read(self, path: Path) -> Matrix:
+        st = path.stat()
+        if self.cache_dir is None:
+            return MatrixReader._read(path)
+
+        prefix = hashlib.sha1(str(path.absolute()).encode()).hexdigest()
+        name = f"{prefix}-{st.st_mtime_ns}-{st.st_size}"
+        npy = self.cache_dir / f"{name}.npy"
+        meta = self.cache_dir / f"{name}.json"
+        if npy.exists() and meta.exists():
+            return Matrix(
+                data=np.load(str(npy), mmap_mode="r"),
+                **json.loads(meta.read_text()),
+            )
+
+        matrix = MatrixReader._read(path)
+        try:
+            self._save(prefix, npy, meta, matrix)
+        except OSError as e:
+            logger.warning(f"Can't cache matrix {path}: {e}")
+        return matrix
+
+    def _save(
+        self, prefix: str, npy: Path, meta: Path, matrix: Matrix
+    ) -> None:
+        assert self.cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for old in self.cache_dir.glob(f"{prefix}-*"):
+            old.unlink()
+        with atomic_write(npy, "wb") as file:
+            np.save(file, matrix.data)
+        with atomic_write(meta) as file:
+            json.dump(matrix.header(), file)
+
+    @staticmethod
+    def _build_index(path: Path, version: Tuple[int, int]) -> MatrixIndex:
+        raw = path.read_bytes()
+        ends = np.flatnonzero(np.frombuffer(raw, dtype=np.uint8) == 10)
+        starts = np.concatenate(([0], ends + 1, [len(raw) + 1]))
+        lines = min(len(starts) - 1, MatrixReader.OUTPUT_HEADER_SIZE)
+        head = [
+            raw[starts[i] : starts[i + 1] - 1].decode() for i in range(lines)
+        ]
+
+        header = Matrix(data=np.zeros((0, 0)))
+        first = 0
+        if MatrixReader._is_output(head):
+            header = MatrixReader._read_output(head)
+            first = len(header.index_names) + 1
+            starts = starts[MatrixReader.OUTPUT_HEADER_SIZE :]
+
+        # drop blank lines (trailing newline) from data rows
+        rows = [
+            (int(s), int(e))
+            for s, e in zip(starts[:-1], starts[1:] - 1)
+            if raw[s:e].strip()
+        ]
+        offsets = np.array([s for s, _ in rows] + [len(raw)], dtype=np.int64)
+        if rows:
+            offsets[-1] = min(rows[-1][1] + 1, len(raw))
+
+        labels = np.array([], dtype=bytes)
+        if first:
+            skip = 2 if header.index_names[:1] == ["index"] else 1
+            labels = np.array(
+                [
+                    b"\t".join(
+                        cell.strip()
+                        for cell in raw[s:e].split(b"\t", first)[skip:first]
+                    )
+                    for s, e in rows
+                ],
+                dtype=bytes,
+            )
+        elif rows:
+            width = raw[rows[0][0] : rows[0][1]].count(b"\t") + 1
+            header.columns = [str(i) for i in range(width)]
+
+        return MatrixIndex(version, header, first, offsets, labels)
+
+    @staticmethod
+    def _positions(
+        columns: List[str], requested: Optional[List[str]]
+    ) -> List[int]:
+        if requested is None:
+            return list(range(len(columns)))
+        positions = []
+        for name in requested:
+            found = [i for i, column in enumerate(columns) if column == name]
+            if not found:
+                raise MatrixQueryError(f"unknown column {name}")
+            positions += found
+        return positions
+
+    @staticmethod
+    def _rows(index: MatrixIndex, query: MatrixQuery) -> Tuple[int, int]:
+        rows = range(len(index.offsets) - 1)
+        if query.date_from is not None:
+            rows = rows[MatrixReader._find(index, query.date_from) :]
+        if query.date_to is not None:
+            last = MatrixReader._find(index, query.date_to, reverse=True)
+            rows = rows[: max(last + 1 - rows.start, 0)]
+        rows = rows[query.start : query.end]
+        return rows.start, max(rows.start, rows.stop)
+
+    @staticmethod
+    def _find(index: MatrixIndex, date: str, reverse: bool = False) -> int:
+        # labels starting with date cells
+        key = "\t".join(date.split()).encode()
+        found = (
+            np.flatnonzero(
+                (index.labels == key)
+                | np.char.startswith(index.labels, key + b"\t")
+            )
+            if key
+            else np.arange(len(index.labels))
+        )
+        if not len(found):
+            raise MatrixQueryError(f"date {date} not found")
+        return int(found[-1] if reverse else found[0])
+
+    @staticmethod
+    def _read(path: Path) -> Matrix:
+        lines = path.read_text().split("\n")
+        if MatrixReader._is_output(lines):
+            return MatrixReader._read_output(lines)
+        return Matrix(data=MatrixReader._parse(lines))
+
+    @staticmethod
+    def _is_output(lines: List[str]) -> bool:
+        return len(lines) >= MatrixReader.OUTPUT_HEADER_SIZE and lines[
+            1
+        ].split("\t")[1:2] == ["VARIABLES"]
+
+    @staticmethod
+    def _read_output(lines: List[str]) -> Matrix:
+        names = lines[4].rstrip("\n").split("\t")
+        # area and frequency come first, then blank cells above index columns
+        start = next(
+            (i for i, name in enumerate(names) if i > 1 and name),
+            len(names),
+        )
+        columns = [name.strip() for name in names[start:]]
+        end = start + len(columns)
+
+        def cells(line: str) -> List[str]:
+            return [c.strip() for c in line.split("\t")[start:end]]
+
+        rows = [
+            line.split("\t")
+            for line in lines[MatrixReader.OUTPUT_HEADER_SIZE :]
+            if line.strip()
+        ]
+        if any(len(row) != end for row in rows):
+            raise ValueError("matrix rows don't match header length")
+        return Matrix(
+            data=MatrixReader._values(
+                [c for row in rows for c in row[start:end]], len(columns)
+            ),
+            columns=columns,
+            units=cells(lines[5]),
+            stats=cells(lines[6]),
+            index_names=lines[6].split("\t")[1:start],
+            index=[row[1:start] for row in rows],
+        )
+
+    @staticmethod
+    def _parse(lines: List[str]) -> np.ndarray:
+        rows = [line.split("\t") for line in lines if line.strip()]
+        width = max((len(row) for row in rows), default=0)
+        if any(len(row) != width for row in rows):
+            raise ValueError("matrix rows have different lengths")
+        return MatrixReader._values([c for row in rows for c in row], width)
+
+    @staticmethod
+    def _values(cells: List[str], width: int) -> np.ndarray:
+        if not cells:
+            return np.zeros((0, width))
+        values = np.array(cells)
+        values = np.where(values == "N/A", "nan", values)
+        return values.astype(np.float64).reshape(-1, width)
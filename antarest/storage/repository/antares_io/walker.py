@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+# name, is_dir
+LISTING = List[Tuple[str, bool]]
+
+
+@dataclass
+class WalkEntry:
+    name: str  # relative to walked root, "/" separated
+    path: str  # absolute
+    is_dir: bool
+
+
+class ListingCache:
+    """
+    LRU cache of directory listings, checked against directory mtime (any
+    created, deleted or renamed entry updates it) on each read. Listings of
+    directories modified while scanned are not kept.
+    """
+
+    DEFAULT_MAX_SIZE = 4096
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[int, LISTING]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, directory: str) -> LISTING:
+        mtime = os.stat(directory).st_mtime_ns
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry and entry[0] == mtime:
+                self._entries.move_to_end(directory)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+
+        start = time.time()
+        listing = scan(directory)
+        mtime = os.stat(directory).st_mtime_ns
+
+        # an entry added in the same mtime tick after scan would be missed
+        # for good, so don't trust listings of too recent directories
+        if mtime < start * 1e9:
+            with self._lock:
+                self._entries[directory] = (mtime, listing)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return listing
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def scan(directory: str) -> LISTING:
+    # dirent type avoids a stat per entry (except for symlinks)
+    with os.scandir(directory) as it:
+        return [(entry.name, entry.is_dir()) for entry in it]
+
+
+def walk(
+    root: Path, cache: Optional[ListingCache] = None
+) -> Iterator[WalkEntry]:
+    """
+    Give every entry under root, each folder before its content. Like
+    glob("**"), hidden entries (starting with a dot) are skipped. Paths
+    are absolute, process working directory is never changed.
+    """
+    base = str(root.absolute())
+    stack: List[Tuple[str, str]] = [(base, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        listing = cache.get(directory) if cache else scan(directory)
+        entries = []
+        for name, is_dir in listing:
+            if name.startswith("."):
+                continue
+            entries.append(
+                WalkEntry(
+                    name=prefix + name,
+                    path=os.path.join(directory, name),
+                    is_dir=is_dir,
+                )
+            )
+        # keep listing order: push sub folders reversed
+        subfolders: List[Tuple[str, str]] = []
+        for entry in entries:
+            yield entry
+            if entry.is_dir:
+                subfolders.append((entry.path, f"{entry.name}/"))
+        stack.extend(reversed(subfolders))
+
+
+listing_cache = ListingCache()
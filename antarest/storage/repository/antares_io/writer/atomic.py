@@ -0,0 +1,28 @@
+import os
+import stat
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Iterator, IO
+from uuid import uuid4
+
+
+@contextmanager
+def atomic_write(
+    path: Path, mode: str = "w", **kwargs: Any
+) -> Iterator[IO[Any]]:
+    """
+    Open a temporary file next to path and move it over path once the
+    block succeeds. Readers never see a partially written file and
+    files sharing the same inode (hardlinks) are left untouched.
+    """
+    tmp = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with open(tmp, mode.replace("w", "x"), **kwargs) as file:
+            yield file
+        if path.exists():
+            os.chmod(tmp, stat.S_IMODE(path.stat().st_mode))
+        os.replace(tmp, path)
+    except BaseException:
+        if tmp.exists():
+            tmp.unlink()
+        raise
@@ -0,0 +1,96 @@
+import errno
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+# linux ioctl sharing extents of a file with another one (btrfs, xfs...)
+FICLONE = 0x40049409
+
+REFLINK = "reflink"
+HARDLINK = "hardlink"
+COPY = "copy"
+
+
+def reflink(src: Path, dst: Path) -> bool:
+    if fcntl is None:
+        return False
+    try:
+        with src.open("rb") as source, dst.open("xb") as destination:
+            fcntl.ioctl(destination.fileno(), FICLONE, source.fileno())
+        shutil.copystat(str(src), str(dst))
+        return True
+    except OSError as e:
+        if dst.exists():
+            dst.unlink()
+        if e.errno == errno.EEXIST:
+            raise
+        return False
+
+
+class TreeCloner:
+    """
+    Clone a folder tree, file contents are shared as much as filesystem
+    allows: reflinks first, then hardlinks for files accepted by
+    can_link (files only ever replaced, never written in place), then
+    plain copies done in parallel.
+    """
+
+    def __init__(self, workers: int = 8):
+        self.workers = workers
+        self._reflink: Dict[int, bool] = {}  # by source device
+
+    def clone(
+        self,
+        src: Path,
+        dst: Path,
+        exclude: Optional[Set[str]] = None,
+        can_link: Callable[[Path], bool] = lambda path: False,
+    ) -> Dict[str, int]:
+        """
+        Clone src into dst, skipping top level entries named in exclude.
+        Give number of files shared or copied by each mean.
+        """
+        exclude = exclude or set()
+        files: List[Tuple[Path, Path, bool]] = []
+        for root, dirs, names in os.walk(str(src)):
+            relative = Path(root).relative_to(src)
+            if relative == Path("."):
+                dirs[:] = [d for d in dirs if d not in exclude]
+                names = [n for n in names if n not in exclude]
+            (dst / relative).mkdir(parents=True, exist_ok=True)
+            for name in names:
+                path = relative / name
+                files.append((src / path, dst / path, can_link(path)))
+
+        counts = {REFLINK: 0, HARDLINK: 0, COPY: 0}
+        with ThreadPoolExecutor(self.workers) as pool:
+            for mean in pool.map(lambda args: self._clone_file(*args), files):
+                counts[mean] += 1
+        logger.info(f"Cloned {src} into {dst}: {counts}")
+        return counts
+
+    def _clone_file(self, src: Path, dst: Path, can_link: bool) -> str:
+        device = src.stat().st_dev
+        if self._reflink.get(device, True):
+            if reflink(src, dst):
+                self._reflink[device] = True
+                return REFLINK
+            self._reflink[device] = False
+        if can_link:
+            try:
+                os.link(str(src), str(dst))
+                return HARDLINK
+            except OSError:
+                pass
+        shutil.copy2(str(src), str(dst))
+        return COPY
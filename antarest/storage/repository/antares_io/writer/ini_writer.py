@@ -1,14 +1,151 @@
+import io
 from configparser import ConfigParser, RawConfigParser
 from pathlib import Path
+from typing import Any, IO, List, Optional
 
 from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.cache import ini_cache
+from antarest.storage.repository.antares_io.reader import IniReader
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
 
 
 class IniWriter:
     def write(self, data: JSON, path: Path) -> None:
         config_parser = IniConfigParser()
         config_parser.read_dict(data)
-        config_parser.write(path.open("w"))
+        text = io.StringIO()
+        config_parser.write(text)
+        with atomic_write(path) as file:
+            file.write(text.getvalue())
+        # cache what a read of written text gives, not data itself
+        ini_cache.put(
+            IniReader.KIND, path, IniReader.parse_text(text.getvalue())
+        )
+
+    def update(
+        self, data: JSON, path: Path, section: str, key: Optional[str] = None
+    ) -> None:
+        """
+        Save data already updated at data[section] (or data[section][key])
+        by only replacing matching lines inside existing file. Other lines
+        are copied as they are, without parsing or formatting them again.
+        """
+        lines = (
+            IniWriter._format_section(section, data[section])
+            if key is None
+            else [IniWriter._format_key(key, data[section][key])]
+        )
+        with path.open(newline="") as src:
+            with atomic_write(path, newline="") as dst:
+                IniWriter._patch(src, dst, section, key, lines)
+
+        # data formatted like written is parsed back, so cache holds what
+        # a read of the file gives
+        cached = IniReader.parse_text(
+            "".join(
+                line
+                for name, params in data.items()
+                for line in IniWriter._format_section(name, params)
+            )
+        )
+        if [(name, list(params)) for name, params in cached.items()] != [
+            (name, list(params)) for name, params in data.items()
+        ]:
+            # names changed by parsing or defaults: read file again
+            ini_cache.invalidate(path)
+            return
+        ini_cache.put(IniReader.KIND, path, cached)
+
+    @staticmethod
+    def _patch(
+        src: IO[str],
+        dst: IO[str],
+        section: str,
+        key: Optional[str],
+        lines: List[str],
+    ) -> None:
+        in_section = False
+        skip_section = False
+        skip_indent: Optional[int] = None
+        done = False
+        blanks: List[str] = []
+        last = "\n"
+
+        for line in src:
+            value = line.strip()
+            indent = len(line) - len(line.lstrip())
+            if skip_indent is not None:
+                if value and indent > skip_indent:
+                    continue  # continuation of replaced multiline value
+                skip_indent = None
+
+            end = value.rfind("]")
+            if value[:1] == "[" and end > 1:
+                if in_section and not done:
+                    dst.writelines(lines)
+                    done = True
+                dst.writelines(blanks)
+                blanks = []
+                in_section = value[1:end] == section
+                skip_section = in_section and key is None
+                if skip_section:
+                    dst.writelines(lines)
+                    done = True
+                    continue
+            elif skip_section:
+                continue
+            elif in_section and not done:
+                if not value:
+                    blanks.append(line)
+                    continue
+                dst.writelines(blanks)
+                blanks = []
+                if value[0] not in "#;" and IniWriter._key(value) == key:
+                    dst.writelines(lines)
+                    done = True
+                    skip_indent = indent
+                    continue
+
+            dst.write(line)
+            last = line
+
+        if in_section and not done:
+            if not last.endswith("\n"):
+                dst.write("\n")
+            dst.writelines(lines)
+            done = True
+        dst.writelines(blanks)
+        if blanks:
+            last = blanks[-1]
+
+        if not done:
+            if not last.endswith("\n"):
+                dst.write("\n")
+            if key is not None:
+                lines = [f"[{section}]\n"] + lines + ["\n"]
+            dst.writelines(lines)
+
+    @staticmethod
+    def _key(value: str) -> str:
+        delimiters = [value.find("="), value.find(":")]
+        delimiter = (
+            min(delimiters) if -1 not in delimiters else max(delimiters)
+        )
+        return value[:delimiter].rstrip()
+
+    @staticmethod
+    def _format_key(key: str, value: Any) -> str:
+        # same layout as RawConfigParser.write
+        value = str(value).replace("\n", "\n\t")
+        return f"{key} = {value}\n"
+
+    @staticmethod
+    def _format_section(section: str, params: JSON) -> List[str]:
+        return (
+            [f"[{section}]\n"]
+            + [IniWriter._format_key(k, v) for k, v in params.items()]
+            + ["\n"]
+        )
 
 
 class IniConfigParser(RawConfigParser):
@@ -1,8 +1,13 @@
 import shutil
 from pathlib import Path
 
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
+
 
 class MatrixWriter:
     def write(self, matrix_path: Path, destination_path: Path) -> None:
+        # replace file, matrices may be hardlinked by study copies
         if matrix_path != destination_path:
-            shutil.copyfile(matrix_path, destination_path)
+            with matrix_path.open("rb") as src:
+                with atomic_write(destination_path, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
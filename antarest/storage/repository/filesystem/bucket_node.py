@@ -1,9 +1,7 @@
-import glob
-import os
-from pathlib import Path
 from typing import Optional, List
 
 from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.walker import listing_cache, walk
 from antarest.storage.repository.filesystem.config.model import StudyConfig
 from antarest.storage.repository.filesystem.folder_node import FolderNode
 from antarest.storage.repository.filesystem.inode import TREE
@@ -27,22 +25,19 @@ class BucketNode(FolderNode):
                     str(content)
                 )
 
+    def get_children(self) -> TREE:
+        # bucket content is free, it can't be kept between calls
+        return self.build(self.config)
+
     def build(self, config: StudyConfig) -> TREE:
         if not config.path.exists():
             return dict()
 
-        current_dir = os.getcwd()
-        os.chdir(self.config.path)
-
         children: TREE = {
-            "/".join(Path(file).parts): RawFileNode(
-                self.config.next_file(file)
-            )
-            for file in glob.glob("**", recursive=True)
-            if Path(file).is_file()
+            entry.name: RawFileNode(self.config.next_file(entry.name))
+            for entry in walk(self.config.path, listing_cache)
+            if not entry.is_dir
         }
-
-        os.chdir(current_dir)
         return children
 
     def check_errors(
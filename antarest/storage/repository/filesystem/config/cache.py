@@ -0,0 +1,71 @@
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from antarest.storage.repository.filesystem.config.files import (
+    ConfigPathBuilder,
+)
+from antarest.storage.repository.filesystem.config.model import StudyConfig
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE = Tuple[Optional[Tuple[int, int]], ...]
+
+
+class StudyConfigCache:
+    """
+    Keep one StudyConfig per study. Config is rebuilt only when a file
+    used to build it has changed (mtime or size).
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._entries: Dict[Path, Tuple[SIGNATURE, StudyConfig]] = dict()
+        self._lock = threading.Lock()
+
+    def get(self, study_path: Path) -> StudyConfig:
+        with self._lock:
+            entry = self._entries.get(study_path)
+        if entry:
+            signature, config = entry
+            deps = ConfigPathBuilder.dependencies(config)
+            if StudyConfigCache._signature(deps) == signature:
+                self.hits += 1
+                return config
+
+        self.misses += 1
+        start = time.time()
+        config = ConfigPathBuilder.build(study_path)
+        deps = ConfigPathBuilder.dependencies(config)
+        signature = StudyConfigCache._signature(deps)
+
+        # a file modified while building may be read before its last
+        # write, so don't trust config if its sources are too recent
+        if all(s is None or s[0] < start * 1e9 for s in signature):
+            with self._lock:
+                self._entries[study_path] = (signature, config)
+        else:
+            logger.debug(f"Study {study_path} modified while building config")
+        return config
+
+    def invalidate(self, study_path: Path) -> None:
+        with self._lock:
+            self._entries.pop(study_path, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _signature(paths: List[Path]) -> SIGNATURE:
+        def stat(path: Path) -> Optional[Tuple[int, int]]:
+            try:
+                st = path.stat()
+                return st.st_mtime_ns, st.st_size
+            except OSError:
+                return None
+
+        return tuple(stat(path) for path in paths)
@@ -1,12 +1,17 @@
+import json
+import logging
+import os
 import re
+import time
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
 
 from antarest.storage.repository.antares_io.reader import (
     IniReader,
     SetsIniReader,
 )
 from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
 from antarest.storage.repository.filesystem.config.model import (
     StudyConfig,
     Area,
@@ -16,6 +21,11 @@ from antarest.storage.repository.filesystem.config.model import (
     transform_name_to_id,
 )
 
+logger = logging.getLogger(__name__)
+
+# outputs registry, next to output folder so writing it leaves folder mtime
+OUTPUT_REGISTRY = ".outputs.json"
+
 
 class ConfigPathBuilder:
     @staticmethod
@@ -31,6 +41,28 @@ class ConfigPathBuilder:
             store_new_set=sns,
         )
 
+    @staticmethod
+    def dependencies(config: StudyConfig) -> List[Path]:
+        """
+        List files and folders read by build() to produce this config.
+        """
+        root = config.root_path
+        paths = [
+            root / "settings/generaldata.ini",
+            root / "input/areas/list.txt",
+            root / "input/areas/sets.ini",
+            root / "input/bindingconstraints/bindingconstraints.ini",
+            root / "output",
+            root / OUTPUT_REGISTRY,
+        ]
+        for area in config.areas:
+            paths += [
+                root / f"input/links/{area}/properties.ini",
+                root / f"input/thermal/clusters/{area}/list.ini",
+                root / f"input/areas/{area}/optimization.ini",
+            ]
+        return paths
+
     @staticmethod
     def _parse_parameters(path: Path) -> Tuple[bool]:
         general = IniReader().read(path / "settings/generaldata.ini")
@@ -63,15 +95,7 @@ class ConfigPathBuilder:
 
     @staticmethod
     def _parse_outputs(root: Path) -> Dict[int, Simulation]:
-        if not (root / "output").exists():
-            return {}
-
-        files = sorted((root / "output").iterdir())
-        return {
-            i + 1: ConfigPathBuilder.parse_simulation(f)
-            for i, f in enumerate(files)
-            if (f / "about-the-study").exists()
-        }
+        return OutputRegistry(root).load()
 
     @staticmethod
     def parse_simulation(path: Path) -> "Simulation":
@@ -144,3 +168,134 @@ class ConfigPathBuilder:
             root / f"input/areas/{area}/optimization.ini"
         )["filtering"]["filter-year-by-year"]
         return Link.split(filters)
+
+
+# mtimes of files read by parse_simulation, tell if an output changed
+Stamp = Tuple[Optional[int], ...]
+Entries = Dict[str, Tuple[Optional[Simulation], Stamp]]
+
+SIMULATION_FILES = ["checkIntegrity.txt", "about-the-study/parameters.ini"]
+
+
+class OutputRegistry:
+    """
+    Simulations of output folder, saved in a json file next to it. File is
+    trusted while output folder mtime is unchanged, otherwise only new
+    folders are parsed. Outputs modified in place (ex: at end of a run)
+    are found by refresh from mtimes of their files.
+    """
+
+    VERSION = 2
+
+    def __init__(self, study_path: Path):
+        self.output_path = study_path / "output"
+        self.path = study_path / OUTPUT_REGISTRY
+
+    def load(self) -> Dict[int, Simulation]:
+        _, entries = self._sync()
+        # output ids are positions in output folder, like antares does
+        return {
+            i + 1: simulation
+            for i, (_, (simulation, _)) in enumerate(sorted(entries.items()))
+            if simulation
+        }
+
+    def refresh(self) -> None:
+        self._sync(check=True)
+
+    def update(self, name: str) -> None:
+        mtime, entries = self._sync()
+        if (self.output_path / name).exists():
+            entries[name] = self._entry(name)
+        else:
+            entries.pop(name, None)
+        self._write(mtime, entries)
+
+    def remove(self, name: str) -> None:
+        mtime, entries = self._sync()
+        if entries.pop(name, None) is not None:
+            self._write(mtime, entries)
+
+    def _sync(self, check: bool = False) -> Tuple[Optional[int], Entries]:
+        try:
+            mtime = self.output_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None, {}
+
+        saved_mtime, saved = self._read()
+        if saved_mtime == mtime and not check:
+            # folders may become simulations after being listed
+            for name, (simulation, _) in list(saved.items()):
+                if not simulation:
+                    saved[name] = self._entry(name)
+            return mtime, saved
+
+        start = time.time()
+        entries: Entries = {}
+        for name in os.listdir(self.output_path):
+            stamp = self._stamp(name) if check else None
+            if name in saved and (stamp is None or saved[name][1] == stamp):
+                entries[name] = saved[name]
+            else:
+                entries[name] = self._entry(name, stamp)
+        # an update in same mtime tick would be missed next time
+        changed = saved_mtime != mtime or entries != saved
+        if changed and (check or mtime < start * 1e9 - 1e9):
+            self._write(mtime, entries)
+        return mtime, entries
+
+    def _entry(
+        self, name: str, stamp: Optional[Stamp] = None
+    ) -> Tuple[Optional[Simulation], Stamp]:
+        # stamp taken before parsing, a change while parsing is seen later
+        stamp = stamp or self._stamp(name)
+        return self._parse(name), stamp
+
+    def _stamp(self, name: str) -> Stamp:
+        def mtime(file: str) -> Optional[int]:
+            try:
+                return (self.output_path / name / file).stat().st_mtime_ns
+            except OSError:
+                return None
+
+        return tuple(mtime(file) for file in SIMULATION_FILES)
+
+    def _parse(self, name: str) -> Optional[Simulation]:
+        path = self.output_path / name
+        if not (path / "about-the-study").exists():
+            return None
+        return ConfigPathBuilder.parse_simulation(path)
+
+    def _read(self) -> Tuple[Optional[int], Entries]:
+        try:
+            data = json.loads(self.path.read_text())
+            if data["version"] != OutputRegistry.VERSION:
+                return None, {}
+            return data["mtime"], {
+                name: (
+                    Simulation(**sim) if sim else None,
+                    tuple(data["stamps"][name]),
+                )
+                for name, sim in data["outputs"].items()
+            }
+        except (OSError, ValueError, KeyError, TypeError):
+            return None, {}
+
+    def _write(self, mtime: Optional[int], entries: Entries) -> None:
+        data = {
+            "version": OutputRegistry.VERSION,
+            "mtime": mtime,
+            "outputs": {
+                name: sim.__dict__ if sim else None
+                for name, (sim, _) in sorted(entries.items())
+            },
+            "stamps": {
+                name: list(stamp)
+                for name, (_, stamp) in sorted(entries.items())
+            },
+        }
+        try:
+            with atomic_write(self.path) as file:
+                json.dump(data, file)
+        except OSError as e:
+            logger.warning(f"Can't save outputs registry {self.path}: {e}")
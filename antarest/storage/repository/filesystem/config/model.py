@@ -96,7 +96,7 @@ class StudyConfig(DTO):
         self.bindings = bindings or list()
         self.store_new_set = store_new_set
 
-    def next_file(self, name: str) -> "StudyConfig":
+    def copy(self) -> "StudyConfig":
         copy = StudyConfig(
             self.root_path,
             self.areas,
@@ -105,6 +105,11 @@ class StudyConfig(DTO):
             self.bindings,
             self.store_new_set,
         )
+        copy.path = self.path
+        return copy
+
+    def next_file(self, name: str) -> "StudyConfig":
+        copy = self.copy()
         copy.path = self.path / name
         return copy
 
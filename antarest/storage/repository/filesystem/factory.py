@@ -1,9 +1,10 @@
+import threading
 from pathlib import Path
-from typing import Tuple
+from typing import Tuple, Optional, Dict
 
 from antarest.common.custom_types import JSON
-from antarest.storage.repository.filesystem.config.files import (
-    ConfigPathBuilder,
+from antarest.storage.repository.filesystem.config.cache import (
+    StudyConfigCache,
 )
 from antarest.storage.repository.filesystem.config.json import (
     ConfigJsonBuilder,
@@ -13,9 +14,20 @@ from antarest.storage.repository.filesystem.root.study import Study
 
 
 class StudyFactory:
+    def __init__(self, cache: Optional[StudyConfigCache] = None) -> None:
+        self.cache = cache or StudyConfigCache()
+        self._studies: Dict[Path, Study] = dict()
+        self._lock = threading.Lock()
+
     def create_from_fs(self, path: Path) -> Tuple[StudyConfig, Study]:
-        config = ConfigPathBuilder.build(path)
-        return config, Study(config)
+        config = self.cache.get(path)
+        with self._lock:
+            # tree is kept as long as config is still valid in cache
+            study = self._studies.get(path)
+            if study is None or study.config is not config:
+                study = Study(config)
+                self._studies[path] = study
+        return config.copy(), study
 
     def create_from_config(self, config: StudyConfig) -> Study:
         return Study(config)
@@ -25,3 +37,8 @@ class StudyFactory:
     ) -> Tuple[StudyConfig, Study]:
         config = ConfigJsonBuilder.build(path, json)
         return config, Study(config)
+
+    def invalidate(self, path: Path) -> None:
+        self.cache.invalidate(path)
+        with self._lock:
+            self._studies.pop(path, None)
@@ -0,0 +1,55 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class FanOut:
+    """
+    Bounded thread pool resolving children selected together by an url
+    (ex: * or a,b,c). Selections nested inside a pool task run serially in
+    that task, so tasks never wait for pool slots held by their parents.
+    """
+
+    DEFAULT_WORKERS = 8
+
+    def __init__(self, workers: int = DEFAULT_WORKERS):
+        self.workers = workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def map(self, function: Callable[[T], R], items: List[T]) -> List[R]:
+        if (
+            self.workers <= 1
+            or len(items) < 2
+            or getattr(self._local, "in_task", False)
+        ):
+            return [function(item) for item in items]
+
+        def task(item: T) -> R:
+            self._local.in_task = True
+            try:
+                return function(item)
+            finally:
+                self._local.in_task = False
+
+        return list(self._get_pool().map(task, items))
+
+    def resize(self, workers: int) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+            self.workers = workers
+        if pool:
+            pool.shutdown(wait=False)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(self.workers)
+            return self._pool
+
+
+fanout = FanOut()
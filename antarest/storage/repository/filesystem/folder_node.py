@@ -3,6 +3,7 @@ from typing import List, Optional, Tuple
 
 from antarest.common.custom_types import JSON
 from antarest.storage.repository.filesystem.config.model import StudyConfig
+from antarest.storage.repository.filesystem.fanout import fanout
 from antarest.storage.repository.filesystem.inode import INode, TREE
 
 
@@ -17,13 +18,21 @@ class ChildNotFoundError(Exception):
 class FolderNode(INode[JSON, JSON, JSON], ABC):
     def __init__(self, config: StudyConfig) -> None:
         self.config = config
+        self._children: Optional[TREE] = None
 
     @abstractmethod
     def build(self, config: StudyConfig) -> TREE:
         pass
 
+    def get_children(self) -> TREE:
+        # children only depend on config: build them on first access and
+        # keep them for next calls
+        if self._children is None:
+            self._children = self.build(self.config)
+        return self._children
+
     def get(self, url: Optional[List[str]] = None, depth: int = -1) -> JSON:
-        children = self.build(self.config)
+        children = self.get_children()
 
         if url and url != [""]:
             names, sub_url = self.extract_child(children, url)
@@ -32,10 +41,11 @@ class FolderNode(INode[JSON, JSON, JSON], ABC):
                     sub_url, depth=depth
                 )
             else:
-                return {
-                    key: children[key].get(sub_url, depth=depth)
-                    for key in names
-                }
+
+                def get(key: str) -> JSON:
+                    return children[key].get(sub_url, depth=depth)  # type: ignore
+
+                return dict(zip(names, fanout.map(get, names)))
 
         else:
             if depth == 0:
@@ -47,7 +57,7 @@ class FolderNode(INode[JSON, JSON, JSON], ABC):
             return json
 
     def save(self, data: JSON, url: Optional[List[str]] = None) -> None:
-        children = self.build(self.config)
+        children = self.get_children()
         url = url or []
 
         if url:
@@ -65,7 +75,7 @@ class FolderNode(INode[JSON, JSON, JSON], ABC):
         url: Optional[List[str]] = None,
         raising: bool = False,
     ) -> List[str]:
-        children = self.build(self.config)
+        children = self.get_children()
 
         if url and url != [""]:
             (name,), sub_url = self.extract_child(children, url)
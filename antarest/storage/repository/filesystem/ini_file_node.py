@@ -8,6 +8,7 @@ from antarest.storage.repository.antares_io.writer.ini_writer import IniWriter
 from antarest.common.custom_types import JSON, SUB_JSON
 from antarest.storage.repository.filesystem.config.model import StudyConfig
 from antarest.storage.repository.filesystem.inode import INode, TREE
+from antarest.storage.repository.filesystem.validator import IniValidator
 
 
 class IniReaderError(Exception):
@@ -26,6 +27,7 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
         self.types = types
         self.reader = reader or IniReader()
         self.writer = IniWriter()
+        self._validator: Optional[IniValidator] = None
 
     def build(self, config: StudyConfig) -> TREE:
         pass  # end node has nothing to build
@@ -50,14 +52,19 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
 
     def save(self, data: SUB_JSON, url: Optional[List[str]] = None) -> None:
         url = url or []
-        json = self.reader.read(self.path) if self.path.exists() else {}
+        exists = self.path.exists()
+        json = self.reader.read(self.path) if exists else {}
         if len(url) == 2:
             json[url[0]][url[1]] = data
         elif len(url) == 1:
             json[url[0]] = data
         else:
             json = cast(JSON, data)
-        self.writer.write(json, self.path)
+
+        if url and exists and isinstance(self.reader, IniReader):
+            self.writer.update(json, self.path, *url)
+        else:
+            self.writer.write(json, self.path)
 
     def check_errors(
         self,
@@ -65,37 +72,6 @@ class IniFileNode(INode[SUB_JSON, SUB_JSON, JSON]):
         url: Optional[List[str]] = None,
         raising: bool = False,
     ) -> List[str]:
-        errors = list()
-        for section, params in self.types.items():
-            if section not in data:
-                msg = f"section {section} not in {self.__class__.__name__}"
-                if raising:
-                    raise ValueError(msg)
-                errors.append(msg)
-            else:
-                self._validate_param(
-                    section, params, data[section], errors, raising
-                )
-
-        return errors
-
-    def _validate_param(
-        self,
-        section: str,
-        params: Any,
-        data: JSON,
-        errors: List[str],
-        raising: bool,
-    ) -> None:
-        for param, typing in params.items():
-            if param not in data:
-                msg = f"param {param} of section {section} not in {self.__class__.__name__}"
-                if raising:
-                    raise ValueError(msg)
-                errors.append(msg)
-            else:
-                if not isinstance(data[param], typing):
-                    msg = f"param {param} of section {section} in {self.__class__.__name__} bad type"
-                    if raising:
-                        raise ValueError(msg)
-                    errors.append(msg)
+        if self._validator is None:
+            self._validator = IniValidator(self.__class__.__name__, self.types)
+        return self._validator.validate(data, raising)
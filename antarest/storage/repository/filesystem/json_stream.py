@@ -0,0 +1,117 @@
+"""
+Serialize a study tree to JSON text while walking it, one node at a
+time, with the same result as json.dumps(node.get(url, depth)).
+"""
+import json
+from typing import Any, Callable, Iterator, List, Optional, Tuple, cast
+
+from antarest.common.custom_types import SUB_JSON
+from antarest.storage.repository.filesystem.folder_node import FolderNode
+from antarest.storage.repository.filesystem.inode import INode
+
+Node = INode[Any, Any, Any]
+Transform = Callable[[SUB_JSON], SUB_JSON]
+
+
+def is_walkable(node: Node) -> bool:
+    # folders with their own get (ex: buckets) are serialized whole
+    return isinstance(node, FolderNode) and type(node).get is FolderNode.get
+
+
+def resolve(node: Node, url: Optional[List[str]]) -> Tuple[Node, List[str]]:
+    """
+    Follow url while it selects a single child, so url errors are raised
+    before anything is serialized.
+    """
+    parts = url or []
+    while is_walkable(node) and parts and parts != [""]:
+        folder = cast(FolderNode, node)
+        children = folder.get_children()
+        names, sub_url = folder.extract_child(children, parts)
+        if len(names) > 1:
+            break
+        node, parts = children[names[0]], sub_url
+    return node, parts
+
+
+def encode(
+    node: Node,
+    url: Optional[List[str]] = None,
+    depth: int = -1,
+    transform: Optional[Transform] = None,
+) -> Iterator[str]:
+    members = _members(node, url or [], depth)
+    if members is None:
+        data = node.get(url, depth=depth)
+        yield from json.JSONEncoder().iterencode(
+            transform(data) if transform else data
+        )
+        return
+
+    yield "{"
+    for i, (name, child, sub_url, sub_depth) in enumerate(members):
+        yield f"{', ' if i else ''}{json.dumps(name)}: "
+        if sub_depth is None:
+            yield "{}"
+        else:
+            yield from encode(child, sub_url, sub_depth, transform)
+    yield "}"
+
+
+def encode_lines(
+    node: Node, url: Optional[List[str]] = None, depth: int = -1
+) -> Iterator[str]:
+    """
+    NDJSON: one {name: value} line per member of selected node, or a
+    single line if selected node is not a folder.
+    """
+    node, url = resolve(node, url)
+    members = _members(node, url, depth)
+    if members is None:
+        yield from encode(node, url, depth)
+        yield "\n"
+        return
+
+    for name, child, sub_url, sub_depth in members:
+        yield f"{{{json.dumps(name)}: "
+        if sub_depth is None:
+            yield "{}"
+        else:
+            yield from encode(child, sub_url, sub_depth)
+        yield "}\n"
+
+
+def join(fragments: Iterator[str], size: int) -> Iterator[bytes]:
+    """
+    Group text fragments into encoded chunks of about size bytes.
+    """
+    buffer: List[str] = []
+    length = 0
+    for fragment in fragments:
+        buffer.append(fragment)
+        length += len(fragment)
+        if length >= size:
+            yield "".join(buffer).encode()
+            buffer, length = [], 0
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def _members(
+    node: Node, url: List[str], depth: int
+) -> Optional[List[Tuple[str, Node, List[str], Optional[int]]]]:
+    # same walk as FolderNode.get, None when node is serialized whole and
+    # member depth None when member is cut to {}
+    if not is_walkable(node):
+        return None
+    folder = cast(FolderNode, node)
+    children = folder.get_children()
+    if url and url != [""]:
+        names, sub_url = folder.extract_child(children, url)
+        if len(names) == 1:
+            return _members(children[names[0]], sub_url, depth)
+        return [(name, children[name], sub_url, depth) for name in names]
+    if depth == 0:
+        return []
+    sub_depth = depth - 1 if depth - 1 != 0 else None
+    return [(name, child, [], sub_depth) for name, child in children.items()]
@@ -1,6 +1,8 @@
-import shutil
 from typing import List, Optional
 
+from antarest.storage.repository.antares_io.writer.matrix_writer import (
+    MatrixWriter,
+)
 from antarest.storage.repository.filesystem.config.model import StudyConfig
 from antarest.storage.repository.filesystem.inode import INode, TREE
 
@@ -30,7 +32,7 @@ class RawFileNode(INode[str, str, str]):
 
         if path != self.config.path:
             self.config.path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copyfile(path, self.config.path)
+            MatrixWriter().write(path, self.config.path)
 
     def check_errors(
         self, data: str, url: Optional[List[str]] = None, raising: bool = False
@@ -0,0 +1,96 @@
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+
+class StudyRegistry:
+    """
+    Index of studies (folders with a study.antares file) found in studies
+    directory. Directory is scanned again only when its mtime changes, and
+    then only new entries are checked. Service operations update it
+    directly with add and remove. Directory modified while scanned is
+    scanned again on next call.
+    """
+
+    def __init__(self, path_to_studies: Path) -> None:
+        self.path_to_studies = path_to_studies
+        self._studies: Set[str] = set()
+        self._others: Set[str] = set()  # entries without study.antares
+        self._version: Optional[Tuple[int, int]] = None
+        self._sorted: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    def contains(self, uuid: str) -> bool:
+        self._refresh()
+        with self._lock:
+            if uuid in self._studies:
+                return True
+        # study may have been filled after its folder was scanned
+        if StudyRegistry._is_name(uuid) and self._is_study(uuid):
+            self.add(uuid)
+            return True
+        return False
+
+    def uuids(self) -> List[str]:
+        self._refresh()
+        with self._lock:
+            others = list(self._others)
+        for name in others:
+            if self._is_study(name):
+                self.add(name)
+        with self._lock:
+            if self._sorted is None:
+                self._sorted = sorted(self._studies)
+            return list(self._sorted)
+
+    def add(self, uuid: str) -> None:
+        with self._lock:
+            self._others.discard(uuid)
+            if uuid not in self._studies:
+                self._studies.add(uuid)
+                self._sorted = None
+
+    def remove(self, uuid: str) -> None:
+        with self._lock:
+            self._others.discard(uuid)
+            if uuid in self._studies:
+                self._studies.remove(uuid)
+                self._sorted = None
+
+    def _refresh(self) -> None:
+        st = self.path_to_studies.stat()
+        version = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if version == self._version:
+                return
+
+        start = time.time()
+        names = set(os.listdir(str(self.path_to_studies)))
+        st = self.path_to_studies.stat()
+        with self._lock:
+            known = self._studies | self._others
+        found = {
+            name: self._is_study(name) for name in names if name not in known
+        }
+
+        with self._lock:
+            self._studies &= names
+            self._others &= names
+            self._studies |= {name for name, study in found.items() if study}
+            self._others |= {
+                name for name, study in found.items() if not study
+            }
+            self._sorted = None
+            # an entry added in the same mtime tick after listing would be
+            # missed for good, so don't trust too recent directory
+            fresh = st.st_mtime_ns >= start * 1e9
+            self._version = None if fresh else (st.st_mtime_ns, st.st_size)
+
+    @staticmethod
+    def _is_name(uuid: str) -> bool:
+        return uuid not in ("", ".", "..") and os.sep not in uuid
+
+    def _is_study(self, name: str) -> bool:
+        return (self.path_to_studies / name / "study.antares").is_file()
@@ -0,0 +1,93 @@
+from typing import Any, Dict, Iterator, List, Tuple, cast
+
+from antarest.common.custom_types import JSON
+from antarest.storage.repository.filesystem.fanout import fanout
+from antarest.storage.repository.filesystem.folder_node import FolderNode
+from antarest.storage.repository.filesystem.json_stream import is_walkable
+from antarest.storage.repository.filesystem.inode import INode
+
+Node = INode[Any, Any, Any]
+Params = Tuple[Tuple[str, ...], Tuple[Any, ...], frozenset]
+
+
+class IniValidator:
+    """
+    Types of an ini file compiled once into tuples. Sections with all
+    params present and well typed are checked by builtins in one pass,
+    only faulty sections are walked param by param to report errors.
+    """
+
+    def __init__(self, name: str, types: Dict[str, Any]):
+        self.name = name
+        # sections often share one params dict (ex: one per link)
+        compiled: Dict[int, Params] = dict()
+        self.sections: List[Tuple[str, Params]] = list()
+        for section, params in types.items():
+            if id(params) not in compiled:
+                compiled[id(params)] = (
+                    tuple(params.keys()),
+                    tuple(params.values()),
+                    frozenset(params.keys()),
+                )
+            self.sections.append((section, compiled[id(params)]))
+
+    def validate(self, data: JSON, raising: bool = False) -> List[str]:
+        errors: List[str] = list()
+        for section, (names, types, required) in self.sections:
+            if section not in data:
+                self._error(
+                    f"section {section} not in {self.name}", errors, raising
+                )
+                continue
+            values = data[section]
+            if (
+                isinstance(values, dict)
+                and values.keys() >= required
+                and all(map(isinstance, map(values.__getitem__, names), types))
+            ):
+                continue
+            for param, typing in zip(names, types):
+                if param not in values:
+                    self._error(
+                        f"param {param} of section {section} not in {self.name}",
+                        errors,
+                        raising,
+                    )
+                elif not isinstance(values[param], typing):
+                    self._error(
+                        f"param {param} of section {section} in {self.name} bad type",
+                        errors,
+                        raising,
+                    )
+        return errors
+
+    @staticmethod
+    def _error(msg: str, errors: List[str], raising: bool) -> None:
+        if raising:
+            raise ValueError(msg)
+        errors.append(msg)
+
+
+def check_tree(node: Node, raising: bool = False) -> List[str]:
+    """
+    Same errors, in same order, as node.check_errors(node.get()) but each
+    end node checks its own content, in parallel, without building the
+    whole study json.
+    """
+
+    def check(leaf: Node) -> List[str]:
+        return leaf.check_errors(leaf.get(), raising=raising)
+
+    return [
+        error
+        for errors in fanout.map(check, list(_leaves(node)))
+        for error in errors
+    ]
+
+
+def _leaves(node: Node) -> Iterator[Node]:
+    if not is_walkable(node):
+        yield node
+        return
+    for child in cast(FolderNode, node).get_children().values():
+        yield from _leaves(child)
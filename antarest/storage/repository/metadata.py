@@ -1,17 +1,24 @@
-from typing import Optional, List
+from typing import Dict, Optional, List, Set
 
+from sqlalchemy import and_  # type: ignore
 from sqlalchemy.orm import Session  # type: ignore
 
-from antarest.storage.model import Metadata
+from antarest.storage.model import Metadata, users_metadata
 
 
 class StudyMetadataRepository:
+    CHUNK_SIZE = 500  # SQLite binds up to 999 parameters
+
     def __init__(self, session: Session) -> None:
         self.session = session
 
     def save(self, metadata: Metadata) -> Metadata:
-        metadata.users = [self.session.merge(u) for u in metadata.users]
-        self.session.add(metadata)
+        """
+        Insert or replace row, users given are the whole study users.
+        """
+        users = [self.session.merge(u) for u in metadata.users]
+        metadata = self.session.merge(metadata)
+        metadata.users = users
         self.session.commit()
         return metadata
 
@@ -19,9 +26,74 @@ class StudyMetadataRepository:
         metadata: Metadata = self.session.query(Metadata).get(id)
         return metadata
 
-    def get_all(self) -> List[Metadata]:
-        metadatas: List[Metadata] = self.session.query(Metadata).all()
-        return metadatas
+    def get_ids(self) -> Set[str]:
+        return {id for id, in self.session.query(Metadata.id).all()}
+
+    def get_all(
+        self,
+        order_by: Optional[str] = None,
+        descending: bool = False,
+        ids: Optional[List[str]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[Metadata]:
+        """
+        Rows sorted by order_by column, empty values last (first when
+        descending), then by id. Only rows of ids if given.
+        """
+        order = []
+        if order_by:
+            column = getattr(Metadata, order_by)
+            empty = column.is_(None)
+            order = [
+                empty.desc() if descending else empty,
+                column.desc() if descending else column,
+            ]
+        order.append(Metadata.id)
+
+        if ids is None:
+            query = self.session.query(Metadata).order_by(*order)
+            metadatas: List[Metadata] = query.offset(offset).limit(limit).all()
+            return metadatas
+
+        # ids can be more than bound parameters allowed by SQLite: filter
+        # sorted ids, then load page rows by chunks
+        wanted = set(ids)
+        page = [
+            id
+            for id, in self.session.query(Metadata.id).order_by(*order)
+            if id in wanted
+        ][offset : None if limit is None else offset + limit]
+        rows: Dict[str, Metadata] = {}
+        for i in range(0, len(page), StudyMetadataRepository.CHUNK_SIZE):
+            chunk = page[i : i + StudyMetadataRepository.CHUNK_SIZE]
+            query = self.session.query(Metadata)
+            rows.update(
+                (md.id, md) for md in query.filter(Metadata.id.in_(chunk))
+            )
+        return [rows[id] for id in page]
+
+    def get_access(self, user_id: int) -> Dict[str, bool]:
+        """
+        Tell for every study in db if user can access it, in one query.
+        """
+        rows = (
+            self.session.query(
+                Metadata.id, Metadata.public, users_metadata.c.user_id
+            )
+            .outerjoin(
+                users_metadata,
+                and_(
+                    users_metadata.c.metadata_id == Metadata.id,
+                    users_metadata.c.user_id == user_id,
+                ),
+            )
+            .all()
+        )
+        access: Dict[str, bool] = {}
+        for id, public, user in rows:
+            access[id] = access.get(id, False) or public or user is not None
+        return access
 
     def delete(self, id: str) -> None:
         u: Metadata = self.session.query(Metadata).get(id)
@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+from sqlalchemy.orm import Session  # type: ignore
+
+from antarest.storage.model import Task, TaskStatus
+
+
+class TaskRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def save(self, task: Task) -> Task:
+        task = self.session.merge(task)
+        self.session.commit()
+        return task
+
+    def get(self, id: str) -> Optional[Task]:
+        task: Task = self.session.query(Task).get(id)
+        return task
+
+    def find_by_status(self, *statuses: TaskStatus) -> List[Task]:
+        tasks: List[Task] = (
+            self.session.query(Task).filter(Task.status.in_(statuses)).all()
+        )
+        return tasks
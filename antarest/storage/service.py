@@ -1,21 +1,41 @@
 import logging
+from contextlib import contextmanager
 from datetime import datetime
-from io import BytesIO
 from pathlib import Path
-from typing import List, IO, Optional
+from typing import Iterator, List, IO, Optional
+from uuid import uuid4
 
 import werkzeug
 
 from antarest.common.custom_types import JSON
+from antarest.common.worker import is_running, worker
 from antarest.login.model import User, Role
 from antarest.storage.business.exporter_service import ExporterService
 from antarest.storage.business.importer_service import ImporterService
 from antarest.common.requests import (
     RequestParameters,
 )
+from antarest.storage.business.storage_service_utils import (
+    StorageServiceUtils,
+)
 from antarest.storage.business.study_service import StudyService
-from antarest.storage.model import Metadata, StudyContentStatus
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    Matrix,
+    MatrixQuery,
+)
+from antarest.storage.business.task_runner import TaskRunner
+from antarest.storage.model import (
+    Metadata,
+    StudyContentStatus,
+    Task,
+    TaskStatus,
+)
+from antarest.storage.repository.antares_io.exporter.export_file import (
+    Exporter,
+)
 from antarest.storage.repository.metadata import StudyMetadataRepository
+from antarest.storage.repository.task import TaskRepository
+from antarest.storage.web.exceptions import TaskNotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +44,16 @@ class UserHasNotPermissionError(werkzeug.exceptions.Forbidden):
     pass
 
 
+# fields of study.antares served by study listing, with their db column
+STUDY_INFO_COLUMNS = {
+    "author": "author",
+    "caption": "name",
+    "created": "created_at",
+    "lastsave": "updated_at",
+    "version": "version",
+}
+
+
 class StorageService:
     def __init__(
         self,
@@ -31,45 +61,175 @@ class StorageService:
         importer_service: ImporterService,
         exporter_service: ExporterService,
         repository: StudyMetadataRepository,
+        task_repository: Optional[TaskRepository] = None,
+        task_runner: Optional[TaskRunner] = None,
     ):
         self.study_service = study_service
         self.importer_service = importer_service
         self.exporter_service = exporter_service
         self.repository = repository
+        self.task_repository = task_repository or TaskRepository(
+            session=repository.session
+        )
+        self.task_runner = task_runner or TaskRunner()
 
     def get(self, route: str, depth: int, params: RequestParameters) -> JSON:
         uuid, _, _ = self.study_service.extract_info_from_url(route)
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
 
         return self.study_service.get(route, depth)
 
+    def get_stream(
+        self,
+        route: str,
+        depth: int,
+        params: RequestParameters,
+        lines: bool = False,
+    ) -> Iterator[bytes]:
+        uuid, _, _ = self.study_service.extract_info_from_url(route)
+        self._check_user_permission(params, uuid)
+
+        return self.study_service.get_stream(route, depth, lines)
+
+    def get_matrix(
+        self,
+        route: str,
+        params: RequestParameters,
+        query: Optional[MatrixQuery] = None,
+    ) -> Matrix:
+        uuid, _, _ = self.study_service.extract_info_from_url(route)
+        self._check_user_permission(params, uuid)
+
+        return self.study_service.get_matrix(route, query)
+
+    def get_mc_statistics(
+        self,
+        uuid: str,
+        output_id: str,
+        item: str,
+        column: str,
+        percentiles: List[float],
+        params: RequestParameters,
+    ) -> JSON:
+        self._check_user_permission(params, uuid)
+        return self.study_service.get_mc_statistics(
+            uuid, output_id, item, column, percentiles
+        )
+
     def _get_study_uuids(self, params: RequestParameters) -> List[str]:
         uuids = self.study_service.get_study_uuids()
+        if params.user and params.user.role != Role.ADMIN:
+            access = self.repository.get_access(params.user.id)
+            for uuid in uuids:
+                if uuid not in access:
+                    logger.warning(f"Study {uuid} not found in metadata db")
+                params.permissions[uuid] = access.get(uuid, False)
         return [
             uuid
             for uuid in uuids
-            if self._check_user_permission(params.user, uuid, raising=False)
+            if self._check_user_permission(params, uuid, raising=False)
         ]
 
-    def get_studies_information(self, params: RequestParameters) -> JSON:
+    def get_studies_information(
+        self,
+        params: RequestParameters,
+        sort: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        fields: Optional[List[str]] = None,
+    ) -> JSON:
+        """
+        List studies from metadata db, sorted and paged by db on one of
+        STUDY_INFO_COLUMNS (descending if prefixed by "-"). Studies unknown
+        by db are registered first, without owner, then study.antares is
+        only read for studies of requested page modified since last read.
+        """
+        descending = bool(sort and sort.startswith("-"))
+        sort = sort.lstrip("-") if sort else None
         uuids = self._get_study_uuids(params)
+
+        known = self.repository.get_ids()
+        for uuid in uuids:
+            if uuid not in known:
+                self._register_study(uuid)
+
+        page = self.repository.get_all(
+            STUDY_INFO_COLUMNS[sort] if sort else None,
+            descending,
+            ids=uuids,
+            offset=offset,
+            limit=limit,
+        )
+
+        result = {}
+        for md in page:
+            mtime = self.study_service.get_study_info_mtime(md.id)
+            if md.info_mtime != mtime:
+                StorageService._update_metadata(
+                    md, self._read_info(md.id), mtime
+                )
+                self.repository.save(md)
+            info = StorageService._metadata_info(md)
+            if fields is not None:
+                info = {key: info[key] for key in fields if key in info}
+            result[md.id] = {"antares": info}
+        return result
+
+    def _register_study(self, uuid: str) -> None:
+        logger.info(f"Study {uuid} found on disk, add it to metadata db")
+        md = Metadata(id=uuid, users=[])
+        StorageService._update_metadata(
+            md,
+            self._read_info(uuid),
+            self.study_service.get_study_info_mtime(uuid),
+        )
+        self.repository.save(md)
+
+    def _read_info(self, uuid: str) -> JSON:
+        info: JSON = self.study_service.get_study_information(uuid)["antares"]
+        return info
+
+    @staticmethod
+    def _metadata_info(md: Metadata) -> JSON:
+        version = md.version
+        if isinstance(version, str) and version.isdigit():
+            version = int(version)
         return {
-            uuid: self.study_service.get_study_information(uuid)
-            for uuid in uuids
+            "author": md.author,
+            "caption": md.name,
+            "created": int(md.created_at.timestamp())
+            if md.created_at
+            else None,
+            "lastsave": int(md.updated_at.timestamp())
+            if md.updated_at
+            else None,
+            "version": version,
         }
 
+    @staticmethod
+    def _update_metadata(
+        md: Metadata, info: JSON, mtime: Optional[float]
+    ) -> None:
+        md.name = info["caption"]
+        md.version = info["version"]
+        md.author = info["author"]
+        md.created_at = datetime.fromtimestamp(info["created"])
+        md.updated_at = datetime.fromtimestamp(info["lastsave"])
+        md.info_mtime = mtime
+
     def get_study_information(
         self, uuid: str, params: RequestParameters
     ) -> JSON:
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         return self.study_service.get_study_information(uuid)
 
     def get_study_path(self, uuid: str, params: RequestParameters) -> Path:
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         return self.study_service.get_study_path(uuid)
 
     def create_study(self, study_name: str, params: RequestParameters) -> str:
-        uuid = self.study_service.create_study(study_name)
+        with self._new_study(params.user) as uuid:
+            self.study_service.create_study(study_name, uuid)
         self._save_metadata(uuid, params.user)
         return uuid
 
@@ -79,8 +239,9 @@ class StorageService:
         dest_study_name: str,
         params: RequestParameters,
     ) -> str:
-        self._check_user_permission(params.user, src_uuid)
-        uuid = self.study_service.copy_study(src_uuid, dest_study_name)
+        self._check_user_permission(params, src_uuid)
+        with self._new_study(params.user) as uuid:
+            self.study_service.copy_study(src_uuid, dest_study_name, uuid)
         self._save_metadata(uuid, params.user)
 
         return uuid
@@ -91,53 +252,162 @@ class StorageService:
         params: RequestParameters,
         compact: bool = False,
         outputs: bool = True,
-    ) -> BytesIO:
-        self._check_user_permission(params.user, uuid)
-        return self.exporter_service.export_study(uuid, compact, outputs)
+        level: int = Exporter.DEFAULT_LEVEL,
+    ) -> Iterator[bytes]:
+        self._check_user_permission(params, uuid)
+        return self.exporter_service.export_study(
+            uuid, compact, outputs, level
+        )
 
     def delete_study(self, uuid: str, params: RequestParameters) -> None:
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         self.study_service.delete_study(uuid)
 
     def delete_output(
         self, uuid: str, output_name: str, params: RequestParameters
     ) -> None:
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         self.study_service.delete_output(uuid, output_name)
 
     def upload_matrix(
         self, path: str, data: bytes, params: RequestParameters
     ) -> None:
         uuid, _, _ = self.study_service.extract_info_from_url(path)
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         self.importer_service.upload_matrix(path, data)
 
     def import_study(
-        self, stream: IO[bytes], params: RequestParameters
+        self,
+        stream: IO[bytes],
+        params: RequestParameters,
+        task: Optional[Task] = None,
     ) -> str:
-        uuid = self.importer_service.import_study(stream)
+        self._progress(task, "extract", 10)
+        with self._new_study(params.user) as uuid:
+            self.importer_service.import_study(stream, uuid)
+        if task:
+            task.study_id = uuid
+        self._progress(task, "validate", 60)
         status = (
             StudyContentStatus.ERROR
             if self.study_service.check_errors(uuid)
             else StudyContentStatus.VALID
         )
+        self._progress(task, "metadata", 90)
         self._save_metadata(uuid, params.user, content_status=status)
         return uuid
 
+    def import_study_async(
+        self, stream: IO[bytes], params: RequestParameters
+    ) -> Task:
+        """
+        Queue import of archive and give its task at once. Stream is owned
+        by the task, which closes it when done.
+        """
+        if not params.user:
+            raise UserHasNotPermissionError()
+
+        task = self.task_repository.save(
+            Task(
+                id=str(uuid4()),
+                action="import",
+                owner_id=params.user.id,
+                status=TaskStatus.PENDING,
+                progress=0,
+                worker=worker(),
+            )
+        )
+        self.task_runner.submit(self._run_import, task.id, stream, params)
+        return task
+
+    def get_task(self, id: str, params: RequestParameters) -> Task:
+        task = self.task_repository.get(id)
+        if not task:
+            raise TaskNotFoundError(f"Task {id} not found")
+        user = params.user
+        if not user or (user.role != Role.ADMIN and user.id != task.owner_id):
+            raise UserHasNotPermissionError()
+        return task
+
+    def fail_interrupted_tasks(self) -> None:
+        """
+        Tasks run in memory of the process which received them. Fail
+        pending or running tasks of processes not known to be running.
+        """
+        for task in self.task_repository.find_by_status(
+            TaskStatus.PENDING, TaskStatus.RUNNING
+        ):
+            if is_running(task.worker):
+                continue
+            task.status = TaskStatus.FAILED
+            task.msg = "Task interrupted by server restart"
+            task.completion_date = datetime.utcnow()
+            self.task_repository.save(task)
+
+    def _run_import(
+        self, id: str, stream: IO[bytes], params: RequestParameters
+    ) -> None:
+        task = self.get_task(id, params)
+        task.status = TaskStatus.RUNNING
+        try:
+            with stream:
+                self.import_study(stream, params, task)
+            task.status = TaskStatus.SUCCESS
+            task.step = "done"
+            task.progress = 100
+        except Exception as e:
+            logger.exception(f"Import task {id} failed")
+            task.status = TaskStatus.FAILED
+            task.msg = str(e)
+        task.completion_date = datetime.utcnow()
+        self.task_repository.save(task)
+
+    def _progress(
+        self, task: Optional[Task], step: str, progress: int
+    ) -> None:
+        if task:
+            task.step = step
+            task.progress = progress
+            self.task_repository.save(task)
+
     def import_output(
         self, uuid: str, stream: IO[bytes], params: RequestParameters
     ) -> JSON:
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         res = self.importer_service.import_output(uuid, stream)
         return res
 
+    def refresh_outputs(self, uuid: str) -> None:
+        """
+        Read outputs of study again, once a run has written its results.
+        """
+        self.study_service.refresh_outputs(uuid)
+
     def edit_study(
         self, route: str, new: JSON, params: RequestParameters
     ) -> JSON:
         uuid, _, _ = self.study_service.extract_info_from_url(route)
-        self._check_user_permission(params.user, uuid)
+        self._check_user_permission(params, uuid)
         return self.study_service.edit_study(route, new)
 
+    @contextmanager
+    def _new_study(self, user: Optional[User]) -> Iterator[str]:
+        """
+        Give uuid for a study to create. Its owner is saved in db before
+        study files are written, so that study is never registered without
+        owner by a listing running meanwhile.
+        """
+        if not user:
+            raise UserHasNotPermissionError
+
+        uuid = StorageServiceUtils.generate_uuid()
+        self.repository.save(Metadata(id=uuid, users=[user]))
+        try:
+            yield uuid
+        except Exception:
+            self.repository.delete(uuid)
+            raise
+
     def _save_metadata(
         self,
         uuid: str,
@@ -147,21 +417,22 @@ class StorageService:
         if not user:
             raise UserHasNotPermissionError
 
-        info = self.study_service.get_study_information(uuid)["antares"]
+        # overwrite row saved before creation or registered meanwhile
         meta = Metadata(
             id=uuid,
-            name=info["caption"],
-            version=info["version"],
-            author=info["author"],
-            created_at=datetime.fromtimestamp(info["created"]),
-            updated_at=datetime.fromtimestamp(info["lastsave"]),
             content_status=content_status,
             users=[user],
+            public=False,
+        )
+        StorageService._update_metadata(
+            meta,
+            self._read_info(uuid),
+            self.study_service.get_study_info_mtime(uuid),
         )
         self.repository.save(meta)
 
     def _check_user_permission(
-        self, user: Optional[User], uuid: str, raising: bool = True
+        self, params: RequestParameters, uuid: str, raising: bool = True
     ) -> bool:
         def check(user: Optional[User], uuid: str) -> None:
             if not user:
@@ -170,17 +441,24 @@ class StorageService:
             if user.role == Role.ADMIN:
                 return
 
+            if uuid in params.permissions:
+                if not params.permissions[uuid]:
+                    raise UserHasNotPermissionError()
+                return
+
             md = self.repository.get(uuid)
             if not md:
                 # TODO be sure we let any user access to an fantom study
                 logger.warning(f"Study {uuid} not found in metadata db")
+                params.permissions[uuid] = True
                 return
 
-            if user not in md.users:
+            params.permissions[uuid] = bool(md.public) or user in md.users
+            if not params.permissions[uuid]:
                 raise UserHasNotPermissionError()
 
         try:
-            check(user, uuid)
+            check(params.user, uuid)
             return True
         except Exception as e:
             if raising:
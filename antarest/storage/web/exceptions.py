@@ -9,6 +9,11 @@ class StudyNotFoundError(exceptions.NotFound):
         super().__init__(message)
 
 
+class TaskNotFoundError(exceptions.NotFound):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
 class StudyAlreadyExistError(exceptions.Conflict):
     def __init__(self, message: str) -> None:
         super().__init__(message)
@@ -24,6 +29,16 @@ class BadOutputError(exceptions.UnprocessableEntity):
         super().__init__(message)
 
 
+class MatrixFormatError(exceptions.UnprocessableEntity):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
+class BadMatrixQueryError(exceptions.BadRequest):
+    def __init__(self, message: str) -> None:
+        super().__init__(message)
+
+
 class BadZipBinary(exceptions.UnsupportedMediaType):
     def __init__(self, message: str) -> None:
         super().__init__(message)
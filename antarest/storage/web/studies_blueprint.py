@@ -1,25 +1,68 @@
 import io
 import json
+import os
+import tempfile
 from http import HTTPStatus
-from typing import Any
+from typing import Any, IO, Optional, cast
 
+import numpy as np
 from flask import (
     escape,
     jsonify,
     request,
     send_file,
     Blueprint,
+    Response,
 )
+from werkzeug.datastructures import FileStorage
 from werkzeug.exceptions import BadRequest
 
 from antarest.login.auth import Auth
 from antarest.common.config import Config
-from antarest.storage.service import StorageService
+from antarest.storage.repository.antares_io.exporter.export_file import (
+    Exporter,
+)
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    MatrixQuery,
+)
+from antarest.storage.service import STUDY_INFO_COLUMNS, StorageService
 from antarest.common.requests import (
     RequestParameters,
 )
 
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def spool_upload(file: FileStorage) -> IO[bytes]:
+    """
+    Give uploaded content as a file on disk, copied by chunks if werkzeug
+    kept it in memory, so archives are never fully loaded in memory.
+    """
+    stream = file.stream
+    try:
+        stream.fileno()
+        stream.seek(0)
+        return cast(IO[bytes], stream)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        spool = tempfile.TemporaryFile()
+        file.save(spool, buffer_size=UPLOAD_CHUNK_SIZE)
+        spool.seek(0)
+        return spool
+
+
+def detach_upload(file: FileStorage) -> IO[bytes]:
+    """
+    Same as spool_upload but file stays readable once request is over, for
+    background tasks. Caller has to close it.
+    """
+    spool = spool_upload(file)
+    if spool is file.stream:
+        spool = os.fdopen(os.dup(spool.fileno()), "rb")
+        spool.seek(0)
+    return spool
+
+
 def sanitize_uuid(uuid: str) -> str:
     return escape(uuid)
 
@@ -28,6 +71,29 @@ def sanitize_study_name(name: str) -> str:
     return sanitize_uuid(name)
 
 
+def get_matrix_query() -> Optional[MatrixQuery]:
+    args = request.args
+    keys = ["columns", "start", "end", "from", "to"]
+    if not any(key in args for key in keys):
+        return None
+
+    columns = [
+        column
+        for value in args.getlist("columns")
+        for column in value.split(",")
+    ]
+    try:
+        return MatrixQuery(
+            columns=columns or None,
+            start=int(args["start"]) if "start" in args else None,
+            end=int(args["end"]) if "end" in args else None,
+            date_from=args.get("from"),
+            date_to=args.get("to"),
+        )
+    except ValueError:
+        raise BadRequest("start and end should be integers")
+
+
 def create_study_routes(
     storage_service: StorageService, config: Config
 ) -> Blueprint:
@@ -47,12 +113,64 @@ def create_study_routes(
             description: Successful operation
           '400':
             description: Invalid request
+        parameters:
+          - in: query
+            name: sort
+            required: false
+            description: field to sort studies by, prefixed by - to reverse
+            schema:
+              type: string
+          - in: query
+            name: limit
+            required: false
+            description: maximum number of studies
+            schema:
+              type: integer
+          - in: query
+            name: offset
+            required: false
+            description: number of studies to skip
+            schema:
+              type: integer
+          - in: query
+            name: fields
+            required: false
+            description: study fields to keep, comma separated
+            schema:
+              type: string
         tags:
           - Manage Studies
         """
+        args = request.args
+        sort = args.get("sort")
+        if sort is not None and sort.lstrip("-") not in STUDY_INFO_COLUMNS:
+            raise BadRequest(f"studies can't be sorted by {sort}")
+        fields = None
+        if "fields" in args:
+            fields = [
+                field
+                for value in args.getlist("fields")
+                for field in value.split(",")
+            ]
+            unknown = set(fields) - set(STUDY_INFO_COLUMNS)
+            if unknown:
+                raise BadRequest(f"unknown fields {sorted(unknown)}")
+        try:
+            limit = int(args["limit"]) if "limit" in args else None
+            offset = int(args.get("offset", 0))
+        except ValueError:
+            raise BadRequest("limit and offset should be integers")
+        if (limit is not None and limit < 0) or offset < 0:
+            raise BadRequest("limit and offset should be positive")
+
         params = RequestParameters(user=Auth.get_current_user())
-        available_studies = storage_service.get_studies_information(params)
-        return jsonify(available_studies), HTTPStatus.OK.value
+        available_studies = storage_service.get_studies_information(
+            params, sort, limit, offset, fields
+        )
+        # not jsonify, which would sort studies by id
+        return Response(
+            json.dumps(available_studies), mimetype="application/json"
+        )
 
     @bp.route("/studies", methods=["POST"])
     @auth.protected()
@@ -60,11 +178,13 @@ def create_study_routes(
         """
         Import Study
         ---
+        description: Archive is imported in background, follow its task
+          to know when study is ready
         responses:
-          '200':
+          '202':
             content:
               application/json: {}
-            description: Successful operation
+            description: Import started, url of its task
           '400':
             description: Invalid request
         tags:
@@ -76,13 +196,16 @@ def create_study_routes(
             code = HTTPStatus.BAD_REQUEST.value
             return content, code
 
-        zip_binary = io.BytesIO(request.files["study"].read())
-
         params = RequestParameters(user=Auth.get_current_user())
 
-        uuid = storage_service.import_study(zip_binary, params)
-        content = "/studies/" + uuid
-        code = HTTPStatus.CREATED.value
+        zip_binary = detach_upload(request.files["study"])
+        try:
+            task = storage_service.import_study_async(zip_binary, params)
+        except Exception:
+            zip_binary.close()
+            raise
+        content = "/tasks/" + task.id
+        code = HTTPStatus.ACCEPTED.value
 
         return jsonify(content), code
 
@@ -113,11 +236,72 @@ def create_study_routes(
             schema:
               type: string
             required: true
+          - in: query
+            name: format
+            required: false
+            description: set to matrix to get parsed matrix content as json
+              (or npy binary when Accept is application/octet-stream), to
+              stream to get json sent while read or to ndjson to get one
+              json line per child of requested node
+            schema:
+              type: string
+          - in: query
+            name: columns
+            required: false
+            description: matrix columns to keep, comma separated
+            schema:
+              type: string
+          - in: query
+            name: start
+            required: false
+            description: first matrix row to keep
+            schema:
+              type: integer
+          - in: query
+            name: end
+            required: false
+            description: matrix row where to stop (excluded)
+            schema:
+              type: integer
+          - in: query
+            name: from
+            required: false
+            description: first date to keep (ex 02 JAN or 02 JAN 13:00)
+            schema:
+              type: string
+          - in: query
+            name: to
+            required: false
+            description: last date to keep (included)
+            schema:
+              type: string
         tags:
           - Manage Data inside Study
         """
         parameters = RequestParameters(user=Auth.get_current_user())
+        if request.args.get("format") == "matrix":
+            matrix = storage_service.get_matrix(
+                path, parameters, get_matrix_query()
+            )
+            accept = request.accept_mimetypes.best_match(
+                ["application/json", "application/octet-stream"]
+            )
+            if accept == "application/octet-stream":
+                buffer = io.BytesIO()
+                np.save(buffer, matrix.data)
+                buffer.seek(0)
+                return send_file(buffer, mimetype=accept)
+            return jsonify(matrix.to_json()), 200
+
         depth = request.args.get("depth", 3, type=int)
+        if request.args.get("format") in ["stream", "ndjson"]:
+            lines = request.args["format"] == "ndjson"
+            content = storage_service.get_stream(
+                path, depth, parameters, lines
+            )
+            mimetype = "application/x-ndjson" if lines else "application/json"
+            return Response(content, mimetype=mimetype)
+
         output = storage_service.get(path, depth, parameters)
 
         return jsonify(output), 200
@@ -252,6 +436,13 @@ def create_study_routes(
           description: specify
           schema:
             type: boolean
+        - in: query
+          name: level
+          required: false
+          example: 6
+          description: compression level, from 0 (no compression) to 9
+          schema:
+            type: integer
         tags:
           - Manage Studies
         """
@@ -263,17 +454,22 @@ def create_study_routes(
             "no-output" not in request.args
             or request.args["no-output"] == "false"
         )
+        level = request.args.get("level", str(Exporter.DEFAULT_LEVEL))
+        if level not in {str(i) for i in range(10)}:
+            raise BadRequest("level should be an integer between 0 and 9")
 
         params = RequestParameters(user=Auth.get_current_user())
         content = storage_service.export_study(
-            uuid_sanitized, params, compact, outputs
+            uuid_sanitized, params, compact, outputs, int(level)
         )
 
-        return send_file(
+        filename = f"{uuid_sanitized}{'-compact' if compact else ''}.zip"
+        return Response(
             content,
             mimetype="application/zip",
-            as_attachment=True,
-            attachment_filename=f"{uuid_sanitized}{'-compact' if compact else ''}.zip",
+            headers={
+                "Content-Disposition": f"attachment; filename={filename}"
+            },
         )
 
     @bp.route("/studies/<string:uuid>", methods=["DELETE"])
@@ -379,14 +575,90 @@ def create_study_routes(
             code = HTTPStatus.BAD_REQUEST.value
             return content, code
 
-        zip_binary = io.BytesIO(request.files["output"].read())
-
         params = RequestParameters(user=Auth.get_current_user())
-        content = str(
-            storage_service.import_output(uuid_sanitized, zip_binary, params)
-        )
+        with spool_upload(request.files["output"]) as zip_binary:
+            content = str(
+                storage_service.import_output(
+                    uuid_sanitized, zip_binary, params
+                )
+            )
         code = HTTPStatus.ACCEPTED.value
 
         return jsonify(content), code
 
+    @bp.route(
+        "/studies/<string:uuid>/output/<string:output_id>/statistics",
+        methods=["GET"],
+    )
+    @auth.protected()
+    def get_mc_statistics(uuid: str, output_id: str) -> Any:
+        """
+        Statistics of a column over Monte-Carlo years
+        ---
+        responses:
+          '200':
+            content:
+              application/json: {}
+            description: mean, std, min, max and percentiles per timestep
+          '400':
+            description: Invalid request
+          '404':
+            description: Output, mc-ind results or item not found
+          '422':
+            description: Item is not a matrix or column not found
+        parameters:
+          - in: path
+            name: uuid
+            required: true
+            schema:
+              type: string
+          - in: path
+            name: output_id
+            required: true
+            description: output number
+            schema:
+              type: string
+          - in: query
+            name: item
+            required: true
+            description: values file of a year, ex areas/de/values-hourly
+              or links/de/fr/values-daily
+            schema:
+              type: string
+          - in: query
+            name: column
+            required: true
+            description: column name, ex LOAD
+            schema:
+              type: string
+          - in: query
+            name: percentiles
+            required: false
+            description: comma separated, between 0 and 100
+            schema:
+              type: string
+        tags:
+          - Manage Outputs
+        """
+        item = request.args.get("item")
+        column = request.args.get("column")
+        if not item or not column:
+            raise BadRequest("item and column are required")
+        try:
+            percentiles = [
+                float(q)
+                for q in request.args.get("percentiles", "").split(",")
+                if q.strip()
+            ]
+        except ValueError:
+            raise BadRequest("percentiles should be numbers")
+        if any(not 0 <= q <= 100 for q in percentiles):
+            raise BadRequest("percentiles should be between 0 and 100")
+
+        params = RequestParameters(user=Auth.get_current_user())
+        statistics = storage_service.get_mc_statistics(
+            sanitize_uuid(uuid), output_id, item, column, percentiles, params
+        )
+        return jsonify(statistics), 200
+
     return bp
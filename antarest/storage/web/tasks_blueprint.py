@@ -0,0 +1,47 @@
+from typing import Any
+
+from flask import Blueprint, jsonify
+
+from antarest.common.config import Config
+from antarest.common.requests import RequestParameters
+from antarest.login.auth import Auth
+from antarest.storage.service import StorageService
+
+
+def create_task_routes(
+    storage_service: StorageService, config: Config
+) -> Blueprint:
+    bp = Blueprint("create_task_routes", __name__)
+
+    auth = Auth(config)
+
+    @bp.route("/tasks/<string:id>", methods=["GET"])
+    @auth.protected()
+    def get_task(id: str) -> Any:
+        """
+        Get task progress
+        ---
+        responses:
+          '200':
+            content:
+              application/json: {}
+            description: Task status, current step and progress in percent,
+              with study id once known
+          '403':
+            description: Task of another user
+          '404':
+            description: Task not found
+        parameters:
+          - in: path
+            name: id
+            required: true
+            schema:
+              type: string
+        tags:
+          - Tasks
+        """
+        params = RequestParameters(user=Auth.get_current_user())
+        task = storage_service.get_task(id, params)
+        return jsonify(task.to_dict())
+
+    return bp
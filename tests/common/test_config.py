@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from antarest.common.config import ConfigYaml
+from antarest.common.config import Config, ConfigYaml
 
 
 @pytest.mark.unit_test
@@ -11,11 +11,29 @@ def test_get_yaml(project_path: Path):
     config = ConfigYaml(file=project_path / "tests/common/test.yaml")
 
     assert config["main"] == {
-        "bonjour": ["le", "monde"],
+        "bonjour": ("le", "monde"),
         "hello": "World",
     }
     assert config["main.hello"] == "World"
     assert config["not_existing"] is None
+    assert config["main.hello.not_existing"] is None
+
+
+@pytest.mark.unit_test
+def test_read_only():
+    data = {"main": {"hello": "World", "sub": {"key": 42}}}
+    config = Config(data)
+
+    assert config["main.sub.key"] == 42
+    assert config["main"]["sub"] is config["main.sub"]
+    with pytest.raises(TypeError):
+        config["main"]["hello"] = "antarest"
+    with pytest.raises(TypeError):
+        config["main.sub"]["key"] = 0
+
+    # later changes of source data are not seen
+    data["main"]["hello"] = "antarest"
+    assert config["main.hello"] == "World"
 
 
 @pytest.mark.unit_test
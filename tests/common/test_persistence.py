@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+
+from antarest.common.persistence import Base, upgrade_db
+from antarest.launcher.model import JobResult
+from antarest.login.model import User
+from antarest.storage.model import Metadata, Task
+
+
+@pytest.mark.unit_test
+def test_upgrade_db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    # tables as created by previous version
+    engine.execute("CREATE TABLE metadata (id VARCHAR(36) PRIMARY KEY)")
+    engine.execute("INSERT INTO metadata (id) VALUES ('a')")
+    engine.execute("CREATE TABLE job_result (id VARCHAR(36) PRIMARY KEY)")
+    Base.metadata.create_all(engine)
+
+    upgrade_db(engine)
+    upgrade_db(engine)  # nothing left to do
+
+    for model in (Metadata, JobResult, Task, User):
+        columns = inspect(engine).get_columns(model.__tablename__)
+        assert {c["name"] for c in columns} == {
+            c.name for c in model.__table__.columns
+        }
+    row = engine.execute("SELECT public, info_mtime FROM metadata").first()
+    assert tuple(row) == (None, None)
+
+
+@pytest.mark.unit_test
+def test_upgrade_db_not_nullable(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}")
+    engine.execute("CREATE TABLE task (action VARCHAR(32))")
+    with pytest.raises(ValueError):
+        upgrade_db(engine)
@@ -1,4 +1,6 @@
 import platform
+from pathlib import Path
+from threading import Event
 from time import sleep, time
 from unittest.mock import Mock
 from uuid import uuid4
@@ -6,7 +8,10 @@ from uuid import uuid4
 import pytest
 
 from antarest.common.config import Config
-from antarest.launcher.local_launcher import LocalLauncher
+from antarest.launcher.local_launcher import (
+    LocalLauncher,
+    StudyVersionNotSupported,
+)
 from antarest.launcher.model import JobResult, JobStatus
 
 
@@ -31,3 +36,91 @@ def test_compute():
     )
 
     callback.assert_called_once_with(expected_execution_result)
+
+
+@pytest.mark.unit_test
+def test_run_study_queued():
+    local_launcher = LocalLauncher(
+        Config(
+            {"launcher": {"local": {"binaries": {"700": "echo"}, "slots": 1}}}
+        )
+    )
+    assert local_launcher.scheduler.slots == 1
+
+    results = []
+    done = Event()
+
+    def callback(result: JobResult) -> None:
+        results.append(result)
+        if result.job_status != JobStatus.RUNNING:
+            done.set()
+
+    local_launcher.add_callback(callback)
+
+    uuid = uuid4()
+    assert local_launcher.run_study("Hello, World!", "700", uuid) == uuid
+    assert done.wait(timeout=5)
+
+    assert results == [
+        JobResult(id=str(uuid), job_status=JobStatus.RUNNING),
+        JobResult(
+            id=str(uuid),
+            job_status=JobStatus.SUCCESS,
+            msg="Hello, World!",
+            exit_code=0,
+        ),
+    ]
+
+    with pytest.raises(StudyVersionNotSupported):
+        local_launcher.run_study("Hello, World!", "42", uuid4())
+
+
+@pytest.mark.unit_test
+def test_run_study_failed(tmp_path: Path):
+    solver = tmp_path / "missing-solver"
+    local_launcher = LocalLauncher(
+        Config({"launcher": {"local": {"binaries": {"700": solver}}}})
+    )
+
+    results = []
+    done = Event()
+
+    def callback(result: JobResult) -> None:
+        results.append(result)
+        if result.job_status != JobStatus.RUNNING:
+            done.set()
+
+    local_launcher.add_callback(callback)
+
+    uuid = uuid4()
+    local_launcher.run_study("Hello, World!", "700", uuid)
+    assert done.wait(timeout=5)
+
+    assert [result.job_status for result in results] == [
+        JobStatus.RUNNING,
+        JobStatus.FAILED,
+    ]
+    assert str(solver) in results[1].msg
+
+
+@pytest.mark.unit_test
+def test_log(tmp_path: Path):
+    local_launcher = LocalLauncher(
+        Config({"launcher": {"local": {"logs": tmp_path}}})
+    )
+    local_launcher.MSG_SIZE = 8
+    callback = Mock()
+    local_launcher.add_callback(callback)
+
+    uuid = uuid4()
+    assert local_launcher.get_log(uuid) == b""
+    local_launcher._compute(
+        antares_solver_path="echo", study_path="Hello, World!", uuid=uuid
+    )
+
+    assert (tmp_path / f"{uuid}.log").read_bytes() == b"Hello, World!\n"
+    assert local_launcher.get_log(uuid) == b"Hello, World!\n"
+    assert local_launcher.get_log(uuid, offset=7) == b"World!\n"
+    assert local_launcher.get_log(uuid, offset=14) == b""
+    # only end of output is kept in db
+    assert callback.call_args[0][0].msg == "... World!"
@@ -74,3 +74,19 @@ def test_update_object():
     c = repo.save(a)
     d = repo.save(b)
     assert c != d
+
+
+@pytest.mark.unit_test
+def test_find_by_status():
+    engine = create_engine("sqlite:///:memory:", echo=True)
+    session = scoped_session(
+        sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+    Base.metadata.create_all(engine)
+
+    repo = JobResultRepository(session=session)
+    for status in JobStatus:
+        repo.save(JobResult(id=status.value, job_status=status))
+
+    jobs = repo.find_by_status(JobStatus.PENDING, JobStatus.RUNNING)
+    assert {job.id for job in jobs} == {"pending", "running"}
@@ -0,0 +1,60 @@
+import threading
+from uuid import uuid4
+
+import pytest
+
+from antarest.launcher.scheduler import JobScheduler
+
+
+@pytest.mark.unit_test
+def test_slots_and_order():
+    scheduler = JobScheduler(slots=2)
+    release = threading.Event()
+    started = []
+    finished = threading.Semaphore(0)
+
+    def job(name: str):
+        def run() -> None:
+            started.append(name)
+            release.wait(timeout=5)
+            finished.release()
+
+        return run
+
+    ids = {}
+    for name, priority in [
+        ("a", 0),
+        ("b", 0),
+        ("c", 0),
+        ("d", 5),
+        ("e", 0),
+        ("f", 5),
+    ]:
+        ids[name] = uuid4()
+        scheduler.submit(ids[name], job(name), priority)
+
+    # two slots taken, others wait by priority then submission order
+    assert started == ["a", "b"]
+    assert scheduler.pending() == [ids[n] for n in ["d", "f", "c", "e"]]
+
+    release.set()
+    for _ in range(6):
+        assert finished.acquire(timeout=5)
+    assert started[2:] == ["d", "f", "c", "e"]
+    assert scheduler.pending() == []
+
+
+@pytest.mark.unit_test
+def test_failed_job_frees_slot(caplog):
+    scheduler = JobScheduler(slots=1)
+    done = threading.Event()
+
+    def fail() -> None:
+        raise ValueError()
+
+    failed = uuid4()
+    scheduler.submit(failed, fail)
+    scheduler.submit(uuid4(), done.set)
+
+    assert done.wait(timeout=5)
+    assert f"Job {failed} failed" in caplog.text
@@ -1,3 +1,8 @@
+import os
+import socket
+import subprocess
+import sys
+from subprocess import PIPE
 from pathlib import Path
 from unittest.mock import Mock, patch
 from uuid import uuid4
@@ -6,10 +11,12 @@ import pytest
 
 from antarest.login.auth import Auth
 from antarest.common.config import Config
+from antarest.common.worker import process_start, worker
 from antarest.login.model import User
 from antarest.common.requests import RequestParameters
+from antarest.launcher.local_launcher import StudyVersionNotSupported
 from antarest.launcher.model import JobResult, JobStatus
-from antarest.launcher.service import LauncherService
+from antarest.launcher.service import JobNotFound, LauncherService
 
 
 @pytest.mark.unit_test
@@ -22,17 +29,11 @@ def test_service_run_study(get_current_user_mock):
     }
     storage_service_mock.get_study_path.return_value = Path("path/to/study")
 
-    uuid = uuid4()
     launcher_mock = Mock()
-    launcher_mock.run_study.return_value = uuid
     factory_launcher_mock = Mock()
     factory_launcher_mock.build_launcher.return_value = launcher_mock
 
-    running = JobResult(
-        id=str(uuid), study_id="study_uuid", job_status=JobStatus.RUNNING
-    )
     repository = Mock()
-    repository.save.return_value = running
 
     launcher_service = LauncherService(
         config=Config(),
@@ -44,10 +45,47 @@ def test_service_run_study(get_current_user_mock):
     job_id = launcher_service.run_study(
         "study_uuid",
         RequestParameters(user=User(id=0, name="admin", role="ADMIN")),
+        priority=3,
+    )
+
+    pending = JobResult(
+        id=str(job_id), study_id="study_uuid", job_status=JobStatus.PENDING
+    )
+    repository.save.assert_called_once_with(pending)
+    launcher_mock.run_study.assert_called_once_with(
+        Path("path/to/study"), "42", job_id, 3
+    )
+
+
+@pytest.mark.unit_test
+def test_service_update():
+    factory_launcher_mock = Mock()
+    repository = Mock()
+    storage_service = Mock()
+    launcher_service = LauncherService(
+        config=Config(),
+        storage_service=storage_service,
+        repository=repository,
+        factory_launcher=factory_launcher_mock,
     )
+    factory_launcher_mock.build_launcher.return_value.add_callback.assert_called_once_with(
+        launcher_service.update
+    )
+
+    running = JobResult(id=str(uuid4()), job_status=JobStatus.RUNNING)
+    launcher_service.update(running)
+    assert running.completion_date is None
 
-    assert job_id == uuid
-    repository.save.assert_called_once_with(running)
+    storage_service.refresh_outputs.assert_not_called()
+
+    repository.get.return_value = JobResult(
+        id=running.id, study_id="my-study", job_status=JobStatus.SUCCESS
+    )
+    done = JobResult(id=running.id, job_status=JobStatus.SUCCESS, exit_code=0)
+    launcher_service.update(done)
+    assert done.completion_date is not None
+    assert repository.save.call_count == 2
+    storage_service.refresh_outputs.assert_called_once_with("my-study")
 
 
 @pytest.mark.unit_test
@@ -136,3 +174,103 @@ def test_service_get_jobs_from_database():
     repository.find_by_study.assert_called_once_with(str(study_id))
     assert launcher_service.get_jobs() == fake_execution_result
     repository.get_all.assert_called_once()
+
+
+@pytest.mark.unit_test
+def test_service_run_study_not_supported():
+    storage_service_mock = Mock()
+    storage_service_mock.get_study_information.return_value = {
+        "antares": {"version": "42"}
+    }
+    launcher_mock = Mock()
+    launcher_mock.run_study.side_effect = StudyVersionNotSupported()
+    factory_launcher_mock = Mock()
+    factory_launcher_mock.build_launcher.return_value = launcher_mock
+    repository = Mock()
+
+    launcher_service = LauncherService(
+        config=Config(),
+        storage_service=storage_service_mock,
+        repository=repository,
+        factory_launcher=factory_launcher_mock,
+    )
+
+    with pytest.raises(StudyVersionNotSupported):
+        launcher_service.run_study(
+            "study_uuid", RequestParameters(user=User(id=0))
+        )
+    job = repository.save.call_args[0][0]
+    assert job.job_status == JobStatus.FAILED
+    assert job.completion_date is not None
+    storage_service_mock.refresh_outputs.assert_not_called()
+
+
+@pytest.mark.unit_test
+def test_service_get_log():
+    launcher_mock = Mock()
+    launcher_mock.get_log.return_value = b"log"
+    factory_launcher_mock = Mock()
+    factory_launcher_mock.build_launcher.return_value = launcher_mock
+    repository = Mock()
+
+    launcher_service = LauncherService(
+        config=Config(),
+        storage_service=Mock(),
+        repository=repository,
+        factory_launcher=factory_launcher_mock,
+    )
+
+    job = uuid4()
+    assert launcher_service.get_log(job, 3) == b"log"
+    launcher_mock.get_log.assert_called_once_with(job, 3)
+
+    repository.get.return_value = None
+    with pytest.raises(JobNotFound):
+        launcher_service.get_log(job)
+
+
+@pytest.mark.unit_test
+def test_service_fail_interrupted_jobs():
+    gone = subprocess.Popen([sys.executable, "-c", ""])
+    gone.wait()
+    sibling = subprocess.Popen([sys.executable, "-c", "input()"], stdin=PIPE)
+    host = socket.gethostname()
+    start = process_start(os.getpid())
+    jobs = {
+        "old": None,
+        "host-pid": f"{host}:{os.getpid()}",
+        "own": worker(),
+        "sibling": f"{host}:{sibling.pid}:{process_start(sibling.pid)}:t",
+        "gone": f"{host}:{gone.pid}:{start}:t",
+        "reused-pid": f"{host}:{os.getpid()}:{start}0:t",
+        "remote": f"not-{host}:{os.getpid()}:{start}:t",
+    }
+    repository = Mock()
+    repository.find_by_status.return_value = [
+        JobResult(id=id, job_status=JobStatus.RUNNING, worker=worker)
+        for id, worker in jobs.items()
+    ]
+
+    launcher_service = LauncherService(
+        config=Config(),
+        storage_service=Mock(),
+        repository=repository,
+        factory_launcher=Mock(),
+    )
+    launcher_service.fail_interrupted_jobs()
+
+    repository.find_by_status.assert_called_once_with(
+        JobStatus.PENDING, JobStatus.RUNNING
+    )
+    failed = [call[0][0] for call in repository.save.call_args_list]
+    assert [job.id for job in failed] == [
+        "old",
+        "host-pid",
+        "gone",
+        "reused-pid",
+        "remote",
+    ]
+    assert all(job.job_status == JobStatus.FAILED for job in failed)
+    assert all(job.completion_date for job in failed)
+    launcher_service.storage_service.refresh_outputs.assert_not_called()
+    sibling.communicate(b"\n")
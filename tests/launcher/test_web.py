@@ -38,9 +38,18 @@ def test_run() -> None:
     assert res.status_code == 200
     assert res.json == {"job_id": str(job)}
     service.run_study.assert_called_once_with(
-        study, RequestParameters(User(id=0, name="admin", role="ADMIN"))
+        study, RequestParameters(User(id=0, name="admin", role="ADMIN")), 0
     )
 
+    res = client.post(f"/launcher/run/{study}?priority=5")
+    assert res.status_code == 200
+    service.run_study.assert_called_with(
+        study, RequestParameters(User(id=0, name="admin", role="ADMIN")), 5
+    )
+
+    res = client.post(f"/launcher/run/{study}?priority=high")
+    assert res.status_code == 400
+
 
 @pytest.mark.unit_test
 def test_result() -> None:
@@ -89,3 +98,22 @@ def test_jobs() -> None:
     assert res.status_code == 200
     assert res.json == [result.to_dict()]
     service.get_jobs.assert_has_calls([call(str(study_id)), call(None)])
+
+
+@pytest.mark.unit_test
+def test_log() -> None:
+    job = uuid4()
+    service = Mock()
+    service.get_log.return_value = b"World!\n"
+
+    app = create_app(service)
+    client = app.test_client()
+    res = client.get(f"/launcher/jobs/{job}/logs?offset=7")
+
+    assert res.status_code == 200
+    assert res.data == b"World!\n"
+    assert res.headers["X-Next-Offset"] == "14"
+    service.get_log.assert_called_once_with(job, 7)
+
+    res = client.get(f"/launcher/jobs/{job}/logs?offset=-1")
+    assert res.status_code == 400
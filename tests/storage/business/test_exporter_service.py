@@ -30,7 +30,7 @@ def test_export_file(tmp_path: Path, storage_service_builder):
 
     # Test good study
     assert b"Hello" == exporter_service.export_study(name)
-    exporter.export_file.assert_called_once_with(study_path, True)
+    exporter.export_file.assert_called_once_with(study_path, True, 6)
 
 
 @pytest.mark.unit_test
@@ -68,4 +68,6 @@ def test_export_compact_file(tmp_path: Path, storage_service_builder):
     factory.create_from_config.assert_called_once_with(
         StudyConfig(study_path=study_path)
     )
-    exporter.export_compact.assert_called_once_with(study_path, 42)
+    exporter.export_compact.assert_called_once_with(
+        study_path, study_service, 6
+    )
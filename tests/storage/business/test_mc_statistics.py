@@ -0,0 +1,74 @@
+from pathlib import Path
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+
+from antarest.storage.business.mc_statistics import McStatistics
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    Matrix,
+    MatrixQuery,
+)
+
+
+@pytest.mark.unit_test
+def test_compute(tmp_path: Path) -> None:
+    years = {
+        tmp_path / "00001": [1.0, 10.0, np.nan],
+        tmp_path / "00002": [2.0, 20.0, np.nan],
+        tmp_path / "00003": [3.0, 60.0, np.nan],
+    }
+    for path in years:
+        path.touch()
+
+    def query(path: Path, query: MatrixQuery) -> Matrix:
+        assert query.columns == ["LOAD"]
+        return Matrix(
+            data=np.array(years[path]).reshape(-1, 1),
+            columns=["LOAD"],
+            units=["MWh"],
+            index_names=["index", "day"],
+            index=[["1", "01"], ["2", "01"], ["3", "01"]],
+        )
+
+    reader = Mock()
+    reader.query.side_effect = query
+    statistics = McStatistics(reader)
+
+    result = statistics.compute(list(years), "LOAD", [0, 50, 100])
+
+    assert result["years"] == 3
+    assert result["unit"] == "MWh"
+    assert result["index"] == [["1", "01"], ["2", "01"], ["3", "01"]]
+    assert result["mean"] == [2.0, 30.0, None]
+    assert result["std"] == pytest.approx(
+        [np.std([1, 2, 3]), np.std([10, 20, 60]), None]
+    )
+    assert result["min"] == [1.0, 10.0, None]
+    assert result["max"] == [3.0, 60.0, None]
+    assert result["percentiles"] == {
+        "0": [1.0, 10.0, None],
+        "50": [2.0, 20.0, None],
+        "100": [3.0, 60.0, None],
+    }
+
+    # outputs don't change: years are read once
+    assert statistics.compute(list(years), "LOAD", [0, 50, 100]) == result
+    assert reader.query.call_count == 3
+    statistics.compute(list(years), "LOAD", [90])
+    assert reader.query.call_count == 6
+
+    with pytest.raises(ValueError):
+        statistics.compute(list(years), "LOAD", [101])
+
+
+@pytest.mark.unit_test
+def test_compute_bad_column(tmp_path: Path) -> None:
+    (tmp_path / "00001").touch()
+    reader = Mock()
+    reader.query.return_value = Matrix(
+        data=np.zeros((2, 2)), columns=["A", "A"]
+    )
+
+    with pytest.raises(ValueError, match="not unique"):
+        McStatistics(reader).compute([tmp_path / "00001"], "A", [])
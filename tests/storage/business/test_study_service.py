@@ -199,17 +199,20 @@ def test_copy_study(
     path_study.mkdir()
     path_study_info = path_study / "study.antares"
     path_study_info.touch()
+    (path_study / "input").mkdir()
+    (path_study / "input" / "matrix.txt").write_text("1\t2")
+    (path_study / "settings").mkdir()
+    (path_study / "settings" / "generaldata.ini").write_text("[general]")
+    (path_study / "output").mkdir()
+    (path_study / "output" / "result.txt").touch()
 
     value = {
-        "study": {
-            "antares": {
-                "caption": "ex1",
-                "created": 1480683452,
-                "lastsave": 1602678639,
-                "author": "unknown",
-            },
-            "output": [],
-        }
+        "antares": {
+            "caption": "ex1",
+            "created": 1480683452,
+            "lastsave": 1602678639,
+            "author": "unknown",
+        },
     }
 
     study = Mock()
@@ -218,10 +221,6 @@ def test_copy_study(
 
     config = Mock()
     study_factory.create_from_fs.return_value = config, study
-    study_factory.create_from_config.return_value = study
-
-    url_engine = Mock()
-    url_engine.resolve.return_value = None, None, None
 
     study_service = StudyService(
         path_to_studies=path_studies,
@@ -230,9 +229,20 @@ def test_copy_study(
     )
 
     destination_name = "study2"
-    study_service.copy_study(source_name, destination_name)
-
-    study.get.assert_called_once_with()
+    uuid = study_service.copy_study(source_name, destination_name)
+
+    path_copy = path_studies / uuid
+    study_factory.create_from_fs.assert_called_once_with(path_copy)
+    study.get.assert_called_once_with(["study"])
+    study.save.assert_called_once_with(value, ["study"])
+    assert value["antares"]["caption"] == destination_name
+    assert value["antares"]["created"] > 1602678639
+
+    assert (path_copy / "study.antares").exists()
+    assert (path_copy / "input" / "matrix.txt").read_text() == "1\t2"
+    assert (path_copy / "settings" / "generaldata.ini").exists()
+    assert not (path_copy / "output").exists()
+    assert study_service.is_study_existing(uuid)
 
 
 @pytest.mark.unit_test
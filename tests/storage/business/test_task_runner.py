@@ -0,0 +1,37 @@
+import threading
+
+import pytest
+
+from antarest.storage.business.task_runner import TaskRunner
+
+
+@pytest.mark.unit_test
+def test_submit_in_background():
+    done = threading.Event()
+    threads = []
+
+    def teardown() -> None:
+        threads.append(("teardown", threading.get_ident()))
+        done.set()
+
+    def task(value: int) -> None:
+        threads.append((value, threading.get_ident()))
+        raise ValueError("logged, worker keeps running")
+
+    runner = TaskRunner(workers=1, teardown=teardown)
+    runner.submit(task, 42)
+    assert done.wait(timeout=5)
+
+    (value, worker), (step, teardown_thread) = threads
+    assert (value, step) == (42, "teardown")
+    assert worker == teardown_thread != threading.get_ident()
+
+
+@pytest.mark.unit_test
+def test_submit_inline():
+    calls = []
+    runner = TaskRunner(workers=0, teardown=lambda: calls.append("teardown"))
+
+    runner.submit(calls.append, threading.get_ident())
+
+    assert calls == [threading.get_ident()]
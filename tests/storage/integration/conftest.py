@@ -3,8 +3,11 @@ from unittest.mock import Mock
 from zipfile import ZipFile
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker  # type: ignore
 
 from antarest.common.config import Config
+from antarest.common.persistence import Base
 from antarest.storage.business.exporter_service import ExporterService
 from antarest.storage.business.importer_service import ImporterService
 from antarest.storage.business.study_service import StudyService
@@ -42,13 +45,19 @@ def storage_service(
         {
             "_internal": {"resources_path": path_resources},
             "security": {"disabled": True},
-            "storage": {"studies": path_studies},
+            "storage": {"studies": path_studies, "tasks": {"workers": 0}},
         }
     )
 
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = scoped_session(
+        sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+
     storage_service = build_storage(
         application=Mock(),
-        session=Mock(),
+        session=session,
         config=config,
     )
 
@@ -7,12 +7,22 @@ from unittest.mock import Mock
 
 import pytest
 from flask import Flask
+from flask.testing import FlaskClient
 
 from antarest.common.config import Config
 from antarest.common.custom_types import JSON
 from antarest.login.model import User, Role
 from antarest.storage.main import build_storage
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    MatrixQuery,
+    MatrixReader,
+)
 from antarest.storage.service import StorageService
+from antarest.storage.web.exceptions import (
+    BadMatrixQueryError,
+    IncorrectPathError,
+    MatrixFormatError,
+)
 from antarest.common.requests import (
     RequestParameters,
 )
@@ -460,6 +470,15 @@ def notest_sta_mini_with_wrong_output_folder(
     )
 
 
+def assert_imported(client: FlaskClient, task_url: str) -> None:
+    # tasks run on submit in tests
+    task = json.loads(client.get(task_url).data)
+    assert task["status"] == "success", task["msg"]
+    assert task["progress"] == 100
+    result = client.get(f"/studies/{task['study_id']}/study/antares/caption")
+    assert json.loads(result.data) == "STA-mini"
+
+
 @pytest.mark.integration_test
 def test_sta_mini_import(tmp_path: Path, storage_service) -> None:
 
@@ -490,15 +509,20 @@ def test_sta_mini_import(tmp_path: Path, storage_service) -> None:
     study_data = io.BytesIO(sta_mini_zip_path.read_bytes())
     result = client.post("/studies", data={"study": (study_data, "study.zip")})
 
-    assert result.status_code == HTTPStatus.CREATED.value
+    assert result.status_code == HTTPStatus.ACCEPTED.value
+    assert_imported(client, json.loads(result.data))
 
 
 @pytest.mark.integration_test
 def test_sta_mini_import_compact(tmp_path: Path, storage_service) -> None:
 
     params = RequestParameters(user=ADMIN)
-    zip_study_stream = storage_service.export_study(
-        "STA-mini", compact=True, params=params
+    zip_study_stream = io.BytesIO(
+        b"".join(
+            storage_service.export_study(
+                "STA-mini", compact=True, params=params
+            )
+        )
     )
 
     app = Flask(__name__)
@@ -523,7 +547,8 @@ def test_sta_mini_import_compact(tmp_path: Path, storage_service) -> None:
         "/studies", data={"study": (zip_study_stream, "study.zip")}
     )
 
-    assert result.status_code == HTTPStatus.CREATED.value
+    assert result.status_code == HTTPStatus.ACCEPTED.value
+    assert_imported(client, json.loads(result.data))
 
 
 @pytest.mark.integration_test
@@ -599,3 +624,100 @@ def test_sta_mini_filter(storage_service, url: str, expected_output: dict):
         url=url,
         expected_output=expected_output,
     )
+
+
+@pytest.mark.integration_test
+def test_sta_mini_matrix(tmp_path: Path, storage_service) -> None:
+    storage_service.study_service.matrix_reader = MatrixReader(
+        cache_dir=Path(tmp_path) / "cache"
+    )
+    params = RequestParameters(user=ADMIN)
+
+    matrix = storage_service.get_matrix(
+        "STA-mini/output/1/economy/mc-all/areas/de/id-daily", params
+    )
+    assert matrix.data.shape == (7, 58)
+    assert matrix.columns[:2] == ["OP. COST", "OP. COST"]
+    assert matrix.stats[:2] == ["min", "max"]
+
+    matrix = storage_service.get_matrix(
+        "STA-mini/input/load/series/load_de", params
+    )
+    assert matrix.data.shape[1] == 1
+
+    with pytest.raises(MatrixFormatError):
+        storage_service.get_matrix("STA-mini/settings/generaldata", params)
+    with pytest.raises(MatrixFormatError):
+        storage_service.get_matrix("STA-mini/output/1", params)
+    for query in [
+        MatrixQuery(columns=["UNKNOWN"]),
+        MatrixQuery(date_from="31 FEB"),
+    ]:
+        with pytest.raises(BadMatrixQueryError):
+            storage_service.get_matrix(
+                "STA-mini/output/1/economy/mc-all/areas/de/id-daily",
+                params,
+                query,
+            )
+
+
+@pytest.mark.integration_test
+@pytest.mark.parametrize(
+    "route,depth",
+    [
+        ("STA-mini", -1),
+        ("STA-mini", 2),
+        ("STA-mini", 0),
+        ("STA-mini/input/areas", 3),
+        ("STA-mini/input/bindingconstraints/bindingconstraints", -1),
+        ("STA-mini/settings/generaldata/general", -1),
+        ("STA-mini/output", 2),
+        ("STA-mini/output/*/info", -1),
+        ("STA-mini/output/1/economy/mc-all/areas/de,es/id-daily", -1),
+        ("STA-mini/output/1/economy/mc-all/areas/de/id-daily", -1),
+    ],
+)
+def test_sta_mini_stream(storage_service, route: str, depth: int) -> None:
+    params = RequestParameters(user=ADMIN)
+    expected = storage_service.get(route, depth, params)
+
+    content = b"".join(storage_service.get_stream(route, depth, params))
+    assert json.loads(content) == expected
+
+    lines = b"".join(
+        storage_service.get_stream(route, depth, params, lines=True)
+    )
+    rows = [json.loads(line) for line in lines.decode().splitlines()]
+    if isinstance(expected, dict):
+        assert {k: v for row in rows for k, v in row.items()} == expected
+    else:
+        assert rows == [expected]
+
+
+@pytest.mark.integration_test
+def test_sta_mini_mc_statistics(storage_service) -> None:
+    params = RequestParameters(user=ADMIN)
+    route = "STA-mini/output/1/economy/mc-ind/00001/areas/de/values-hourly"
+    load = storage_service.get_matrix(
+        route, params, MatrixQuery(columns=["LOAD"])
+    )
+
+    result = storage_service.get_mc_statistics(
+        "STA-mini", "1", "areas/de/values-hourly", "LOAD", [50], params
+    )
+
+    # only one year in STA-mini
+    assert result["years"] == 1
+    assert result["mean"] == load.data[:, 0].tolist()
+    assert result["percentiles"]["50"] == result["mean"]
+    assert set(result["std"]) == {0.0}
+    assert result["index"] == load.index
+
+    with pytest.raises(IncorrectPathError):
+        storage_service.get_mc_statistics(
+            "STA-mini", "1", "areas/unknown/values-hourly", "LOAD", [], params
+        )
+    with pytest.raises(BadMatrixQueryError):
+        storage_service.get_mc_statistics(
+            "STA-mini", "1", "areas/de/values-hourly", "UNKNOWN", [], params
+        )
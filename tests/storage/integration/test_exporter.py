@@ -40,6 +40,13 @@ def assert_data(data: bytes):
     assert len(data) > 0 and b"<!DOCTYPE HTML PUBLIC" not in data
 
 
+def empty_session() -> Mock:
+    # no task left by a previous run
+    session = Mock()
+    session.query.return_value.filter.return_value.all.return_value = []
+    return session
+
+
 def test_exporter_file(tmp_path: Path, sta_mini_zip_path: Path):
 
     path_studies = tmp_path / "studies"
@@ -55,7 +62,7 @@ def test_exporter_file(tmp_path: Path, sta_mini_zip_path: Path):
         }
     )
 
-    service = build_storage(Mock(), config, session=Mock())
+    service = build_storage(Mock(), config, session=empty_session())
 
     data = assert_url_content(service, url="/studies/STA-mini/export")
     assert_data(data)
@@ -79,7 +86,7 @@ def test_exporter_file_no_output(tmp_path: Path, sta_mini_zip_path: Path):
         }
     )
 
-    service = build_storage(Mock(), config, Mock())
+    service = build_storage(Mock(), config, empty_session())
 
     data = assert_url_content(
         service, url="/studies/STA-mini/export?no-output"
@@ -1,8 +1,21 @@
+import configparser
+import os
+import tracemalloc
+from io import BytesIO
 from pathlib import Path
 from time import time
 from typing import Callable, Any
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZipFile
 
+from antarest.common.custom_types import JSON
+from antarest.storage.repository.antares_io.exporter.export_file import (
+    Exporter,
+)
+from antarest.storage.repository.antares_io.reader import IniReader
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    MatrixQuery,
+    MatrixReader,
+)
 from antarest.storage.repository.filesystem.factory import StudyFactory
 
 
@@ -43,3 +56,125 @@ def test_performance(tmp_path: Path, project_path: Path):
         lambda: study.save("John Smith", url=["study", "antares", "author"])
     )
     print("BENCHMARK", bench)
+
+
+class LegacyIniParser(configparser.RawConfigParser):
+    def optionxform(self, optionstr: str) -> str:
+        return optionstr
+
+
+def legacy_ini_read(path: Path) -> JSON:
+    """IniReader implementation based on configparser, used as reference"""
+
+    def parse(value: str) -> Any:
+        if value.lower() in ["true", "false"]:
+            return value.lower() == "true"
+        for cast in [int, float]:
+            try:
+                return cast(value)
+            except ValueError:
+                pass
+        return value
+
+    config = LegacyIniParser()
+    config.read(path)
+    return {
+        key: {k: parse(v) for k, v in config[key].items()}
+        for key in config
+        if key != "DEFAULT"
+    }
+
+
+def test_ini_reader_performance(tmp_path: Path, project_path: Path):
+    path_study = extract_sta(tmp_path, project_path)
+    files = [
+        f
+        for f in path_study.glob("**/*")
+        if f.suffix in [".ini", ".dat", ".antares", ".antares-output"]
+    ]
+
+    large = tmp_path / "scenariobuilder.dat"
+    lines = ["[Default Ruleset]"] + [
+        f"t,area{a},{y},cluster{a % 7} = {a % 5}"
+        for a in range(200)
+        for y in range(500)
+    ]
+    large.write_text("\n".join(lines))
+
+    bench = {}
+    for name, paths in [("sta_mini", files), ("large", [large])]:
+        ref, bench[f"{name}_configparser"] = benchmark(
+            lambda: [legacy_ini_read(f) for f in paths]
+        )
+        res, bench[f"{name}_ini_reader"] = benchmark(
+            lambda: [IniReader._read(f) for f in paths]
+        )
+        assert repr(res) == repr(ref)
+
+    print("BENCHMARK", bench)
+
+
+def test_matrix_query_performance(tmp_path: Path):
+    header = "\t".join(f"COL{i}" for i in range(35))
+    lines = [
+        "DE\tarea\tva\thourly",
+        "\tVARIABLES\tBEGIN\tEND",
+        "\t35\t1\t8760",
+        "",
+        f"DE\thourly\t\t\t\t{header}",
+        "\t\t\t\t" + "\t".join(["MWh"] * 35),
+        "\tindex\tday\tmonth\thour" + "\t" * 35,
+    ] + [
+        f"\t{h + 1}\t{h // 24 % 28 + 1:02}\tJAN\t{h % 24:02}:00\t"
+        + "\t".join(str(h * i) for i in range(35))
+        for h in range(8760)
+    ]
+    path = Path(tmp_path) / "values-hourly.txt"
+    path.write_text("\n".join(lines) + "\n")
+
+    reader = MatrixReader()
+    query = MatrixQuery(columns=["COL3", "COL7"], start=4000, end=4168)
+    bench = {}
+    full, bench["read"] = benchmark(lambda: reader.read(path))
+    _, bench["index"] = benchmark(lambda: reader.index(path))
+    part, bench["query"] = benchmark(lambda: reader.query(path, query))
+
+    assert (part.data == full.data[4000:4168, [3, 7]]).all()
+    assert bench["query"] < bench["read"]
+    print("BENCHMARK", bench)
+
+
+def legacy_export_file(path_study: Path) -> BytesIO:
+    """Exporter.export_file implementation zipping in memory"""
+    data = BytesIO()
+    with ZipFile(data, "w", ZIP_DEFLATED) as zipf:
+        for path in path_study.rglob("*"):
+            zipf.write(path, path.relative_to(path_study))
+    data.seek(0)
+    return data
+
+
+def peak_memory(function: Callable) -> int:
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def test_export_memory(tmp_path: Path):
+    root = Path(tmp_path) / "study"
+    (root / "output").mkdir(parents=True)
+    for i in range(4):
+        (root / "output" / f"matrix{i}.txt").write_bytes(os.urandom(8 << 20))
+
+    bench = {}
+    bench["legacy"] = peak_memory(lambda: legacy_export_file(root))
+    bench["stream"] = peak_memory(
+        lambda: sum(len(chunk) for chunk in Exporter().export_file(root))
+    )
+
+    assert bench["stream"] < 8 * Exporter.CHUNK_SIZE
+    assert bench["stream"] * 4 < bench["legacy"]
+    print("BENCHMARK peak memory", bench)
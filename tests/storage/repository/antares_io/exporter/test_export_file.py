@@ -1,12 +1,22 @@
 import json
+import struct
+from io import BytesIO
 from pathlib import Path
-from zipfile import ZipFile
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile
 
 import pytest
 
 from antarest.storage.repository.antares_io.exporter.export_file import (
     Exporter,
 )
+from antarest.storage.repository.antares_io.exporter.zip_writer import (
+    ZipWriter,
+)
+from antarest.storage.repository.filesystem.config.model import StudyConfig
+from antarest.storage.repository.filesystem.folder_node import FolderNode
+from antarest.storage.repository.filesystem.ini_file_node import IniFileNode
+from antarest.storage.repository.filesystem.inode import TREE
+from antarest.storage.repository.filesystem.raw_file_node import RawFileNode
 
 
 @pytest.mark.parametrize("outputs", [True, False])
@@ -20,7 +30,7 @@ def test_export_file(tmp_path: Path, outputs: bool):
     (root / "output/file.txt").write_text("42")
 
     data = Exporter().export_file(root, outputs)
-    zipf = ZipFile(data)
+    zipf = ZipFile(BytesIO(b"".join(data)))
 
     assert "file.txt" in zipf.namelist()
     assert "test/" in zipf.namelist()
@@ -29,25 +39,82 @@ def test_export_file(tmp_path: Path, outputs: bool):
     assert ("output/file.txt" in zipf.namelist()) == outputs
 
 
-def test_export_compact(tmp_path: Path):
+@pytest.mark.parametrize("workers", [1, 2])
+def test_export_file_stream(tmp_path: Path, workers: int):
+    root = tmp_path / "folder"
+    root.mkdir()
+    content = bytes(range(256)) * 4096 * 10
+    (root / "big.txt").write_bytes(content)
+    (root / "small.txt").write_text("42")
+    (root / "icon.ico").write_bytes(content[:8192])
+    (root / "données.ini").write_text("[part]\nkey = value\n" * 100)
+
+    exporter = Exporter(workers=workers)
+    exporter.CHUNK_SIZE = 4096
+    chunks = list(exporter.export_file(root))
+    assert len(chunks) > 10
+
+    zipf = ZipFile(BytesIO(b"".join(chunks)))
+    assert zipf.testzip() is None
+    assert zipf.read("big.txt") == content
+    assert zipf.read("small.txt") == b"42"
+    assert zipf.read("données.ini") == (root / "données.ini").read_bytes()
+    infos = {info.filename: info for info in zipf.infolist()}
+    assert infos["big.txt"].compress_type == ZIP_DEFLATED
+    assert infos["big.txt"].compress_size < len(content) / 10
+    assert infos["small.txt"].compress_type == ZIP_STORED
+    assert infos["icon.ico"].compress_type == ZIP_STORED
+
+    chunks = list(exporter.export_file(root, level=0))
+    zipf = ZipFile(BytesIO(b"".join(chunks)))
+    assert zipf.testzip() is None
+    assert {i.compress_type for i in zipf.infolist()} == {ZIP_STORED}
+
+
+class FolderTest(FolderNode):
+    def build(self, config: StudyConfig) -> TREE:
+        return {"file": RawFileNode(config.next_file("file.txt"))}
+
+
+class StudyTest(FolderNode):
+    def build(self, config: StudyConfig) -> TREE:
+        return {
+            "settings": IniFileNode(config.next_file("settings.ini"), {}),
+            "input": FolderTest(config.next_file("input")),
+            "output": FolderTest(config.next_file("output")),
+        }
+
+
+@pytest.mark.parametrize("chunk_size", [8, Exporter.CHUNK_SIZE])
+def test_export_compact(tmp_path: Path, chunk_size: int):
     root = tmp_path / "folder"
     root.mkdir()
+    (root / "settings.ini").write_text("[general]\nmode = Economy\n")
     (root / "input").mkdir()
     (root / "input/file.txt").write_text("Bonjour")
     (root / "output").mkdir()
     (root / "output/file.txt").write_text("Hello, World")
+    study = StudyTest(StudyConfig(study_path=root))
 
-    data = {
-        "input": {"file": "file/folder/input/file.txt"},
-        "output": {"file": "file/folder/output/file.txt"},
-    }
+    exporter = Exporter()
+    exporter.CHUNK_SIZE = chunk_size
+    buffer = exporter.export_compact(root, study)
+    zipf = ZipFile(BytesIO(b"".join(buffer)))
+    assert zipf.testzip() is None
 
-    buffer = Exporter().export_compact(root, data)
-    zipf = ZipFile(buffer)
+    data_res = json.loads(zipf.read("data.json"))
+    assert data_res["settings"] == {"general": {"mode": "Economy"}}
+    assert zipf.read(f"res/{data_res['input']['file']}") == b"Bonjour"
+    assert zipf.read(f"res/{data_res['output']['file']}") == b"Hello, World"
+    assert len(zipf.namelist()) == 3
+    # data.json size is unknown when its header is written
+    assert zipf.getinfo("data.json").extra[:2] == b"\x01\x00"
 
-    zipf.extract("data.json", str(tmp_path.absolute()))
-    data_res_path = tmp_path / "data.json"
-    data_res = json.loads(data_res_path.read_text())
 
-    assert f"res/{data_res['input']['file']}" in zipf.namelist()
-    assert f"res/{data_res['output']['file']}" in zipf.namelist()
+def test_zip_writer_unknown_size():
+    writer = ZipWriter()
+    writer.begin("data.json", 0, 0o100644, ZIP_STORED, None)
+    writer.data(b"{}")
+    # big streamed entries get a zip64 data descriptor
+    descriptor = writer.end(0, 5 << 32)
+    assert struct.unpack("<2L2Q", descriptor)[2:] == (2, 5 << 32)
@@ -1,5 +1,6 @@
+import configparser
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Any
 
 import pytest
 
@@ -56,3 +57,109 @@ def test_read_sets_init(tmp_path: str, clean_ini_writer) -> None:
     }
 
     assert SetsIniReader().read(path) == exp_data
+
+
+@pytest.mark.unit_test
+def test_read_configparser_syntax(tmp_path: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text(
+        """
+; comment
+[DEFAULT]
+shared = 42
+
+[part1]
+key: value
+date = 2020.12.20 - 14:56
+empty =
+multi = first
+    second
+
+    # comment
+    third
+num = 1_000
+
+[part2]
+shared = 0
+"""
+    )
+
+    assert IniReader().read(path) == {
+        "part1": {
+            "key": "value",
+            "date": "2020.12.20 - 14:56",
+            "empty": "",
+            "multi": "first\nsecond\n\nthird",
+            "num": 1000,
+            "shared": 42,
+        },
+        "part2": {"shared": 0},
+    }
+
+
+@pytest.mark.unit_test
+def test_read_missing_file(tmp_path: str) -> None:
+    assert IniReader().read(Path(tmp_path) / "missing.ini") == {}
+
+
+@pytest.mark.unit_test
+def test_read_bad_syntax(tmp_path: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text("key = value\n")
+    with pytest.raises(configparser.MissingSectionHeaderError):
+        IniReader().read(path)
+
+    path.write_text("[part]\nkey = 1\nkey = 2\n")
+    with pytest.raises(configparser.DuplicateOptionError):
+        IniReader().read(path)
+
+    path.write_text("[part]\nno value\n")
+    with pytest.raises(configparser.ParsingError):
+        IniReader().read(path)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    "text",
+    [
+        "[a]\n[]\n[a]\n",
+        "[a]\n[]\nx = 1\nx = 2\n",
+        "[a]\nbad\n= 1\nother\n",
+        "[a]\nx = 1\nbad\n  continued\n",
+        "key\n[a]\n",
+    ],
+)
+def test_read_same_errors_as_configparser(tmp_path: str, text: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text(text)
+    parser = configparser.RawConfigParser()
+    with pytest.raises(configparser.Error) as expected:
+        with path.open() as file:
+            parser.read_file(file, str(path))
+
+    with pytest.raises(configparser.Error) as error:
+        IniReader._read(path)
+    assert type(error.value) is type(expected.value)
+    assert str(error.value) == str(expected.value)
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("42", 42),
+        ("-3", -3),
+        ("2.5", 2.5),
+        ("1e3", 1000.0),
+        ("inf", float("inf")),
+        ("True", True),
+        ("false", False),
+        ("t", "t"),
+        ("l,fr,0", "l,fr,0"),
+        ("", ""),
+    ],
+)
+def test_parse_value(value: str, expected: Any) -> None:
+    parsed = IniReader.parse_value(value)
+    assert parsed == expected
+    assert type(parsed) == type(expected)
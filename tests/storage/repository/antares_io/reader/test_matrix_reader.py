@@ -0,0 +1,144 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    MatrixQuery,
+    MatrixQueryError,
+    MatrixReader,
+)
+
+OUTPUT = (
+    "DE\tarea\tva\tdaily\n"
+    "\tVARIABLES\tBEGIN\tEND\n"
+    "\t2\t1\t2\n"
+    "\n"
+    "DE\tdaily\t\t\tOV. COST\tLOLP\n"
+    "\t\t\t\tEuro\t%\n"
+    "\tindex\tday\tmonth\tEXP\tEXP\n"
+    "\t1\t01\tJAN\t10\tN/A\n"
+    "\t2\t02\tJAN\t12.5\t0\n"
+)
+
+
+@pytest.mark.unit_test
+def test_read_input(tmp_path: Path) -> None:
+    path = tmp_path / "load_de.txt"
+    path.write_text("1\t2\n3\t4.5\n")
+    matrix = MatrixReader().read(path)
+    assert matrix.data.tolist() == [[1, 2], [3, 4.5]]
+    assert matrix.columns == []
+
+    path.write_text("")
+    assert MatrixReader().read(path).data.shape == (0, 0)
+
+    path.write_text("1\t2\n3\n")
+    with pytest.raises(ValueError):
+        MatrixReader().read(path)
+
+
+@pytest.mark.unit_test
+def test_read_output(tmp_path: Path) -> None:
+    path = tmp_path / "values-daily.txt"
+    path.write_text(OUTPUT)
+    matrix = MatrixReader().read(path)
+
+    assert matrix.columns == ["OV. COST", "LOLP"]
+    assert matrix.units == ["Euro", "%"]
+    assert matrix.stats == ["EXP", "EXP"]
+    assert matrix.index_names == ["index", "day", "month"]
+    assert matrix.index == [["1", "01", "JAN"], ["2", "02", "JAN"]]
+    assert matrix.to_json()["data"] == [[10, None], [12.5, 0]]
+
+    # truncated row, even when cells would fill whole rows
+    path.write_text(OUTPUT.replace("\t10\tN/A\n", "\n") + "\t3\t03\n")
+    with pytest.raises(ValueError):
+        MatrixReader().read(path)
+
+
+@pytest.mark.unit_test
+def test_cache(tmp_path: Path) -> None:
+    path = tmp_path / "values-daily.txt"
+    path.write_text(OUTPUT)
+    cache = tmp_path / "cache"
+    reader = MatrixReader(cache_dir=cache)
+
+    matrix = reader.read(path)
+    assert len(list(cache.glob("*.npy"))) == 1
+    cached = reader.read(path)
+    assert isinstance(cached.data, np.memmap)
+    assert cached.to_json() == matrix.to_json()
+
+    path.write_text("1\t2\n")
+    os.utime(path, ns=(0, 0))
+    assert reader.read(path).data.tolist() == [[1, 2]]
+    assert len(list(cache.glob("*.npy"))) == 1
+
+
+@pytest.mark.unit_test
+def test_query_output(tmp_path: Path) -> None:
+    path = tmp_path / "values-daily.txt"
+    path.write_text(OUTPUT + "\t3\t03\tJAN\t14\t1\n\n")
+    reader = MatrixReader()
+
+    matrix = reader.query(path, MatrixQuery(columns=["LOLP"], start=1))
+    assert matrix.data.tolist() == [[0], [1]]
+    assert matrix.columns == ["LOLP"]
+    assert matrix.units == ["%"]
+    assert matrix.index == [["2", "02", "JAN"], ["3", "03", "JAN"]]
+
+    matrix = reader.query(
+        path, MatrixQuery(date_from="02 JAN", date_to="02 JAN")
+    )
+    assert matrix.to_json()["data"] == [[12.5, 0]]
+    assert reader.query(path, MatrixQuery(start=5)).data.shape == (0, 2)
+
+    with pytest.raises(MatrixQueryError):
+        reader.query(path, MatrixQuery(columns=["LOAD"]))
+    with pytest.raises(MatrixQueryError):
+        reader.query(path, MatrixQuery(date_from="01 FEB"))
+    with pytest.raises(MatrixQueryError):
+        reader.query(path, MatrixQuery(date_from="02 JA"))
+
+    path.write_text(OUTPUT + "\t3\t03\tJAN\t14\n")
+    with pytest.raises(ValueError):
+        reader.query(path, MatrixQuery(columns=["LOLP"]))
+
+
+@pytest.mark.unit_test
+def test_query_input(tmp_path: Path) -> None:
+    path = tmp_path / "load_de.txt"
+    path.write_text("1\t2\n3\t4\n5\t6\n")
+    reader = MatrixReader()
+
+    assert reader.query(path, MatrixQuery()).data.tolist() == [
+        [1, 2],
+        [3, 4],
+        [5, 6],
+    ]
+    matrix = reader.query(path, MatrixQuery(columns=["1"], start=1, end=2))
+    assert matrix.data.tolist() == [[4]]
+
+    path.write_text("7\t8\n")
+    assert reader.query(path, MatrixQuery()).data.tolist() == [[7, 8]]
+
+    path.write_text("7\t8\n9\n")
+    with pytest.raises(ValueError):
+        reader.query(path, MatrixQuery(columns=["1"]))
+
+
+@pytest.mark.unit_test
+def test_index_cache_size(tmp_path: Path, monkeypatch) -> None:
+    reader = MatrixReader()
+    paths = [tmp_path / f"values-{i}.txt" for i in range(3)]
+    for path in paths:
+        path.write_text(OUTPUT)
+    size = reader.index(paths[0]).nbytes
+    monkeypatch.setattr(MatrixReader, "INDEX_CACHE_BYTES", 2 * size)
+
+    for path in paths:
+        reader.index(path)
+    assert list(reader._indexes) == paths[1:]
+    assert reader._indexes_size == 2 * size
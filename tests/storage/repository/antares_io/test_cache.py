@@ -0,0 +1,77 @@
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+from antarest.storage.repository.antares_io.cache import IniCache
+
+
+def write(path: Path, content: str, mtime: int = 1_000_000_000) -> None:
+    path.write_text(content)
+    os.utime(path, (mtime, mtime))
+
+
+@pytest.mark.unit_test
+def test_get(tmp_path: Path) -> None:
+    path = tmp_path / "test.ini"
+    write(path, "[section]\nkey = 42\n")
+    load = Mock(return_value={"section": {"key": 42}})
+
+    cache = IniCache()
+    assert cache.get("ini", path, load) == {"section": {"key": 42}}
+    res = cache.get("ini", path, load)
+    assert res == {"section": {"key": 42}}
+    load.assert_called_once_with(path)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # returned content is a copy
+    res["section"]["key"] = 0
+    assert cache.get("ini", path, load) == {"section": {"key": 42}}
+
+    # other kind of reader or file modified
+    cache.get("sets", path, load)
+    write(path, "[section]\nkey = 43\n", mtime=1_000_000_001)
+    cache.get("sets", path, load)
+    assert load.call_count == 3
+
+
+@pytest.mark.unit_test
+def test_missing_file(tmp_path: Path) -> None:
+    cache = IniCache()
+    load = Mock(return_value={})
+    cache.get("ini", tmp_path / "missing.ini", load)
+    cache.get("ini", tmp_path / "missing.ini", load)
+    assert load.call_count == 2
+
+
+@pytest.mark.unit_test
+def test_lru_budget(tmp_path: Path) -> None:
+    paths = [tmp_path / f"{i}.ini" for i in range(3)]
+    for path in paths:
+        write(path, "0123456789")
+
+    cache = IniCache(max_size=25)
+    load = Mock(return_value={})
+    cache.get("ini", paths[0], load)
+    cache.get("ini", paths[1], load)
+    cache.get("ini", paths[0], load)
+    cache.get("ini", paths[2], load)  # evict paths[1]
+    assert cache.size == 20
+    assert load.call_count == 3
+
+    cache.get("ini", paths[0], load)
+    cache.get("ini", paths[1], load)
+    assert load.call_count == 4
+
+
+@pytest.mark.unit_test
+def test_put(tmp_path: Path) -> None:
+    path = tmp_path / "test.ini"
+    write(path, "[section]\nkey = 42\n")
+    load = Mock()
+
+    cache = IniCache()
+    cache.put("ini", path, {"section": {"key": 42}})
+    assert cache.get("ini", path, load) == {"section": {"key": 42}}
+    load.assert_not_called()
@@ -0,0 +1,87 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from antarest.storage.repository.antares_io import walker
+from antarest.storage.repository.antares_io.walker import (
+    LISTING,
+    ListingCache,
+    scan,
+    walk,
+)
+
+
+@pytest.mark.unit_test
+def test_walk(tmp_path: Path):
+    (tmp_path / "a" / "b").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "file.txt").touch()
+    (tmp_path / "a" / "file.txt").touch()
+    (tmp_path / "a" / ".hidden").touch()
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "config").touch()
+    (tmp_path / "root.txt").touch()
+
+    cwd = os.getcwd()
+    with patch("os.chdir") as chdir:
+        entries = list(walk(tmp_path))
+        chdir.assert_not_called()
+    assert os.getcwd() == cwd
+
+    assert {(e.name, e.is_dir) for e in entries} == {
+        ("a", True),
+        ("a/b", True),
+        ("a/b/file.txt", False),
+        ("a/file.txt", False),
+        ("root.txt", False),
+    }
+    names = [e.name for e in entries]
+    assert names.index("a") < names.index("a/b") < names.index("a/b/file.txt")
+    for entry in entries:
+        assert Path(entry.path) == tmp_path / entry.name
+
+
+@pytest.mark.unit_test
+def test_walk_with_cache(tmp_path: Path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "file.txt").touch()
+    for path in (tmp_path, tmp_path / "a"):
+        os.utime(path, ns=(0, 0))
+    cache = ListingCache()
+
+    assert [e.name for e in walk(tmp_path, cache)] == ["a", "a/file.txt"]
+    assert [e.name for e in walk(tmp_path, cache)] == ["a", "a/file.txt"]
+    assert (cache.hits, cache.misses) == (2, 2)
+
+    (tmp_path / "a" / "new.txt").touch()
+    assert sorted(e.name for e in walk(tmp_path, cache)) == [
+        "a",
+        "a/file.txt",
+        "a/new.txt",
+    ]
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+@pytest.mark.unit_test
+def test_walk_cache_skips_recent(tmp_path: Path):
+    # coarse mtime: directory modified in the tick it is scanned in
+    tick = int((time.time() + 1) * 1e9)
+    (tmp_path / "file.txt").touch()
+    os.utime(tmp_path, ns=(tick, tick))
+    cache = ListingCache()
+
+    def scan_then_create(directory: str) -> LISTING:
+        listing = scan(directory)
+        (tmp_path / "new.txt").touch()
+        os.utime(tmp_path, ns=(tick, tick))
+        return listing
+
+    with patch(f"{walker.__name__}.scan", side_effect=scan_then_create):
+        assert [e.name for e in walk(tmp_path, cache)] == ["file.txt"]
+    assert sorted(e.name for e in walk(tmp_path, cache)) == [
+        "file.txt",
+        "new.txt",
+    ]
+    assert (cache.hits, cache.misses) == (0, 2)
@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from antarest.storage.repository.antares_io.writer.atomic import atomic_write
+from antarest.storage.repository.antares_io.writer.clone import (
+    COPY,
+    HARDLINK,
+    REFLINK,
+    TreeCloner,
+)
+
+
+def create_tree(root: Path) -> None:
+    (root / "input" / "series").mkdir(parents=True)
+    (root / "input" / "series" / "load.txt").write_text("1\t2\n3\t4\n")
+    (root / "input" / "load.ini").write_text("[load]\n")
+    (root / "output" / "20201014-1422eco").mkdir(parents=True)
+    (root / "output" / "20201014-1422eco" / "values.txt").touch()
+    (root / "study.antares").write_text("[antares]\n")
+
+
+def test_clone(tmp_path: Path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    create_tree(src)
+
+    counts = TreeCloner(workers=2).clone(src, dst, exclude={"output"})
+
+    assert sum(counts.values()) == 3
+    assert counts[HARDLINK] == 0
+    assert not (dst / "output").exists()
+    assert (dst / "study.antares").read_text() == "[antares]\n"
+    assert (dst / "input" / "load.ini").read_text() == "[load]\n"
+    matrix = dst / "input" / "series" / "load.txt"
+    assert matrix.read_text() == "1\t2\n3\t4\n"
+
+
+def test_clone_without_reflink(tmp_path: Path):
+    src = tmp_path / "src"
+    dst = tmp_path / "dst"
+    create_tree(src)
+    source_matrix = src / "input" / "series" / "load.txt"
+
+    with patch(
+        "antarest.storage.repository.antares_io.writer.clone.reflink",
+        return_value=False,
+    ):
+        counts = TreeCloner(workers=2).clone(
+            src,
+            dst,
+            exclude={"output"},
+            can_link=lambda path: path.suffix == ".txt",
+        )
+
+    assert counts == {REFLINK: 0, HARDLINK: 1, COPY: 2}
+    matrix = dst / "input" / "series" / "load.txt"
+    assert os.path.samefile(str(matrix), str(source_matrix))
+
+    # replacing a linked matrix leaves source untouched
+    with atomic_write(matrix) as file:
+        file.write("0")
+    assert matrix.read_text() == "0"
+    assert source_matrix.read_text() == "1\t2\n3\t4\n"
@@ -3,6 +3,7 @@ from typing import Callable
 
 import pytest
 
+from antarest.storage.repository.antares_io.reader import IniReader
 from antarest.storage.repository.antares_io.writer.ini_writer import IniWriter
 
 
@@ -34,3 +35,73 @@ def test_write(tmp_path: str, ini_cleaner: Callable) -> None:
     writer.write(json_data, path)
 
     assert ini_cleaner(ini_content) == ini_cleaner(path.read_text())
+
+
+@pytest.mark.unit_test
+def test_write_update_cache(tmp_path: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text("[part]\nkey = 0\n")
+    assert IniReader().read(path) == {"part": {"key": 0}}
+
+    IniWriter().write({"part": {"key": "42", "other": True}}, path)
+    assert IniReader().read(path) == {"part": {"key": 42, "other": True}}
+    assert IniReader._read(path) == {"part": {"key": 42, "other": True}}
+
+    # cached values are the ones parsed back from file
+    data = {"part": {"key": "  x ", "multi": "a\n  b"}}
+    IniWriter().write(data, path)
+    assert IniReader().read(path) == IniReader._read(path)
+    IniWriter().update(data, path, "part", "key")
+    assert IniReader().read(path) == IniReader._read(path)
+    IniWriter().update(data, path, "part")
+    assert IniReader().read(path) == IniReader._read(path)
+    assert IniReader().read(path)["part"]["key"] == "x"
+
+
+@pytest.mark.unit_test
+def test_update(tmp_path: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text(
+        "; comment\n"
+        "[part]\n"
+        "key_int=1\n"
+        "multi = a\n"
+        "    b\n"
+        "\n"
+        "[other]\n"
+        "key : x\n"
+    )
+    writer = IniWriter()
+
+    data = IniReader().read(path)
+    data["part"]["multi"] = 3
+    writer.update(data, path, "part", "multi")
+    data["part"]["new"] = "y"
+    writer.update(data, path, "part", "new")
+    data["other"] = {"key": "z"}
+    writer.update(data, path, "other")
+    data["last"] = {"a": True}
+    writer.update(data, path, "last")
+
+    assert path.read_text() == (
+        "; comment\n"
+        "[part]\n"
+        "key_int=1\n"
+        "multi = 3\n"
+        "new = y\n"
+        "\n"
+        "[other]\n"
+        "key = z\n"
+        "\n"
+        "[last]\n"
+        "a = True\n"
+        "\n"
+    )
+    expected = {
+        "part": {"key_int": 1, "multi": 3, "new": "y"},
+        "other": {"key": "z"},
+        "last": {"a": True},
+    }
+    assert IniReader().read(path) == expected
+    assert IniReader._read(path) == expected
+    assert [p.name for p in Path(tmp_path).iterdir()] == ["test.ini"]
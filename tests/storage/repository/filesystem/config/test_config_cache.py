@@ -0,0 +1,81 @@
+import os
+from pathlib import Path
+
+from antarest.storage.repository.filesystem.config.cache import (
+    StudyConfigCache,
+)
+from antarest.storage.repository.filesystem.config.files import (
+    ConfigPathBuilder,
+)
+from tests.storage.repository.filesystem.config.test_config_files import (
+    build_empty_files,
+)
+
+
+def age_files(path: Path) -> None:
+    for file in [path, *path.glob("**/*")]:
+        os.utime(file, (1_000_000_000, 1_000_000_000))
+
+
+def test_cache_hit(tmp_path: Path) -> None:
+    study_path = build_empty_files(tmp_path)
+    (study_path / "settings/generaldata.ini").touch()
+    age_files(study_path)
+
+    cache = StudyConfigCache()
+    config = cache.get(study_path)
+    assert config == ConfigPathBuilder.build(study_path)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    assert cache.get(study_path) is config
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_invalidation(tmp_path: Path) -> None:
+    study_path = build_empty_files(tmp_path)
+    (study_path / "settings/generaldata.ini").touch()
+    age_files(study_path)
+
+    cache = StudyConfigCache()
+    assert cache.get(study_path).bindings == []
+
+    content = """
+    [bindA]
+    id = bindA
+    """
+    (
+        study_path / "input/bindingconstraints/bindingconstraints.ini"
+    ).write_text(content)
+
+    assert cache.get(study_path).bindings == ["bindA"]
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    age_files(study_path)
+    cache.get(study_path)
+    cache.invalidate(study_path)
+    cache.get(study_path)
+    assert (cache.hits, cache.misses) == (0, 4)
+
+
+def test_cache_new_output(tmp_path: Path) -> None:
+    study_path = build_empty_files(tmp_path)
+    (study_path / "settings/generaldata.ini").touch()
+    (study_path / "output").mkdir()
+    age_files(study_path)
+
+    cache = StudyConfigCache()
+    assert cache.get(study_path).outputs == {}
+
+    output_path = study_path / "output/20201220-1456eco-hello/"
+    (output_path / "about-the-study").mkdir(parents=True)
+    content = """
+    [general]
+    nbyears = 1
+    year-by-year = true
+
+    [output]
+    synthesis = true
+    """
+    (output_path / "about-the-study/parameters.ini").write_text(content)
+
+    assert 1 in cache.get(study_path).outputs
@@ -1,7 +1,11 @@
+import os
+import shutil
 from pathlib import Path
 
 from antarest.storage.repository.filesystem.config.files import (
+    OUTPUT_REGISTRY,
     ConfigPathBuilder,
+    OutputRegistry,
 )
 from antarest.storage.repository.filesystem.config.model import (
     StudyConfig,
@@ -164,3 +168,75 @@ def test_parse_links(tmp_path: Path) -> None:
 
     link = Link(filters_synthesis=["annual"], filters_year=["hourly"])
     assert ConfigPathBuilder._parse_links(study_path, "fr") == {"l1": link}
+
+
+def write_output(study_path: Path, name: str, integrity: bool = True) -> None:
+    output_path = study_path / "output" / name
+    (output_path / "about-the-study").mkdir(parents=True)
+    (output_path / "about-the-study/parameters.ini").write_text(
+        "[general]\nnbyears = 1\nyear-by-year = true\n"
+        "[output]\nsynthesis = true\n"
+    )
+    if integrity:
+        (output_path / "checkIntegrity.txt").touch()
+
+
+def test_output_registry(tmp_path: Path, monkeypatch) -> None:
+    study_path = build_empty_files(tmp_path)
+    write_output(study_path, "20201220-1456eco-a")
+    write_output(study_path, "20201221-1456adq-b", integrity=False)
+    (study_path / "output/logs").mkdir()
+    os.utime(study_path / "output", (1_000_000_000, 1_000_000_000))
+
+    parsed = []
+    parse_simulation = ConfigPathBuilder.parse_simulation
+    monkeypatch.setattr(
+        ConfigPathBuilder,
+        "parse_simulation",
+        lambda path: parsed.append(path.name) or parse_simulation(path),
+    )
+
+    outputs = OutputRegistry(study_path).load()
+    assert [(i, o.name, o.error) for i, o in outputs.items()] == [
+        (1, "a", False),
+        (2, "b", True),
+    ]
+    assert (study_path / OUTPUT_REGISTRY).exists()
+    assert len(parsed) == 2
+
+    # output folder unchanged: read from registry
+    assert OutputRegistry(study_path).load() == outputs
+    assert len(parsed) == 2
+
+    # new output: only it is parsed, ids follow folder order
+    write_output(study_path, "20201219-1456eco-c")
+    outputs = OutputRegistry(study_path).load()
+    assert [(i, o.name) for i, o in outputs.items()] == [
+        (1, "c"),
+        (2, "a"),
+        (3, "b"),
+    ]
+    assert parsed[2:] == ["20201219-1456eco-c"]
+
+    # output completed in place
+    (study_path / "output/20201221-1456adq-b/checkIntegrity.txt").touch()
+    OutputRegistry(study_path).update("20201221-1456adq-b")
+    assert not OutputRegistry(study_path).load()[3].error
+
+    # refresh only parses outputs whose files changed
+    count = len(parsed)
+    (study_path / "output/20201220-1456eco-a/checkIntegrity.txt").unlink()
+    OutputRegistry(study_path).refresh()
+    assert parsed[count:] == ["20201220-1456eco-a"]
+    assert OutputRegistry(study_path).load()[2].error
+    OutputRegistry(study_path).refresh()
+    assert len(parsed) == count + 1
+
+    shutil.rmtree(study_path / "output/20201219-1456eco-c")
+    OutputRegistry(study_path).remove("20201219-1456eco-c")
+    outputs = OutputRegistry(study_path).load()
+    assert [(i, o.name) for i, o in outputs.items()] == [(1, "a"), (2, "b")]
+
+    # registry is only a cache
+    (study_path / OUTPUT_REGISTRY).write_text("not json")
+    assert OutputRegistry(study_path).load() == outputs
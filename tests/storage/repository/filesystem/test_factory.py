@@ -0,0 +1,24 @@
+from pathlib import Path
+
+import pytest
+
+from antarest.storage.repository.filesystem.factory import StudyFactory
+from tests.storage.repository.filesystem.utils import extract_sta
+
+
+@pytest.mark.unit_test
+def test_study_tree_shared(tmp_path: Path, project_path: Path) -> None:
+    path = extract_sta(project_path, tmp_path)
+    factory = StudyFactory()
+
+    config, study = factory.create_from_fs(path)
+    config.outputs = dict()
+    assert study.get(["study", "antares", "caption"]) == "STA-mini"
+
+    config_bis, study_bis = factory.create_from_fs(path)
+    assert study_bis is study
+    assert config_bis.outputs != dict()
+
+    factory.invalidate(path)
+    _, study_ter = factory.create_from_fs(path)
+    assert study_ter is not study
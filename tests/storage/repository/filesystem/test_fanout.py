@@ -0,0 +1,61 @@
+import threading
+import time
+
+import pytest
+
+from antarest.storage.repository.filesystem.fanout import FanOut
+
+
+def test_map_keeps_order():
+    fanout = FanOut(workers=4)
+    items = list(range(20))
+
+    def slow(i: int) -> int:
+        time.sleep(0.001 * (20 - i))
+        return i * 2
+
+    assert fanout.map(slow, items) == [i * 2 for i in items]
+
+
+def test_map_in_parallel():
+    fanout = FanOut(workers=4)
+    barrier = threading.Barrier(4, timeout=5)
+
+    # would time out if tasks were run one after the other
+    assert (
+        fanout.map(lambda i: barrier.wait() >= 0, list(range(4))) == [True] * 4
+    )
+
+
+def test_nested_map_runs_serially():
+    fanout = FanOut(workers=2)
+    threads = set()
+
+    def inner(i: int) -> int:
+        threads.add(threading.get_ident())
+        return i
+
+    def outer(i: int) -> list:
+        return fanout.map(inner, [i, i + 1])
+
+    assert fanout.map(outer, [0, 10, 20]) == [[0, 1], [10, 11], [20, 21]]
+    assert threading.get_ident() not in threads
+
+
+def test_errors_and_serial_mode():
+    fanout = FanOut(workers=2)
+
+    def fail(i: int) -> int:
+        if i == 1:
+            raise KeyError(i)
+        return i
+
+    with pytest.raises(KeyError):
+        fanout.map(fail, [0, 1, 2])
+
+    fanout.resize(1)
+    current = threading.get_ident()
+    assert fanout.map(lambda _: threading.get_ident(), [0, 1]) == [
+        current,
+        current,
+    ]
@@ -94,3 +94,16 @@ def test_filter():
 
     assert tree.get(["input,output", "value"]) == expected_json
     assert tree.get(["*", "value"]) == expected_json
+
+
+@pytest.mark.unit_test
+def test_build_once():
+    tree = build_tree()
+    tree.build = Mock(wraps=tree.build)
+
+    tree.get(["input"])
+    tree.get(["output"])
+    tree.save(105, ["output"])
+    tree.check_errors(data={"input": 42})
+
+    tree.build.assert_called_once()
@@ -118,3 +118,24 @@ key_float = 3.14
     node.save(data)
     node.save(3.14, url=["part1", "key_float"])
     assert exp == path.read_text()
+
+
+@pytest.mark.unit_test
+def test_save_key_keep_layout(tmp_path: str) -> None:
+    path = Path(tmp_path) / "test.ini"
+    path.write_text("[part1]\n# comment\nkey_int=1\nkey_str = value1\n")
+
+    node = IniFileNode(
+        StudyConfig(path, areas=dict(), outputs=dict()), types={}
+    )
+    node.save(2, url=["part1", "key_int"])
+    node.save({"key": "value"}, url=["part2"])
+
+    assert path.read_text() == (
+        "[part1]\n# comment\nkey_int = 2\nkey_str = value1\n"
+        "[part2]\nkey = value\n\n"
+    )
+    assert node.get() == {
+        "part1": {"key_int": 2, "key_str": "value1"},
+        "part2": {"key": "value"},
+    }
@@ -0,0 +1,73 @@
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import List
+from unittest.mock import patch
+
+from antarest.storage.repository.filesystem.registry import StudyRegistry
+
+
+def create(path: Path) -> None:
+    path.mkdir()
+    (path / "study.antares").touch()
+
+
+def test_registry(tmp_path: Path):
+    create(tmp_path / "b")
+    create(tmp_path / "a")
+    (tmp_path / "empty").mkdir()
+    registry = StudyRegistry(tmp_path)
+
+    assert registry.uuids() == ["a", "b"]
+    assert registry.contains("a")
+    assert not registry.contains("empty")
+    assert not registry.contains("..")
+
+    # folder filled after being scanned
+    (tmp_path / "empty" / "study.antares").touch()
+    assert registry.uuids() == ["a", "b", "empty"]
+
+    # changes made outside service are seen with directory mtime
+    shutil.rmtree(tmp_path / "a")
+    create(tmp_path / "c")
+    os.utime(tmp_path, ns=(0, 1))
+    assert registry.uuids() == ["b", "c", "empty"]
+
+    shutil.rmtree(tmp_path / "b")
+    registry.remove("b")
+    create(tmp_path / "d")
+    registry.add("d")
+    assert not registry.contains("b")
+    assert registry.contains("d")
+
+
+def test_registry_scan_only_on_change(tmp_path: Path):
+    create(tmp_path / "a")
+    os.utime(tmp_path, ns=(0, 0))
+    registry = StudyRegistry(tmp_path)
+    assert registry.contains("a")
+
+    with patch("os.listdir") as listdir:
+        assert registry.contains("a")
+        assert registry.uuids() == ["a"]
+        listdir.assert_not_called()
+
+
+def test_registry_scan_again_if_recent(tmp_path: Path):
+    # coarse mtime: directory modified in the tick it is listed in
+    tick = int((time.time() + 1) * 1e9)
+    create(tmp_path / "a")
+    os.utime(tmp_path, ns=(tick, tick))
+    registry = StudyRegistry(tmp_path)
+    listdir = os.listdir
+
+    def listdir_then_create(path: str) -> List[str]:
+        names = listdir(path)
+        create(tmp_path / "b")
+        os.utime(tmp_path, ns=(tick, tick))
+        return names
+
+    with patch("os.listdir", side_effect=listdir_then_create):
+        assert registry.uuids() == ["a"]
+    assert registry.uuids() == ["a", "b"]
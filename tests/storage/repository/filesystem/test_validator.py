@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pytest
+
+from antarest.storage.repository.filesystem.factory import StudyFactory
+from antarest.storage.repository.filesystem.validator import (
+    IniValidator,
+    check_tree,
+)
+from tests.storage.repository.filesystem.utils import extract_sta
+
+
+@pytest.mark.unit_test
+def test_validate():
+    section = {"a": int, "b": str}
+    validator = IniValidator(
+        "Node", {"one": section, "two": section, "three": {}}
+    )
+    assert len({id(params) for _, params in validator.sections}) == 2
+
+    assert (
+        validator.validate(
+            {
+                "one": {"a": 1, "b": ""},
+                "two": {"a": 2, "b": "", "c": 3},
+                "three": {},
+            }
+        )
+        == []
+    )
+    assert validator.validate({"one": {"a": "1"}, "three": {"x": 1}}) == [
+        "param a of section one in Node bad type",
+        "param b of section one not in Node",
+        "section two not in Node",
+    ]
+
+    with pytest.raises(ValueError, match="param a of section one"):
+        validator.validate({"one": {"a": "1"}}, raising=True)
+
+
+@pytest.mark.unit_test
+def test_check_tree(project_path: Path, tmp_path: Path):
+    path = extract_sta(project_path, tmp_path)
+    _, study = StudyFactory().create_from_fs(path)
+
+    expected = study.check_errors(study.get())
+    assert expected
+    assert check_tree(study) == expected
+
+    (path / "settings/generaldata.ini").write_text("[general]\nmode = 1\n")
+    _, study = StudyFactory().create_from_fs(path)
+    assert check_tree(study) == study.check_errors(study.get())
+    with pytest.raises(ValueError):
+        check_tree(study, raising=True)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import scoped_session, sessionmaker  # type: ignore
 
 from antarest.common.persistence import Base
@@ -44,3 +44,66 @@ def test_cyclelife():
 
     repo.delete(a.id)
     assert repo.get(a.id) is None
+
+
+def test_get_access():
+    engine = create_engine("sqlite:///:memory:")
+    sess = scoped_session(
+        sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+    Base.metadata.create_all(engine)
+
+    bob = User(id=1, name="bob", role=Role.USER)
+    alice = User(id=2, name="alice", role=Role.USER)
+    repo = StudyMetadataRepository(session=sess)
+    repo.save(Metadata(id="a", users=[bob]))
+    repo.save(Metadata(id="b", users=[alice]))
+    repo.save(Metadata(id="c", users=[bob, alice]))
+    repo.save(Metadata(id="d", users=[]))
+
+    assert repo.get_access(bob.id) == {
+        "a": True,
+        "b": False,
+        "c": True,
+        "d": False,
+    }
+    assert repo.get_access(alice.id) == {
+        "a": False,
+        "b": True,
+        "c": True,
+        "d": False,
+    }
+
+
+def test_get_all_many_ids(monkeypatch):
+    engine = create_engine("sqlite:///:memory:")
+    sess = scoped_session(
+        sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    )
+    Base.metadata.create_all(engine)
+    repo = StudyMetadataRepository(session=sess)
+
+    ids = [f"{i:02d}" for i in range(50)]
+    sess.add_all(Metadata(id=id, name=str(-int(id) % 7)) for id in ids)
+    sess.commit()
+
+    # bound parameters stay under SQLite limit whatever ids count
+    monkeypatch.setattr(StudyMetadataRepository, "CHUNK_SIZE", 10)
+    bound = []
+    event.listen(
+        engine,
+        "before_cursor_execute",
+        lambda conn, cursor, statement, params, context, many: bound.append(
+            len(params)
+        ),
+    )
+
+    wanted = ids[1:] + ["unknown"]
+    rows = repo.get_all("name", ids=wanted)
+    assert len(rows) == 49
+    assert [md.id for md in rows[:3]] == ["07", "14", "21"]
+    assert max(bound) <= 10
+
+    rows = repo.get_all("name", descending=True, ids=wanted, offset=1, limit=2)
+    assert [(md.name, md.id) for md in rows] == [("6", "08"), ("6", "15")]
+    assert repo.get_all(ids=wanted, offset=48) == [repo.get("49")]
@@ -1,15 +1,30 @@
+import io
 from datetime import datetime
+from typing import List
 from unittest.mock import Mock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker  # type: ignore
 
+from antarest.common.persistence import Base
+from antarest.common.worker import worker
 from antarest.login.model import User, Role
 from antarest.common.requests import (
     RequestParameters,
 )
-from antarest.storage.model import Metadata, StudyContentStatus
+from antarest.storage.business.task_runner import TaskRunner
+from antarest.storage.model import (
+    Metadata,
+    StudyContentStatus,
+    Task,
+    TaskStatus,
+)
+from antarest.storage.repository.metadata import StudyMetadataRepository
+from antarest.storage.repository.task import TaskRepository
 from antarest.storage.service import StorageService, UserHasNotPermissionError
+from antarest.storage.web.exceptions import BadZipBinary, TaskNotFoundError
 
 
 def test_get_studies_uuid():
@@ -18,14 +33,13 @@ def test_get_studies_uuid():
 
     # Mock
     repository = Mock()
-    repository.get.side_effect = [
-        Metadata(id="A", users=[bob]),
-        Metadata(id="B", users=[alice]),
-        Metadata(id="C", users=[bob]),
-    ]
+    repository.get_access.side_effect = lambda id: {
+        bob.id: {"A": True, "B": False, "C": True},
+        alice.id: {"A": False, "B": True, "C": False},
+    }[id]
 
     study_service = Mock()
-    study_service.get_study_uuids.return_value = ["A", "B", "C"]
+    study_service.get_study_uuids.return_value = ["A", "B", "C", "D"]
 
     service = StorageService(
         study_service=study_service,
@@ -34,9 +48,19 @@ def test_get_studies_uuid():
         repository=repository,
     )
 
-    studies = service._get_study_uuids(RequestParameters(user=bob))
+    params = RequestParameters(user=bob)
+    studies = service._get_study_uuids(params)
 
+    # D is not in db yet: it will be registered without owner
     assert ["A", "C"] == studies
+    alice_params = RequestParameters(user=alice)
+    assert ["B"] == service._get_study_uuids(alice_params)
+
+    # later checks of same request reuse permissions
+    service._check_user_permission(params, "A")
+    with pytest.raises(UserHasNotPermissionError):
+        service._check_user_permission(params, "B")
+    repository.get.assert_not_called()
 
 
 def test_save_metadata():
@@ -97,8 +121,251 @@ def test_check_user_permission():
 
     repository.get.return_value = Metadata(id=uuid, users=[])
     with pytest.raises(UserHasNotPermissionError):
-        service._check_user_permission(user, uuid)
-    assert not service._check_user_permission(user, uuid, raising=False)
+        service._check_user_permission(RequestParameters(user=user), uuid)
+    assert not service._check_user_permission(
+        RequestParameters(user=user), uuid, raising=False
+    )
 
     repository.get.return_value = Metadata(id=uuid, users=[user])
-    assert service._check_user_permission(user, uuid)
+    params = RequestParameters(user=user)
+    assert service._check_user_permission(params, uuid)
+    assert service._check_user_permission(params, uuid)
+    assert repository.get.call_count == 3
+
+
+def test_get_studies_information():
+    admin = User(id=0, name="admin", role=Role.ADMIN)
+    bob = User(id=1, name="bob", role=Role.USER)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    repository = StudyMetadataRepository(
+        session=scoped_session(sessionmaker(bind=engine))
+    )
+
+    def metadata(id: str, name: str, users: List[User]) -> Metadata:
+        return Metadata(
+            id=id,
+            name=name,
+            version="700",
+            author="John",
+            created_at=datetime.fromtimestamp(1234),
+            updated_at=datetime.fromtimestamp(9876),
+            info_mtime=1.0,
+            users=users,
+        )
+
+    repository.save(metadata("A", "b", [bob]))
+    repository.save(metadata("B", "c", []))
+    repository.save(metadata("C", "old", []))
+
+    study_service = Mock()
+    study_service.get_study_uuids.return_value = ["A", "B", "C", "D"]
+    study_service.get_study_info_mtime.side_effect = lambda uuid: {
+        "C": 2.0
+    }.get(uuid, 1.0)
+    study_service.get_study_information.side_effect = lambda uuid: {
+        "antares": {
+            "caption": {"C": "d", "D": "a"}[uuid],
+            "version": 710,
+            "author": "Jane",
+            "created": 1234,
+            "lastsave": 9876,
+        }
+    }
+
+    service = StorageService(
+        study_service=study_service,
+        importer_service=Mock(),
+        exporter_service=Mock(),
+        repository=repository,
+    )
+
+    studies = service.get_studies_information(
+        RequestParameters(user=admin), fields=["caption", "version"]
+    )
+    assert studies == {
+        "A": {"antares": {"caption": "b", "version": 700}},
+        "B": {"antares": {"caption": "c", "version": 700}},
+        "C": {"antares": {"caption": "d", "version": 710}},
+        "D": {"antares": {"caption": "a", "version": 710}},
+    }
+    # D is registered, C is modified since last read
+    assert study_service.get_study_information.call_count == 2
+    assert repository.get_ids() == {"A", "B", "C", "D"}
+
+    studies = service.get_studies_information(
+        RequestParameters(user=admin), sort="-caption", limit=2, offset=1
+    )
+    assert list(studies) == ["B", "A"]
+    assert studies["A"]["antares"] == {
+        "author": "John",
+        "caption": "b",
+        "created": 1234,
+        "lastsave": 9876,
+        "version": 700,
+    }
+    assert study_service.get_study_information.call_count == 2
+
+    # ids break ties in both directions
+    for sort in ["author", "-author"]:
+        studies = service.get_studies_information(
+            RequestParameters(user=admin), sort=sort, limit=3
+        )
+        expected = ["C", "D", "A"] if sort == "author" else ["A", "B", "C"]
+        assert list(studies) == expected
+
+    # registered studies have no owner, only admins see them
+    studies = service.get_studies_information(RequestParameters(user=bob))
+    assert list(studies) == ["A"]
+
+
+def test_create_study_owned_before_files():
+    bob = User(id=1, name="bob", role=Role.USER)
+    alice = User(id=2, name="alice", role=Role.USER)
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    repository = StudyMetadataRepository(
+        session=scoped_session(sessionmaker(bind=engine))
+    )
+
+    study_service = Mock()
+    study_service.get_study_info_mtime.return_value = 1.0
+    study_service.get_study_information.return_value = {
+        "antares": {
+            "caption": "study",
+            "version": 700,
+            "author": "bob",
+            "created": 1234,
+            "lastsave": 9876,
+        }
+    }
+    service = StorageService(
+        study_service=study_service,
+        importer_service=Mock(),
+        exporter_service=Mock(),
+        repository=repository,
+    )
+
+    # listing run by alice while files of bob's study are written
+    listed = {}
+
+    def create_study(name: str, uuid: str) -> str:
+        assert repository.get(uuid).users == [bob]
+        study_service.get_study_uuids.return_value = [uuid]
+        listed.update(
+            service.get_studies_information(RequestParameters(user=alice))
+        )
+        return uuid
+
+    study_service.create_study.side_effect = create_study
+    uuid = service.create_study("study", RequestParameters(user=bob))
+    assert listed == {}
+    md = repository.get(uuid)
+    assert (md.name, md.users, md.public) == ("study", [bob], False)
+
+    # row registered without owner is given to its owner
+    repository.save(Metadata(id="found", users=[], public=True))
+    service._save_metadata("found", bob)
+    md = repository.get("found")
+    assert (md.name, md.users, md.public) == ("study", [bob], False)
+
+    study_service.create_study.side_effect = ValueError()
+    with pytest.raises(ValueError):
+        service.create_study("study", RequestParameters(user=bob))
+    assert repository.get_ids() == {uuid, "found"}
+
+
+def test_fail_interrupted_tasks():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    task_repository = TaskRepository(
+        session=scoped_session(sessionmaker(bind=engine))
+    )
+    tasks = {
+        "old": (TaskStatus.RUNNING, None),
+        "gone": (TaskStatus.PENDING, "host:1:start:token"),
+        "own": (TaskStatus.RUNNING, worker()),
+        "done": (TaskStatus.SUCCESS, "host:1:start:token"),
+    }
+    for id, (status, process) in tasks.items():
+        task_repository.save(Task(id=id, status=status, worker=process))
+
+    service = StorageService(
+        study_service=Mock(),
+        importer_service=Mock(),
+        exporter_service=Mock(),
+        repository=Mock(),
+        task_repository=task_repository,
+    )
+    service.fail_interrupted_tasks()
+
+    failed = task_repository.find_by_status(TaskStatus.FAILED)
+    assert sorted(task.id for task in failed) == ["gone", "old"]
+    assert all(task.completion_date for task in failed)
+    assert task_repository.get("own").status == TaskStatus.RUNNING
+    assert task_repository.get("done").status == TaskStatus.SUCCESS
+
+
+def test_import_study_async():
+    user = User(id=1, name="user", role=Role.USER)
+    tasks = dict()
+
+    def save(task: Task) -> Task:
+        tasks[task.id] = task
+        return task
+
+    task_repository = Mock()
+    task_repository.save.side_effect = save
+    task_repository.get.side_effect = tasks.get
+
+    study_service = Mock()
+    study_service.check_errors.return_value = []
+    study_service.get_study_information.return_value = {
+        "antares": {
+            "caption": "CAPTION",
+            "version": "VERSION",
+            "author": "AUTHOR",
+            "created": 1234,
+            "lastsave": 9876,
+        }
+    }
+    importer_service = Mock()
+    importer_service.import_study.side_effect = lambda stream, uuid: uuid
+    stream = io.BytesIO()
+    repository = Mock()
+
+    service = StorageService(
+        study_service=study_service,
+        importer_service=importer_service,
+        exporter_service=Mock(),
+        repository=repository,
+        task_repository=task_repository,
+        task_runner=TaskRunner(workers=0),
+    )
+
+    params = RequestParameters(user=user)
+    task = service.import_study_async(stream, params)
+    assert service.get_task(task.id, params) is task
+    assert task.status == TaskStatus.SUCCESS
+    assert task.worker == worker()
+    uuid = importer_service.import_study.call_args[0][1]
+    assert (task.step, task.progress, task.study_id) == ("done", 100, uuid)
+    assert task.completion_date is not None
+    assert stream.closed
+
+    importer_service.import_study.side_effect = BadZipBinary("not a zip")
+    task = service.import_study_async(io.BytesIO(), params)
+    assert task.status == TaskStatus.FAILED
+    assert "not a zip" in task.msg
+    assert task.step == "extract"
+    repository.delete.assert_called_once()
+
+    other = RequestParameters(user=User(id=2, role=Role.USER))
+    with pytest.raises(UserHasNotPermissionError):
+        service.get_task(task.id, other)
+    admin = RequestParameters(user=User(id=3, role=Role.ADMIN))
+    assert service.get_task(task.id, admin) is task
+    with pytest.raises(TaskNotFoundError):
+        service.get_task("unknown", admin)
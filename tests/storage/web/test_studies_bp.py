@@ -6,6 +6,7 @@ from io import BytesIO
 from pathlib import Path
 from unittest.mock import Mock, call
 
+import numpy as np
 import pytest
 from flask import Flask
 from markupsafe import Markup
@@ -13,6 +14,11 @@ from markupsafe import Markup
 from antarest.common.config import Config
 from antarest.login.model import User, Role
 from antarest.storage.main import build_storage
+from antarest.storage.model import Task
+from antarest.storage.repository.antares_io.reader.matrix_reader import (
+    Matrix,
+    MatrixQuery,
+)
 from antarest.storage.web.exceptions import (
     IncorrectPathError,
     UrlNotMatchJsonDataError,
@@ -145,6 +151,99 @@ def test_matrix(tmp_path: str, storage_service_builder) -> None:
     assert result_wrong.status_code == 404
 
 
+@pytest.mark.unit_test
+def test_get_stream() -> None:
+    mock_service = Mock()
+    mock_service.get_stream.side_effect = lambda *args: iter(
+        [b'{"a": ', b"1}"]
+    )
+
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=mock_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    client = app.test_client()
+
+    res = client.get("/studies/study1/settings?format=stream&depth=-1")
+    assert res.status_code == HTTPStatus.OK.value
+    assert res.is_streamed
+    assert res.mimetype == "application/json"
+    assert json.loads(res.data) == {"a": 1}
+    mock_service.get_stream.assert_called_once_with(
+        "study1/settings", -1, PARAMS, False
+    )
+
+    res = client.get("/studies/study1/settings?format=ndjson")
+    assert res.mimetype == "application/x-ndjson"
+    mock_service.get_stream.assert_called_with(
+        "study1/settings", 3, PARAMS, True
+    )
+
+
+@pytest.mark.unit_test
+def test_get_matrix() -> None:
+    mock_storage_service = Mock()
+    mock_storage_service.get_matrix.return_value = Matrix(
+        data=np.array([[1.0, np.nan]]), columns=["A", "B"]
+    )
+
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=mock_storage_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    client = app.test_client()
+    result = client.get("/studies/study1/input/load/series/de?format=matrix")
+
+    assert result.status_code == 200
+    assert json.loads(result.data)["data"] == [[1.0, None]]
+    assert json.loads(result.data)["columns"] == ["A", "B"]
+    mock_storage_service.get_matrix.assert_called_once_with(
+        "study1/input/load/series/de", PARAMS, None
+    )
+
+    result = client.get(
+        "/studies/study1/input/load/series/de?format=matrix",
+        headers={"Accept": "application/octet-stream"},
+    )
+    data = np.load(BytesIO(result.data))
+    assert data.shape == (1, 2)
+    assert data[0, 0] == 1.0
+
+    client.get(
+        "/studies/study1/output/1/values-hourly?format=matrix"
+        "&columns=LOAD,MRG. PRICE&columns=H. ROR&start=2&from=02 JAN"
+    )
+    mock_storage_service.get_matrix.assert_called_with(
+        "study1/output/1/values-hourly",
+        PARAMS,
+        MatrixQuery(
+            columns=["LOAD", "MRG. PRICE", "H. ROR"],
+            start=2,
+            date_from="02 JAN",
+        ),
+    )
+    result = client.get("/studies/study1/values-hourly?format=matrix&end=a")
+    assert result.status_code == 400
+
+
 @pytest.mark.unit_test
 def test_create_study(
     tmp_path: str, storage_service_builder, project_path
@@ -196,8 +295,14 @@ def test_import_study_zipped(
     shutil.make_archive(path_study, "zip", path_study)
     path_zip = tmp_path / "study1.zip"
 
+    uploaded = []
+
+    def import_study_async(stream, params):
+        uploaded.append(stream)
+        return Task(id="my-task")
+
     mock_storage_service = Mock()
-    mock_storage_service.import_study.return_value = study_name
+    mock_storage_service.import_study_async.side_effect = import_study_async
 
     app = Flask(__name__)
     build_storage(
@@ -221,10 +326,92 @@ def test_import_study_zipped(
     study_data = io.BytesIO(path_zip.read_bytes())
     result = client.post("/studies", data={"study": (study_data, "study.zip")})
 
-    print(result.data)
-    assert json.loads(result.data) == "/studies/" + study_name
-    assert result.status_code == HTTPStatus.CREATED.value
-    mock_storage_service.import_study.assert_called_once()
+    assert json.loads(result.data) == "/tasks/my-task"
+    assert result.status_code == HTTPStatus.ACCEPTED.value
+    mock_storage_service.import_study_async.assert_called_once()
+
+    # upload outlives request, for the background import
+    (stream,) = uploaded
+    assert stream.read() == path_zip.read_bytes()
+    stream.close()
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("size", [10, 1024 * 1024])
+def test_import_spooled_on_disk(size: int) -> None:
+    uploaded = []
+
+    def import_output(uuid, stream, params):
+        uploaded.append((stream.fileno(), stream.read()))
+        return "output"
+
+    mock_storage_service = Mock()
+    mock_storage_service.import_output.side_effect = import_output
+
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=mock_storage_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    client = app.test_client()
+
+    content = b"a" * size
+    result = client.post(
+        "/studies/my-uuid/output",
+        data={"output": (BytesIO(content), "output.zip")},
+    )
+
+    assert result.status_code == HTTPStatus.ACCEPTED.value
+    assert uploaded[0][0] >= 0
+    assert uploaded[0][1] == content
+
+
+@pytest.mark.unit_test
+@pytest.mark.parametrize("size", [10, 1024 * 1024])
+def test_import_study_detached(size: int) -> None:
+    uploaded = []
+
+    def import_study_async(stream, params):
+        uploaded.append(stream)
+        return Task(id="my-task")
+
+    mock_storage_service = Mock()
+    mock_storage_service.import_study_async.side_effect = import_study_async
+
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=mock_storage_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    client = app.test_client()
+
+    content = b"a" * size
+    result = client.post(
+        "/studies", data={"study": (BytesIO(content), "study.zip")}
+    )
+    assert result.status_code == HTTPStatus.ACCEPTED.value
+
+    # request is over, upload is still readable by background import
+    (stream,) = uploaded
+    assert stream.fileno() >= 0
+    assert stream.read() == content
+    stream.close()
 
 
 @pytest.mark.unit_test
@@ -285,6 +472,21 @@ def test_list_studies(tmp_path: str, storage_service_builder) -> None:
     result = client.get("/studies")
 
     assert json.loads(result.data) == studies
+    storage_service.get_studies_information.assert_called_with(
+        PARAMS, None, None, 0, None
+    )
+
+    result = client.get(
+        "/studies?sort=-caption&limit=2&offset=1&fields=caption,author"
+    )
+    assert result.status_code == HTTPStatus.OK.value
+    storage_service.get_studies_information.assert_called_with(
+        PARAMS, "-caption", 2, 1, ["caption", "author"]
+    )
+
+    for query in ["sort=name", "fields=users", "limit=a", "offset=-1"]:
+        result = client.get(f"/studies?{query}")
+        assert result.status_code == HTTPStatus.BAD_REQUEST.value
 
 
 @pytest.mark.unit_test
@@ -331,7 +533,7 @@ def test_export_files() -> None:
 
     assert result.data == b"Hello"
     mock_storage_service.export_study.assert_called_once_with(
-        "name", PARAMS, False, True
+        "name", PARAMS, False, True, 6
     )
 
 
@@ -363,15 +565,19 @@ def test_export_params() -> None:
     client.get("/studies/name/export?compact=true&no-output=true")
     client.get("/studies/name/export?compact=false&no-output=false")
     client.get("/studies/name/export?no-output=false")
+    client.get("/studies/name/export?level=0")
     mock_storage_service.export_study.assert_has_calls(
         [
-            call(Markup("name"), PARAMS, True, True),
-            call(Markup("name"), PARAMS, True, False),
-            call(Markup("name"), PARAMS, True, False),
-            call(Markup("name"), PARAMS, False, True),
-            call(Markup("name"), PARAMS, False, True),
+            call(Markup("name"), PARAMS, True, True, 6),
+            call(Markup("name"), PARAMS, True, False, 6),
+            call(Markup("name"), PARAMS, True, False, 6),
+            call(Markup("name"), PARAMS, False, True, 6),
+            call(Markup("name"), PARAMS, False, True, 6),
+            call(Markup("name"), PARAMS, False, True, 0),
         ]
     )
+    assert client.get("/studies/name/export?level=10").status_code == 400
+    assert client.get("/studies/name/export?level=²").status_code == 400
 
 
 @pytest.mark.unit_test
@@ -514,3 +720,43 @@ def test_edit_study_fail() -> None:
     assert res.status_code == 400
 
     mock_storage_service.edit_study.assert_not_called()
+
+
+@pytest.mark.unit_test
+def test_get_mc_statistics() -> None:
+    mock_storage_service = Mock()
+    mock_storage_service.get_mc_statistics.return_value = {"mean": [1.0]}
+
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=mock_storage_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    client = app.test_client()
+
+    result = client.get(
+        "/studies/my-uuid/output/2/statistics"
+        "?item=areas/de/values-hourly&column=LOAD&percentiles=10,90"
+    )
+
+    assert result.status_code == HTTPStatus.OK.value
+    assert json.loads(result.data) == {"mean": [1.0]}
+    mock_storage_service.get_mc_statistics.assert_called_once_with(
+        "my-uuid", "2", "areas/de/values-hourly", "LOAD", [10.0, 90.0], PARAMS
+    )
+
+    result = client.get("/studies/my-uuid/output/2/statistics?column=LOAD")
+    assert result.status_code == HTTPStatus.BAD_REQUEST.value
+    result = client.get(
+        "/studies/my-uuid/output/2/statistics"
+        "?item=areas/de/values-hourly&column=LOAD&percentiles=200"
+    )
+    assert result.status_code == HTTPStatus.BAD_REQUEST.value
@@ -0,0 +1,69 @@
+import json
+from http import HTTPStatus
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from flask import Flask
+
+from antarest.common.config import Config
+from antarest.common.requests import RequestParameters
+from antarest.login.model import User, Role
+from antarest.storage.main import build_storage
+from antarest.storage.model import Task, TaskStatus
+from antarest.storage.web.exceptions import TaskNotFoundError
+
+ADMIN = User(id=0, name="admin", role=Role.ADMIN)
+PARAMS = RequestParameters(user=ADMIN)
+
+
+def create_app(storage_service: Mock) -> Flask:
+    app = Flask(__name__)
+    build_storage(
+        app,
+        storage_service=storage_service,
+        session=Mock(),
+        config=Config(
+            {
+                "_internal": {"resources_path": Path()},
+                "security": {"disabled": True},
+                "storage": {"studies": Path()},
+            }
+        ),
+    )
+    return app
+
+
+@pytest.mark.unit_test
+def test_get_task() -> None:
+    task = Task(
+        id="my-task",
+        action="import",
+        status=TaskStatus.RUNNING,
+        step="validate",
+        progress=60,
+        study_id="my-study",
+    )
+    storage_service = Mock()
+    storage_service.get_task.return_value = task
+    client = create_app(storage_service).test_client()
+
+    result = client.get("/tasks/my-task")
+
+    assert result.status_code == HTTPStatus.OK.value
+    data = json.loads(result.data)
+    assert data["status"] == "running"
+    assert (data["step"], data["progress"]) == ("validate", 60)
+    assert data["study_id"] == "my-study"
+    storage_service.get_task.assert_called_once_with("my-task", PARAMS)
+
+
+@pytest.mark.unit_test
+def test_get_task_not_found() -> None:
+    storage_service = Mock()
+    storage_service.get_task.side_effect = TaskNotFoundError("not found")
+    client = create_app(storage_service).test_client()
+
+    result = client.get("/tasks/unknown")
+
+    assert result.status_code == HTTPStatus.NOT_FOUND.value